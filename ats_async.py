@@ -0,0 +1,107 @@
+# ats_async.py
+# ----------------------------------
+# asyncio fetch engine for JSON ATS APIs
+# ----------------------------------
+
+import asyncio
+import os
+from urllib.parse import urlparse
+
+try:
+    import aiohttp
+except ImportError:  # optional dependency
+    aiohttp = None
+
+ASYNC_ATS_PER_HOST = int(os.getenv("ASYNC_ATS_PER_HOST", "8"))
+ASYNC_ATS_MAX_CONNECTIONS = int(os.getenv("ASYNC_ATS_MAX_CONNECTIONS", "64"))
+ASYNC_ATS_TIMEOUT = int(os.getenv("ASYNC_ATS_TIMEOUT", "15"))
+
+# ATS families whose listing is a single JSON API call. Each has a
+# JobScraper._<ats>_api_request(slug) and _parse_<ats>_jobs(name, slug, data).
+ASYNC_ATS_FAMILIES = ("greenhouse", "lever", "ashby", "smartrecruiters", "workable")
+
+
+def async_engine_available() -> bool:
+    return aiohttp is not None
+
+
+class AsyncATSEngine:
+    """Runs the JSON ATS adapters as coroutines on one event loop.
+
+    Results are the same job dicts JobScraper.add consumes. A company maps
+    to None when its API call fails or needs the sync adapter's fallback
+    (e.g. Lever HTML), so the caller can route it through the normal path.
+    """
+
+    def __init__(self, scraper, per_host=ASYNC_ATS_PER_HOST,
+                 max_connections=ASYNC_ATS_MAX_CONNECTIONS, timeout=ASYNC_ATS_TIMEOUT):
+        self.scraper = scraper
+        self.per_host = per_host
+        self.max_connections = max_connections
+        self.timeout = timeout
+        self._host_semaphores = {}
+
+    def run(self, companies):
+        """Scrape registry companies; returns a list aligned with `companies`."""
+        if aiohttp is None:
+            raise RuntimeError("aiohttp is not installed")
+        return asyncio.run(self._run(companies))
+
+    async def _run(self, companies):
+        self._host_semaphores = {}
+        connector = aiohttp.TCPConnector(limit=self.max_connections, ttl_dns_cache=300)
+        timeout = aiohttp.ClientTimeout(total=self.timeout)
+        async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+            return await asyncio.gather(*(self._scrape(session, c) for c in companies))
+
+    def _semaphore(self, host):
+        if host not in self._host_semaphores:
+            self._host_semaphores[host] = asyncio.Semaphore(self.per_host)
+        return self._host_semaphores[host]
+
+    async def _fetch_json(self, session, url, headers):
+        """Returns (status, data, response_headers); status 0 on network errors."""
+        host = urlparse(url).netloc
+        async with self._semaphore(host):
+            # Same per-host token buckets as the sync HttpClient.
+            delay = self.scraper.http.limiter.reserve(host)
+            if delay > 0:
+                await asyncio.sleep(delay)
+            try:
+                async with session.get(url, headers=headers) as resp:
+                    if resp.status != 200:
+                        return resp.status, None, resp.headers
+                    return 200, await resp.json(content_type=None), resp.headers
+            except Exception:
+                return 0, None, {}
+
+    async def _scrape(self, session, company):
+        name = company.get("name", "Unknown")
+        ats = (company.get("ats") or "").lower()
+        slug = company.get("slug", "")
+        if ats not in ASYNC_ATS_FAMILIES or not slug:
+            return None
+
+        url, headers = getattr(self.scraper, f"_{ats}_api_request")(slug)
+        validators = self.scraper.http_cache.validators(url)
+        status, data, resp_headers = await self._fetch_json(session, url, {**headers, **validators})
+        jobs = None
+        if status == 304:
+            cached = self.scraper._replay_cached_board(url)
+            if cached is not None:
+                jobs = cached[0]
+            else:
+                status, data, resp_headers = await self._fetch_json(session, url, headers)
+
+        if jobs is None:
+            if status != 200 or data is None:
+                return None
+            try:
+                jobs = getattr(self.scraper, f"_parse_{ats}_jobs")(name, slug, data)
+            except Exception:
+                return None
+            self.scraper._remember_board(url, resp_headers, jobs, data)
+
+        if ats == "lever" and not jobs:
+            return None
+        return jobs
@@ -0,0 +1,76 @@
+# ats_descriptions.py
+# ----------------------------------
+# Job description text straight from ATS API payloads
+# ----------------------------------
+
+import html
+from urllib.parse import urlparse
+from html_parsing import parse_html
+
+
+def html_to_text(markup) -> str:
+    """Readable text from an HTML fragment (block boundaries kept as newlines)."""
+    if not markup or not isinstance(markup, str):
+        return ""
+    if "<" not in markup:
+        return markup.strip()
+    return parse_html(markup).get_text("\n", strip=True)
+
+
+def _join(parts) -> str:
+    return "\n".join(p for p in parts if p).strip()
+
+
+def greenhouse_description(job: dict) -> str:
+    """boards-api jobs?content=true: `content` is entity-escaped HTML."""
+    return html_to_text(html.unescape(job.get("content") or ""))
+
+
+def lever_description(job: dict) -> str:
+    """Lever postings: descriptionPlain + each lists[] section + additionalPlain."""
+    parts = [job.get("descriptionPlain") or html_to_text(job.get("description"))]
+    for section in job.get("lists") or []:
+        if isinstance(section, dict):
+            parts.append(section.get("text", ""))
+            parts.append(html_to_text(section.get("content")))
+    parts.append(job.get("additionalPlain") or html_to_text(job.get("additional")))
+    return _join(parts)
+
+
+def ashby_description(job: dict) -> str:
+    return (job.get("descriptionPlain") or "").strip() or html_to_text(job.get("descriptionHtml"))
+
+
+# SmartRecruiters and Workable listings carry no description; their detail
+# APIs do. The URL rides along on the job and is only called when
+# requirements actually have to be fetched (instead of the HTML page).
+
+def smartrecruiters_detail_url(slug, job_id) -> str:
+    return f"https://api.smartrecruiters.com/v1/companies/{slug}/postings/{job_id}"
+
+
+def workable_detail_url(slug, shortcode) -> str:
+    return f"https://apply.workable.com/api/v2/accounts/{slug}/jobs/{shortcode}"
+
+
+def smartrecruiters_detail_description(payload: dict) -> str:
+    sections = ((payload or {}).get("jobAd") or {}).get("sections") or {}
+    order = ("jobDescription", "qualifications", "additionalInformation")
+    return _join(html_to_text((sections.get(key) or {}).get("text")) for key in order)
+
+
+def workable_detail_description(payload: dict) -> str:
+    payload = payload or {}
+    return _join(html_to_text(payload.get(key)) for key in ("description", "requirements", "benefits"))
+
+
+def description_from_detail(url: str, payload) -> str:
+    """Description text from a detail API response fetched from `url`."""
+    if not isinstance(payload, dict):
+        return ""
+    host = urlparse(url).netloc
+    if host.endswith("smartrecruiters.com"):
+        return smartrecruiters_detail_description(payload)
+    if host.endswith("workable.com"):
+        return workable_detail_description(payload)
+    return ""
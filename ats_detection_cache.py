@@ -0,0 +1,57 @@
+# ats_detection_cache.py
+# ----------------------------------
+# Persisted detect_ats_system results
+# ----------------------------------
+
+import os
+from datetime import datetime, timedelta
+from state_store import JsonStateStore
+
+ATS_DETECTION_FILE = os.getenv("ATS_DETECTION_FILE", "data/ats_detection.json")
+ATS_DETECTION_TTL_DAYS = int(os.getenv("ATS_DETECTION_TTL_DAYS", "7"))
+
+
+class AtsDetectionCache:
+    """career URL -> {ats, slug, final_url, detected_at}
+
+    Detection almost never changes between runs, so a fresh entry lets the
+    scraper skip downloading and fingerprinting the career page. Entries
+    expire after ATS_DETECTION_TTL_DAYS, and callers invalidate them when
+    the cached adapter comes back with zero jobs.
+    """
+
+    def __init__(self, path=ATS_DETECTION_FILE, ttl_days=ATS_DETECTION_TTL_DAYS):
+        self.store = JsonStateStore(path)
+        self.ttl = timedelta(days=ttl_days)
+
+    def entry(self, url: str):
+        """Raw entry for `url` (fresh or not), or None."""
+        return self.store.get(url)
+
+    def is_fresh(self, entry) -> bool:
+        try:
+            detected_at = datetime.fromisoformat(entry.get("detected_at", ""))
+        except Exception:
+            return False
+        return datetime.utcnow() - detected_at < self.ttl
+
+    def get(self, url: str):
+        """(ats, slug, final_url) if a fresh entry exists, else None."""
+        entry = self.store.get(url)
+        if not entry or not self.is_fresh(entry):
+            return None
+        return (entry.get("ats") or "generic", entry.get("slug"), entry.get("final_url") or url)
+
+    def put(self, url: str, ats: str, slug, final_url: str):
+        self.store.set(url, {
+            "ats": ats,
+            "slug": slug,
+            "final_url": final_url,
+            "detected_at": datetime.utcnow().isoformat(),
+        })
+
+    def invalidate(self, url: str):
+        self.store.pop(url)
+
+    def save(self):
+        self.store.save()
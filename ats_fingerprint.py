@@ -0,0 +1,123 @@
+# ats_fingerprint.py
+# ----------------------------------
+# ATS fingerprints compiled once (URL, page content, links)
+# ----------------------------------
+
+import re
+
+# (pattern, ats) in priority order: the first rule that matches wins,
+# exactly like the loops detect_ats_system used to run.
+URL_RULES = [
+    (r'boards?\.greenhouse\.io/(?:embed/job_board\?for=)?([^/?&]+)', "greenhouse"),
+    (r'jobs?\.lever\.co/([^/?&]+)', "lever"),
+    (r'(?:jobs\.)?ashbyhq\.com/([^/?&]+)', "ashby"),
+    (r'careers\.smartrecruiters\.com/([^/?&]+)', "smartrecruiters"),
+    (r'jobs\.smartrecruiters\.com/([^/?&]+)', "smartrecruiters"),
+    (r'apply\.workable\.com/([^/?&]+)', "workable"),
+    (r'careers\.kula\.ai/([^/?&]+)', "kula"),
+    (r'([^.]+)\.darwinbox\.in/.*/careers', "darwinbox"),
+    (r'([a-z0-9-]+\.wd\d+\.myworkdayjobs\.com(?:/[^?#]*)?)', "workday"),
+    (r'([a-z0-9-]+\.myworkdayjobs\.com(?:/[^?#]*)?)', "workday"),
+    (r'(wday/cxs/[^/]+/[^/]+(?:/[a-z]{2}(?:-[A-Z]{2})?)?/jobs)', "workday"),
+]
+
+# Embedded boards in page HTML (case-sensitive, first CONTENT_SCAN_CHARS only)
+CONTENT_RULES = [
+    (r'boards?\.greenhouse\.io/(?:embed/job_board\?for=)?([^"\'&<>]+)', "greenhouse"),
+    (r'jobs?\.lever\.co/([^"\'&/<>]+)', "lever"),
+    (r'jobs\.ashbyhq\.com/([^"\'&/<>]+)', "ashby"),
+    (r'careers\.smartrecruiters\.com/([^"\'&/<>]+)', "smartrecruiters"),
+    (r'jobs\.smartrecruiters\.com/([^"\'&/<>]+)', "smartrecruiters"),
+    (r'apply\.workable\.com/([^"\'&/<>]+)', "workable"),
+    (r'careers\.kula\.ai/([^"\'&/<>]+)', "kula"),
+    (r'([^.]+)\.darwinbox\.in/.*/careers', "darwinbox"),
+    (r'([a-z0-9-]+\.wd\d+\.myworkdayjobs\.com(?:/[^"\'\s<>]*)?)', "workday"),
+    (r'([a-z0-9-]+\.myworkdayjobs\.com(?:/[^"\'\s<>]*)?)', "workday"),
+    (r'(wday/cxs/[^/]+/[^/]+(?:/[a-z]{2}(?:-[A-Z]{2})?)?/jobs)', "workday"),
+]
+CONTENT_SCAN_CHARS = 15000
+LINK_SCAN_LIMIT = 100
+
+# Literal every rule of a family needs; one case-insensitive scan for all
+# of them tells which rules can possibly match.
+FAMILY_MARKERS = {
+    "greenhouse": "greenhouse.io",
+    "lever": "lever.co",
+    "ashby": "ashbyhq.com",
+    "smartrecruiters": "smartrecruiters.com",
+    "workable": "workable.com",
+    "kula": "kula.ai",
+    "darwinbox": "darwinbox.in",
+    "workday": ("myworkdayjobs.com", "wday/cxs"),
+}
+_MARKER_FAMILY = {}
+for _family, _markers in FAMILY_MARKERS.items():
+    for _marker in (_markers if isinstance(_markers, tuple) else (_markers,)):
+        _MARKER_FAMILY[_marker] = _family
+_MARKER_RE = re.compile("|".join(re.escape(m) for m in _MARKER_FAMILY), re.I)
+
+_URL_RULES = [(re.compile(p, re.I), ats) for p, ats in URL_RULES]
+_CONTENT_RULES = [(re.compile(p), ats) for p, ats in CONTENT_RULES]
+_SLUG_TAIL_RE = re.compile(r'["\'\s].*$')
+
+
+def families_present(text: str) -> set:
+    """ATS families whose marker literal occurs in `text` (single scan)."""
+    return {_MARKER_FAMILY[m.group(0).lower()] for m in _MARKER_RE.finditer(text or "")}
+
+
+def _first_match(rules, text):
+    present = families_present(text)
+    if not present:
+        return None
+    for regex, ats in rules:
+        if ats not in present:
+            continue
+        match = regex.search(text)
+        if match:
+            return ats, match
+    return None
+
+
+def match_url(url: str):
+    """(ats, slug) for a career/apply URL, or None. Workday has no slug."""
+    hit = _first_match(_URL_RULES, url or "")
+    if not hit:
+        return None
+    ats, match = hit
+    return ats, (None if ats == "workday" else match.group(1))
+
+
+def match_content(html: str):
+    """(ats, slug) for a board embedded in page HTML, or None."""
+    hit = _first_match(_CONTENT_RULES, (html or "")[:CONTENT_SCAN_CHARS])
+    if not hit:
+        return None
+    ats, match = hit
+    if ats == "workday":
+        return ats, None
+    return ats, _SLUG_TAIL_RE.sub('', match.group(1).strip())
+
+
+def match_links(hrefs):
+    """First (ats, slug) among the first LINK_SCAN_LIMIT hrefs, or None."""
+    for i, href in enumerate(hrefs):
+        if i >= LINK_SCAN_LIMIT:
+            break
+        hit = match_url(href)
+        if hit:
+            return hit
+    return None
+
+
+def content_slugs(html: str) -> dict:
+    """Every family/slug embedded in `html` (diagnostics): {ats: {slug, ...}}."""
+    found = {}
+    present = families_present(html)
+    for regex, ats in _CONTENT_RULES:
+        if ats not in present:
+            continue
+        for match in regex.finditer(html):
+            slug = None if ats == "workday" else _SLUG_TAIL_RE.sub('', match.group(1).strip())
+            found.setdefault(ats, set()).add(slug or match.group(0))
+    return found
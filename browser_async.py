@@ -0,0 +1,187 @@
+# browser_async.py
+# ----------------------------------
+# Concurrent Playwright renders (async API)
+# ----------------------------------
+
+import asyncio
+import os
+import time
+from urllib.parse import urlparse
+from browser_pool import (
+    BROWSER_BLOCK_RESOURCES, BROWSER_QUIET_MS, BROWSER_WAIT_POLL_MS,
+    CONTEXT_PROFILES, LAUNCH_ARGS, ROUTE_POLICIES, is_tracker_host, payloads_ready,
+    track_pending_requests,
+)
+
+ASYNC_BROWSER = os.getenv("ASYNC_BROWSER", "false").lower() == "true"
+BROWSER_PAGE_CONCURRENCY = int(os.getenv("BROWSER_PAGE_CONCURRENCY", "4"))
+BROWSER_PAGE_DEADLINE = int(os.getenv("BROWSER_PAGE_DEADLINE", "45"))
+
+
+def async_browser_available() -> bool:
+    try:
+        import playwright.async_api  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+class AsyncRenderer:
+    """Renders a batch of career pages concurrently in one browser.
+
+    Each request is a dict:
+        {"kind": "links" | "workday", "url": ..., "profile": ..., "routes": ..., "cap_ms": ...}
+
+    plus, for workday, an optional "has_jobs": callable(payload) so the
+    wait ends on the first payload with postings rather than any JSON.
+
+    and produces the same value the matching sync BrowserPool callback
+    returns, so callers feed it to the same extraction code:
+        links   -> [(href, text), ...]   (generic scraper)
+        workday -> (html, cxs_payloads)  (Workday fallback)
+
+    At most `concurrency` pages are open at once; a page that runs past
+    `deadline` seconds yields an Exception in its result slot.
+
+    The batch launches its own Chromium: a Browser started by the sync
+    API (BrowserPool) cannot be driven from the async API. It only lives
+    for render_all(), and the scraper closes the pool's browser first, so
+    one Chromium is running at a time.
+    """
+
+    def __init__(self, concurrency=BROWSER_PAGE_CONCURRENCY, deadline=BROWSER_PAGE_DEADLINE):
+        self.concurrency = max(1, concurrency)
+        self.deadline = deadline
+
+    def render_all(self, requests):
+        """Results aligned with `requests`; failures are returned as Exceptions."""
+        if not requests:
+            return []
+        return asyncio.run(self._render_all(requests))
+
+    async def _render_all(self, requests):
+        from playwright.async_api import async_playwright
+
+        semaphore = asyncio.Semaphore(self.concurrency)
+        async with async_playwright() as p:
+            browser = await p.chromium.launch(headless=True, args=LAUNCH_ARGS)
+            try:
+                return await asyncio.gather(
+                    *(self._render_one(browser, semaphore, r) for r in requests)
+                )
+            finally:
+                await browser.close()
+
+    async def _render_one(self, browser, semaphore, request):
+        async with semaphore:
+            options = CONTEXT_PROFILES.get(request.get("profile"), CONTEXT_PROFILES["default"])
+            context = await browser.new_context(**options)
+            try:
+                page = await context.new_page()
+                await _install_routes(page, request.get("routes", "none"))
+                render = _RENDERERS[request["kind"]]
+                return await asyncio.wait_for(render(page, request), timeout=self.deadline)
+            except asyncio.TimeoutError:
+                return TimeoutError(f"render deadline ({self.deadline}s) exceeded")
+            except Exception as e:
+                return e
+            finally:
+                try:
+                    await context.close()
+                except Exception:
+                    pass
+
+
+async def _install_routes(page, routes):
+    policy = ROUTE_POLICIES.get(routes) if BROWSER_BLOCK_RESOURCES else None
+    if not policy:
+        return
+
+    async def handle(route):
+        try:
+            request = route.request
+            if request.resource_type in policy["block_types"]:
+                return await route.abort()
+            url = request.url
+            if (policy["block_trackers"] and not any(k in url for k in policy["keep"])
+                    and is_tracker_host(urlparse(url).netloc)):
+                return await route.abort()
+            return await route.continue_()
+        except Exception:
+            # Never leave a route unresolved: the request would hang until the navigation timeout
+            try:
+                await route.continue_()
+            except Exception:
+                pass
+
+    await page.route("**/*", handle)
+
+
+async def wait_for_signal_async(page, cap_ms, ready=None, selector=None, min_count=1,
+                                quiet_ms=BROWSER_QUIET_MS, pending=None):
+    """Async twin of browser_pool.wait_for_signal (same signals and return values)."""
+    deadline = time.monotonic() + cap_ms / 1000
+    quiet_for = quiet_ms / 1000
+    last_size, stable_since = None, time.monotonic()
+
+    while True:
+        if ready is not None and ready():
+            return "ready"
+
+        now = time.monotonic()
+        try:
+            if selector:
+                size = await page.locator(selector).count()
+            else:
+                size = await page.evaluate("document.getElementsByTagName('*').length")
+        except Exception:
+            size = None
+        if size != last_size:
+            last_size, stable_since = size, now
+        elif size is not None and now - stable_since >= quiet_for:
+            if selector and size >= min_count:
+                return "selector"
+            if not selector and not pending:
+                return "quiet"
+
+        if now >= deadline:
+            return "cap"
+        await asyncio.sleep(min(BROWSER_WAIT_POLL_MS, max(1, int((deadline - now) * 1000))) / 1000)
+
+
+async def _render_links(page, request):
+    pending = track_pending_requests(page)
+    await page.goto(request["url"], wait_until="domcontentloaded", timeout=30000)
+    await wait_for_signal_async(page, request.get("cap_ms", 8000), pending=pending)
+    links = []
+    for link in await page.query_selector_all("a[href]"):
+        links.append(((await link.get_attribute("href")) or "", (await link.inner_text()).strip()))
+    return links
+
+
+async def _render_workday(page, request):
+    payloads = []
+
+    async def handle_response(resp):
+        try:
+            if "wday/cxs" not in (resp.url or ""):
+                return
+            ctype = (resp.headers.get("content-type") or "").lower()
+            if "application/json" not in ctype or resp.status != 200:
+                return
+            payloads.append(await resp.json())
+        except Exception:
+            return
+
+    page.on("response", handle_response)
+    pending = track_pending_requests(page)
+    await page.goto(request["url"], wait_until="domcontentloaded", timeout=60000)
+    ready = payloads_ready(payloads, request.get("has_jobs", bool))
+    await wait_for_signal_async(page, request.get("cap_ms", 8000), ready=ready, pending=pending)
+    return await page.content(), payloads
+
+
+_RENDERERS = {
+    "links": _render_links,
+    "workday": _render_workday,
+}
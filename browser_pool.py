@@ -0,0 +1,287 @@
+# browser_pool.py
+# ----------------------------------
+# One shared Playwright browser per run
+# ----------------------------------
+
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlparse
+from config import HEADERS
+
+BROWSER_CONTEXT_MAX_USES = int(os.getenv("BROWSER_CONTEXT_MAX_USES", "20"))
+BROWSER_BLOCK_RESOURCES = os.getenv("BROWSER_BLOCK_RESOURCES", "true").lower() == "true"
+BROWSER_WAIT_POLL_MS = int(os.getenv("BROWSER_WAIT_POLL_MS", "150"))
+BROWSER_QUIET_MS = int(os.getenv("BROWSER_QUIET_MS", "800"))
+
+LAUNCH_ARGS = [
+    "--no-sandbox",
+    "--disable-dev-shm-usage",
+    "--disable-blink-features=AutomationControlled",
+]
+
+# new_context() options per scraper family
+CONTEXT_PROFILES = {
+    # Bare context (what scrape_generic / rtCamp always used)
+    "default": {},
+    # Desktop Chrome UA from config (Workday, Darwinbox)
+    "desktop": {"user_agent": HEADERS.get("User-Agent", "Mozilla/5.0")},
+    # Realistic browser fingerprint (YC, Wellfound)
+    "stealth": {
+        "user_agent": (
+            "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
+            "AppleWebKit/537.36 (KHTML, like Gecko) "
+            "Chrome/120.0.0.0 Safari/537.36"
+        ),
+        "viewport": {"width": 1920, "height": 1080},
+        "locale": "en-US",
+        "timezone_id": "America/New_York",
+        "extra_http_headers": {
+            "Accept-Language": "en-US,en;q=0.9",
+            "sec-ch-ua": '"Not_A Brand";v="8", "Chromium";v="120"',
+            "sec-ch-ua-mobile": "?0",
+            "sec-ch-ua-platform": '"macOS"',
+        },
+    },
+}
+
+
+# Resource types no scraper reads: we only need the DOM and XHR/fetch JSON
+STATIC_RESOURCE_TYPES = frozenset({"image", "media", "font", "stylesheet"})
+
+# Analytics / ads / chat widgets, matched on the host or any parent domain
+TRACKER_HOSTS = frozenset({
+    "google-analytics.com", "googletagmanager.com", "googleadservices.com",
+    "doubleclick.net", "facebook.net", "connect.facebook.net", "hotjar.com",
+    "segment.com", "segment.io", "mixpanel.com", "amplitude.com",
+    "fullstory.com", "clarity.ms", "bat.bing.com", "snap.licdn.com",
+    "ads.linkedin.com", "nr-data.net", "newrelic.com", "intercom.io",
+    "intercomcdn.com", "drift.com", "hs-analytics.net", "hs-scripts.com",
+    "optimizely.com", "cookielaw.org", "onetrust.com", "tiktok.com",
+})
+
+# page.route() policy per source. "keep" URL fragments are never treated
+# as trackers; XHR/fetch is never blocked by type, so the API responses
+# Workday and Darwinbox listen for always go through.
+ROUTE_POLICIES = {
+    "none": None,
+    "listing": {"block_types": STATIC_RESOURCE_TYPES, "block_trackers": True, "keep": ()},
+    "workday": {"block_types": STATIC_RESOURCE_TYPES, "block_trackers": True, "keep": ("wday/cxs",)},
+    "darwinbox": {"block_types": STATIC_RESOURCE_TYPES, "block_trackers": True, "keep": ("darwinbox.in",)},
+}
+
+
+def is_tracker_host(host: str) -> bool:
+    parts = (host or "").lower().split(":")[0].split(".")
+    return any(".".join(parts[i:]) in TRACKER_HOSTS for i in range(len(parts) - 1))
+
+
+def track_pending_requests(page):
+    """Live set of in-flight XHR/fetch requests; attach before goto()."""
+    pending = set()
+
+    def started(request):
+        if request.resource_type in ("xhr", "fetch"):
+            pending.add(request)
+
+    page.on("request", started)
+    page.on("requestfinished", pending.discard)
+    page.on("requestfailed", pending.discard)
+    return pending
+
+
+def payloads_ready(payloads, has_jobs):
+    """ready= predicate for wait_for_signal: true once any captured payload
+    yields jobs per has_jobs(payload), not merely once some JSON (config,
+    i18n, ...) arrived. Each payload is inspected once."""
+    state = {"checked": 0, "hit": False}
+
+    def ready():
+        while not state["hit"] and state["checked"] < len(payloads):
+            payload = payloads[state["checked"]]
+            state["checked"] += 1
+            try:
+                state["hit"] = bool(has_jobs(payload))
+            except Exception:
+                pass
+        return state["hit"]
+
+    return ready
+
+
+def wait_for_signal(page, cap_ms, ready=None, selector=None, min_count=1,
+                    quiet_ms=BROWSER_QUIET_MS, pending=None):
+    """Block until the page shows what the caller needs, at most cap_ms.
+
+    Signals, whichever comes first:
+      - "ready":    ready() is truthy (e.g. an intercepted JSON payload arrived)
+      - "selector": >= min_count matches of `selector`, unchanged for quiet_ms
+      - "quiet":    DOM size unchanged for quiet_ms and no XHR/fetch pending
+                    (only when no selector is given)
+    Returns the signal name, or "cap" when none arrived in time.
+    """
+    deadline = time.monotonic() + cap_ms / 1000
+    quiet_for = quiet_ms / 1000
+    last_size, stable_since = None, time.monotonic()
+
+    while True:
+        if ready is not None and ready():
+            return "ready"
+
+        now = time.monotonic()
+        try:
+            if selector:
+                size = page.locator(selector).count()
+            else:
+                size = page.evaluate("document.getElementsByTagName('*').length")
+        except Exception:
+            size = None
+        if size != last_size:
+            last_size, stable_since = size, now
+        elif size is not None and now - stable_since >= quiet_for:
+            if selector and size >= min_count:
+                return "selector"
+            if not selector and not pending:
+                return "quiet"
+
+        if now >= deadline:
+            return "cap"
+        page.wait_for_timeout(min(BROWSER_WAIT_POLL_MS, max(1, int((deadline - now) * 1000))))
+
+
+def browser_available() -> bool:
+    try:
+        import playwright.sync_api  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+class BrowserPool:
+    """Lazily launched Chromium shared by every JS-rendered source.
+
+    Playwright's sync API is bound to the thread that started it, so the
+    browser lives on one dedicated thread and scrapers hand it work:
+
+        html = pool.run(lambda page: (page.goto(url), page.content())[1])
+
+    The callback gets a fresh page in a pooled context for the requested
+    profile and must return plain data (no Playwright handles). Contexts
+    are reused across sources, cookies cleared in between, and recycled
+    after BROWSER_CONTEXT_MAX_USES pages. A route policy (see
+    ROUTE_POLICIES) can abort images, fonts, CSS and trackers per page.
+    """
+
+    def __init__(self, max_uses=BROWSER_CONTEXT_MAX_USES):
+        self.max_uses = max_uses
+        self._executor = None
+        self._lock = threading.Lock()
+        self._playwright = None
+        self._browser = None
+        self._idle = {}  # profile -> [(context, uses)]
+
+    def run(self, fn, profile="default", routes="none"):
+        """fn(page) on the browser thread; `routes` names a ROUTE_POLICIES entry."""
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="browser")
+            executor = self._executor
+        return executor.submit(self._run, fn, profile, routes).result()
+
+    def close(self):
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is None:
+            return
+        executor.submit(self._shutdown).result()
+        executor.shutdown()
+
+    # ---- browser thread only ----
+
+    def _ensure_browser(self):
+        if self._browser is not None and not self._browser.is_connected():
+            self._shutdown()
+        if self._browser is None:
+            from playwright.sync_api import sync_playwright
+            self._playwright = sync_playwright().start()
+            self._browser = self._playwright.chromium.launch(headless=True, args=LAUNCH_ARGS)
+        return self._browser
+
+    def _lease(self, profile):
+        idle = self._idle.setdefault(profile, [])
+        if idle:
+            return idle.pop()
+        options = CONTEXT_PROFILES.get(profile, CONTEXT_PROFILES["default"])
+        return self._ensure_browser().new_context(**options), 0
+
+    def _release(self, profile, context, uses):
+        try:
+            if uses >= self.max_uses:
+                context.close()
+                return
+            context.clear_cookies()
+            self._idle.setdefault(profile, []).append((context, uses))
+        except Exception:
+            pass
+
+    def _install_routes(self, page, routes):
+        policy = ROUTE_POLICIES.get(routes) if BROWSER_BLOCK_RESOURCES else None
+        if not policy:
+            return
+        block_types = policy["block_types"]
+        block_trackers = policy["block_trackers"]
+        keep = policy["keep"]
+
+        def handle(route):
+            try:
+                request = route.request
+                if request.resource_type in block_types:
+                    return route.abort()
+                url = request.url
+                if block_trackers and not any(k in url for k in keep) and is_tracker_host(urlparse(url).netloc):
+                    return route.abort()
+                return route.continue_()
+            except Exception:
+                # Never leave a route unresolved: the request would hang until the navigation timeout
+                try:
+                    route.continue_()
+                except Exception:
+                    pass
+
+        page.route("**/*", handle)
+
+    def _run(self, fn, profile, routes):
+        self._ensure_browser()
+        context, uses = self._lease(profile)
+        page = context.new_page()
+        try:
+            self._install_routes(page, routes)
+            return fn(page)
+        finally:
+            try:
+                page.close()
+            except Exception:
+                pass
+            self._release(profile, context, uses + 1)
+
+    def _shutdown(self):
+        for contexts in self._idle.values():
+            for context, _ in contexts:
+                try:
+                    context.close()
+                except Exception:
+                    pass
+        self._idle = {}
+        try:
+            if self._browser is not None:
+                self._browser.close()
+        except Exception:
+            pass
+        try:
+            if self._playwright is not None:
+                self._playwright.stop()
+        except Exception:
+            pass
+        self._browser = None
+        self._playwright = None
@@ -13,6 +13,28 @@ HEADERS = {
 
 TIMEOUT = 12
 
+# ===================================================================
+# HOST RATE LIMITS - requests/second per host (or parent domain)
+# Anything not listed gets DEFAULT_HOST_RATE.
+# ===================================================================
+DEFAULT_HOST_RATE = 2.0
+DEFAULT_HOST_BURST = 2
+
+HOST_RATE_LIMITS = {
+    "greenhouse.io": 5.0,
+    "ashbyhq.com": 5.0,
+    "lever.co": 4.0,
+    "smartrecruiters.com": 4.0,
+    "workable.com": 3.0,
+    "myworkdayjobs.com": 3.0,
+    "darwinbox.in": 2.0,
+    "kula.ai": 2.0,
+    "remotive.com": 2.0,
+    "remoteok.com": 1.0,
+    "weworkremotely.com": 2.0,
+    "internshala.com": 2.0,
+}
+
 # ===================================================================
 # TOP_COMPANIES - Greenhouse/Lever (STABLE, DO NOT TOUCH)
 # ===================================================================
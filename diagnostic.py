@@ -4,9 +4,13 @@
 # ----------------------------------
 
 import requests
-import re
-from bs4 import BeautifulSoup
+from html_parsing import parse_html
+from ats_fingerprint import match_url, content_slugs
 from config import HEADERS, CAREER_PAGES
+from ats_detection_cache import AtsDetectionCache
+
+ATS_CACHE = AtsDetectionCache()
+ATS_LABELS = {"greenhouse": "Greenhouse", "lever": "Lever", "ashby": "Ashby", "workday": "Workday (requires JS)"}
 
 def diagnose_company(company_name, url):
     """Deep dive into a company's career page"""
@@ -14,6 +18,15 @@ def diagnose_company(company_name, url):
     print(f"🔍 DIAGNOSING: {company_name}")
     print(f"📍 URL: {url}")
     print('='*70)
+
+    cached = ATS_CACHE.entry(url)
+    if cached:
+        state = "fresh" if ATS_CACHE.is_fresh(cached) else "expired"
+        slug = f" | slug: {cached.get('slug')}" if cached.get('slug') else ""
+        print(f"\n🗂 Cached detection ({state}): {cached.get('ats')}{slug}")
+        print(f"   └─ detected_at: {cached.get('detected_at')} | final_url: {cached.get('final_url')}")
+    else:
+        print("\n🗂 Cached detection: none (scraper will detect on next run)")
     
     headers = {
         **HEADERS,
@@ -28,23 +41,14 @@ def diagnose_company(company_name, url):
         print(f"\n✅ Status: {r.status_code}")
         print(f"🔗 Final URL: {final_url}")
         
-        # Check for ATS in URL
+        # Check for ATS in URL (same fingerprints the scraper uses)
         ats_in_url = None
-        if "greenhouse.io" in final_url or "boards.greenhouse" in final_url:
-            ats_in_url = "Greenhouse"
-            match = re.search(r'greenhouse\.io/(?:embed/job_board\?for=)?([^/?&]+)', final_url)
-            if match:
-                print(f"   └─ Greenhouse slug: {match.group(1)}")
-        elif "lever.co" in final_url or "jobs.lever" in final_url:
-            ats_in_url = "Lever"
-            match = re.search(r'lever\.co/([^/?&]+)', final_url)
-            if match:
-                print(f"   └─ Lever slug: {match.group(1)}")
-        elif "ashbyhq.com" in final_url or "jobs.ashbyhq" in final_url:
-            ats_in_url = "Ashby"
-            match = re.search(r'ashbyhq\.com/([^/?&]+)', final_url)
-            if match:
-                print(f"   └─ Ashby slug: {match.group(1)}")
+        url_hit = match_url(final_url)
+        if url_hit:
+            ats, slug = url_hit
+            ats_in_url = ATS_LABELS.get(ats, ats.title())
+            if slug:
+                print(f"   └─ {ats.title()} slug: {slug}")
         elif "workday" in final_url.lower():
             ats_in_url = "Workday (requires JS)"
         
@@ -52,30 +56,14 @@ def diagnose_company(company_name, url):
             print(f"\n🎯 ATS DETECTED IN URL: {ats_in_url}")
         
         # Parse content
-        soup = BeautifulSoup(r.text, "html.parser")
-        content_lower = r.text.lower()
+        soup = parse_html(r.text)
         
         # Check for ATS in content
         print("\n📄 CONTENT ANALYSIS:")
         
-        if "greenhouse" in content_lower[:10000]:
-            print("  ✓ Contains 'greenhouse' text")
-            # Find greenhouse URLs
-            gh_matches = re.findall(r'greenhouse\.io/(?:embed/job_board\?for=)?([^"\'&\s]+)', r.text)
-            if gh_matches:
-                print(f"    └─ Greenhouse slug(s): {set(gh_matches)}")
-        
-        if "lever" in content_lower[:10000]:
-            print("  ✓ Contains 'lever' text")
-            lever_matches = re.findall(r'lever\.co/([^"\'&\s/]+)', r.text)
-            if lever_matches:
-                print(f"    └─ Lever slug(s): {set(lever_matches)}")
-        
-        if "ashbyhq" in content_lower[:10000]:
-            print("  ✓ Contains 'ashbyhq' text")
-            ashby_matches = re.findall(r'ashbyhq\.com/([^"\'&\s/]+)', r.text)
-            if ashby_matches:
-                print(f"    └─ Ashby slug(s): {set(ashby_matches)}")
+        for ats, slugs in sorted(content_slugs(r.text).items()):
+            print(f"  ✓ Contains {ats} embed")
+            print(f"    └─ {ats.title()} slug(s): {slugs}")
         
         # Find job-related links
         print("\n🔗 JOB LINKS FOUND:")
@@ -92,12 +80,9 @@ def diagnose_company(company_name, url):
             href = link.get('href', '')
             text = link.get_text(strip=True)
             
-            if 'greenhouse.io' in href:
-                job_patterns['greenhouse'].append((text[:50], href[:100]))
-            elif 'lever.co' in href:
-                job_patterns['lever'].append((text[:50], href[:100]))
-            elif 'ashbyhq.com' in href:
-                job_patterns['ashby'].append((text[:50], href[:100]))
+            hit = match_url(href)
+            if hit and hit[0] in job_patterns:
+                job_patterns[hit[0]].append((text[:50], href[:100]))
             elif any(keyword in href.lower() for keyword in ['/job/', '/position/', '/opening/', '/role/']):
                 if text and len(text) > 5:  # Likely a job title
                     job_patterns['generic'].append((text[:50], href[:100]))
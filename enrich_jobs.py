@@ -1,46 +1,68 @@
 # enrich_jobs.py
 # Run this AFTER scraping to add requirements to jobs
+#
+#   python enrich_jobs.py                       # top 100 jobs
+#   python enrich_jobs.py --max-jobs 0 --budget-seconds 900   # as many as fit in 15 min
 
+import argparse
 import json
 from scraper import JobScraper
+from enrichment_pipeline import EnrichmentPipeline, write_jobs, ENRICH_FETCH_WORKERS, ENRICH_PER_HOST
+
+JOBS_FILE = 'data/jobs.json'
+
+def enrich_jobs_with_requirements(max_jobs=100, budget_seconds=None,
+                                  workers=ENRICH_FETCH_WORKERS, per_host=ENRICH_PER_HOST):
+    """Add requirements to jobs that don't have them (max_jobs=0: no limit)"""
 
-def enrich_jobs_with_requirements(max_jobs=100):
-    """Add requirements to jobs that don't have them"""
-    
     # Load existing jobs
-    with open('data/jobs.json', 'r', encoding='utf-8') as f:
+    with open(JOBS_FILE, 'r', encoding='utf-8') as f:
         jobs = json.load(f)
-    
+
+    pending = [job for job in jobs if not job.get('requirements')]
+    if max_jobs:
+        pending = pending[:max_jobs]
+
     print(f"\n[Enriching Jobs with Requirements]")
     print(f"Total jobs: {len(jobs)}")
-    print(f"Will enrich top {max_jobs} jobs\n")
-    
+    print(f"Will enrich {len(pending)} jobs"
+          + (f" (budget {budget_seconds}s)" if budget_seconds else "") + "\n")
+
     scraper = JobScraper()
-    enriched_count = 0
-    
-    for i, job in enumerate(jobs):
-        # Skip if already has requirements
-        if job.get('requirements'):
-            continue
-        
-        # Stop after max_jobs
-        if enriched_count >= max_jobs:
-            print(f"\n✓ Reached limit of {max_jobs} jobs")
-            break
-        
-        print(f"[{enriched_count + 1}/{max_jobs}] {job['company']} - {job['title'][:40]}")
-        
-        # Fetch requirements
-        job['requirements'] = scraper.fetch_requirements(job)
-        enriched_count += 1
-    
+
+    def on_result(done, job):
+        print(f"[{done}/{len(pending)}] {job['company']} - {job['title'][:40]}")
+
+    def on_checkpoint(done):
+        # Stream progress to disk so an interrupted run keeps its work
+        write_jobs(JOBS_FILE, jobs)
+        print(f"  ✓ Checkpoint: {done} jobs saved")
+
+    pipeline = EnrichmentPipeline(
+        scraper.http, type(scraper.req_extractor),
+        fetch_workers=workers, per_host=per_host, on_checkpoint=on_checkpoint,
+    )
+    try:
+        enriched_count = pipeline.run(pending, budget_seconds=budget_seconds, on_result=on_result)
+    finally:
+        scraper.close()
+
     # Save enriched jobs
-    with open('data/jobs.json', 'w', encoding='utf-8') as f:
-        json.dump(jobs, f, indent=2, ensure_ascii=False)
-    
+    write_jobs(JOBS_FILE, jobs)
+
     print(f"\n✅ Enriched {enriched_count} jobs!")
-    print(f"✅ Saved to data/jobs.json")
+    print(f"✅ Saved to {JOBS_FILE}")
 
 if __name__ == "__main__":
-    # Enrich top 100 jobs (increase if you want more)
-    enrich_jobs_with_requirements(max_jobs=100)
+    parser = argparse.ArgumentParser(description="Add requirements to scraped jobs")
+    parser.add_argument("--max-jobs", type=int, default=100, help="jobs to enrich (0 = all)")
+    parser.add_argument("--budget-seconds", type=float, default=None,
+                        help="enrich as many jobs as fit in this many seconds")
+    parser.add_argument("--workers", type=int, default=ENRICH_FETCH_WORKERS, help="concurrent page fetches")
+    parser.add_argument("--per-host", type=int, default=ENRICH_PER_HOST, help="concurrent fetches per host")
+    args = parser.parse_args()
+
+    enrich_jobs_with_requirements(
+        max_jobs=args.max_jobs, budget_seconds=args.budget_seconds,
+        workers=args.workers, per_host=args.per_host,
+    )
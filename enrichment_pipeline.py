@@ -0,0 +1,156 @@
+# enrichment_pipeline.py
+# ----------------------------------
+# Fetch -> parse -> save pipeline for requirements enrichment
+# ----------------------------------
+
+import json
+import os
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, wait, FIRST_COMPLETED
+from functools import partial
+from urllib.parse import urlparse
+from requirements_extracter import extract_document, fetch_page, EXTRACT_WORKERS
+
+ENRICH_FETCH_WORKERS = int(os.getenv("ENRICH_FETCH_WORKERS", "16"))
+ENRICH_PER_HOST = int(os.getenv("ENRICH_PER_HOST", "2"))  # concurrent fetches per host
+ENRICH_FETCH_TIMEOUT = int(os.getenv("ENRICH_FETCH_TIMEOUT", "10"))
+ENRICH_CHECKPOINT_EVERY = int(os.getenv("ENRICH_CHECKPOINT_EVERY", "50"))  # jobs between saves
+
+
+class _HostScheduler:
+    """Hands out jobs round-robin across hosts, never more than per_host in flight on one."""
+
+    def __init__(self, jobs, per_host):
+        self.per_host = max(1, per_host)
+        self.queues = OrderedDict()
+        self.in_flight = {}
+        for job in jobs:
+            host = urlparse(job.get("applyLink") or "").netloc
+            self.queues.setdefault(host, deque()).append(job)
+
+    def __bool__(self):
+        return bool(self.queues)
+
+    def next(self):
+        for host in list(self.queues):
+            if self.in_flight.get(host, 0) >= self.per_host:
+                continue
+            queue = self.queues.pop(host)
+            job = queue.popleft()
+            if queue:
+                self.queues[host] = queue  # back of the line: round-robin
+            self.in_flight[host] = self.in_flight.get(host, 0) + 1
+            return job
+        return None
+
+    def release(self, job):
+        host = urlparse(job.get("applyLink") or "").netloc
+        self.in_flight[host] -= 1
+
+
+class EnrichmentPipeline:
+    """Enriches jobs with requirements as a streaming pipeline.
+
+    Pages are fetched on a thread pool (fetch_workers total, per_host per
+    host, scheduled round-robin so one slow board cannot hold every
+    thread), handed to a process pool for HTML-to-text + extraction as
+    each arrives, and written back to the job dict as each finishes.
+    on_checkpoint(done) runs every checkpoint_every jobs. With
+    budget_seconds, no new fetch starts once the remaining time would not
+    cover a fetch timeout; jobs already in flight still complete.
+
+    Only applyLink is fetched. Jobs read back from data/jobs.json never
+    carry the scrape-time _description / _detail_api fields: JobScraper
+    already extracts requirements from ATS descriptions (SmartRecruiters /
+    Workable detail APIs included) while scraping, so what is left here
+    are pages with no API description.
+    """
+
+    def __init__(self, http, extractor_cls, fetch_workers=ENRICH_FETCH_WORKERS,
+                 per_host=ENRICH_PER_HOST, parse_workers=None,
+                 checkpoint_every=ENRICH_CHECKPOINT_EVERY, on_checkpoint=None):
+        self.http = http
+        self.worker = partial(extract_document, extractor_cls)
+        self.fetch_workers = max(1, fetch_workers)
+        self.per_host = per_host
+        self.parse_workers = parse_workers or EXTRACT_WORKERS or os.cpu_count() or 1
+        self.checkpoint_every = checkpoint_every
+        self.on_checkpoint = on_checkpoint
+
+    def _fetch(self, url):
+        return fetch_page(self.http, url, timeout=ENRICH_FETCH_TIMEOUT)
+
+    def run(self, jobs, budget_seconds=None, on_result=None):
+        """Fill job['requirements'] for each job; returns how many were enriched."""
+        scheduler = _HostScheduler(jobs, self.per_host)
+        deadline = time.monotonic() + budget_seconds if budget_seconds else None
+        fetches = {}
+        parses = {}
+        done_count = 0
+        max_parse_backlog = self.parse_workers * 4
+
+        def finish(job, requirements):
+            nonlocal done_count
+            job["requirements"] = requirements
+            done_count += 1
+            if on_result:
+                on_result(done_count, job)
+            if self.on_checkpoint and self.checkpoint_every and done_count % self.checkpoint_every == 0:
+                self.on_checkpoint(done_count)
+
+        def out_of_time():
+            return deadline is not None and time.monotonic() + ENRICH_FETCH_TIMEOUT > deadline
+
+        parse_pool = ProcessPoolExecutor(max_workers=self.parse_workers) if self.parse_workers > 1 else None
+        fetch_pool = ThreadPoolExecutor(max_workers=self.fetch_workers)
+        try:
+            while True:
+                # Backpressure: stop fetching while parsing lags behind
+                while (len(fetches) < self.fetch_workers and len(parses) < max_parse_backlog
+                       and scheduler and not out_of_time()):
+                    job = scheduler.next()
+                    if job is None:
+                        break  # every host with work is at its cap
+                    fetches[fetch_pool.submit(self._fetch, job.get("applyLink"))] = job
+
+                if not fetches and not parses:
+                    break
+
+                done, _ = wait(list(fetches) + list(parses), return_when=FIRST_COMPLETED)
+                for future in done:
+                    if future in fetches:
+                        job = fetches.pop(future)
+                        scheduler.release(job)
+                        html = future.result()
+                        if parse_pool is not None:
+                            try:
+                                parses[parse_pool.submit(self.worker, html)] = job
+                                continue
+                            except Exception as e:
+                                print(f"  ⚠ Parse pool failed ({e}), parsing in-process")
+                                parse_pool = None
+                        finish(job, self.worker(html))
+                    else:
+                        job = parses.pop(future)
+                        try:
+                            requirements = future.result()
+                        except Exception:
+                            requirements = self.worker(None)
+                        finish(job, requirements)
+        finally:
+            fetch_pool.shutdown(wait=True, cancel_futures=True)
+            if parse_pool is not None:
+                parse_pool.shutdown(wait=True, cancel_futures=True)
+
+        if scheduler and out_of_time():
+            print(f"  ⚠ Budget reached: {sum(len(q) for q in scheduler.queues.values())} jobs left for the next run")
+        return done_count
+
+
+def write_jobs(path, jobs):
+    """Atomic rewrite of a jobs JSON file (safe to call mid-run as a checkpoint)."""
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(jobs, f, indent=2, ensure_ascii=False)
+    os.replace(tmp_path, path)
@@ -2,8 +2,7 @@
 # Run this AFTER scraping to enrich jobs with requirements
 
 import json
-from requirements_extractor import RequirementsExtractor
-import time
+from requirements_extracter import RequirementsExtractor, fetch_pages
 
 def enrich_jobs_with_requirements(input_file="data/jobs.json", 
                                    output_file="data/jobs_enriched.json",
@@ -14,26 +13,20 @@ def enrich_jobs_with_requirements(input_file="data/jobs.json",
         jobs = json.load(f)
     
     extractor = RequirementsExtractor()
-    enriched_count = 0
     
-    for i, job in enumerate(jobs):
-        # Skip if already has requirements
-        if job.get('requirements'):
-            continue
-        
-        # Stop after max_jobs to save time
-        if enriched_count >= max_jobs:
-            break
-        
-        print(f"[{i+1}/{len(jobs)}] Fetching: {job['title'][:50]}...")
-        
-        try:
-            job['requirements'] = extractor.extract_from_url(job['applyLink'])
-            enriched_count += 1
-            time.sleep(0.5)  # Be nice to servers
-        except Exception as e:
-            print(f"  Error: {e}")
-            job['requirements'] = extractor._empty_requirements()
+    # Skip jobs that already have requirements; stop after max_jobs to save time
+    pending = [job for job in jobs if not job.get('requirements')][:max_jobs]
+    
+    def progress(done, i, html):
+        status = "" if html is not None else " (failed)"
+        print(f"[{done}/{len(pending)}] Fetched: {pending[i]['title'][:50]}...{status}")
+    
+    # Pages on threads, extraction across all cores
+    pages = fetch_pages(extractor.http, [job.get('applyLink') for job in pending], on_fetched=progress)
+    results = extractor.extract_many([(job.get('id'), html) for job, html in zip(pending, pages)])
+    for job, (_, requirements) in zip(pending, results):
+        job['requirements'] = requirements
+    enriched_count = len(pending)
     
     # Save enriched jobs
     with open(output_file, 'w') as f:
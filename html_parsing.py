@@ -0,0 +1,34 @@
+# html_parsing.py
+# ----------------------------------
+# BeautifulSoup construction (parser backend + partial parsing)
+# ----------------------------------
+
+import os
+from bs4 import BeautifulSoup, SoupStrainer
+
+try:
+    import lxml  # noqa: F401  (C parser, ~5-10x faster than html.parser)
+    _DEFAULT_PARSER = "lxml"
+except ImportError:  # optional dependency
+    _DEFAULT_PARSER = "html.parser"
+
+# Any BeautifulSoup tree builder name: lxml, html.parser, html5lib
+HTML_PARSER = os.getenv("HTML_PARSER", _DEFAULT_PARSER)
+
+# Partial parses: only these elements (and their contents) enter the tree
+LINKS_ONLY = SoupStrainer("a", href=True)
+
+
+def parse_html(markup, parse_only=None) -> BeautifulSoup:
+    """Full tree with the configured backend (falls back to html.parser)."""
+    try:
+        return BeautifulSoup(markup, HTML_PARSER, parse_only=parse_only)
+    except Exception:
+        if HTML_PARSER == "html.parser":
+            raise
+        return BeautifulSoup(markup, "html.parser", parse_only=parse_only)
+
+
+def parse_links(markup) -> BeautifulSoup:
+    """Only <a href> tags: for callers that just walk soup.find_all("a")."""
+    return parse_html(markup, parse_only=LINKS_ONLY)
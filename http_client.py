@@ -0,0 +1,171 @@
+# http_client.py
+# ----------------------------------
+# Shared HTTP fetch layer (pooled sessions)
+# ----------------------------------
+
+import os
+import threading
+import time
+import requests
+from datetime import datetime, timedelta
+from urllib.parse import urlparse
+from requests.adapters import HTTPAdapter
+from config import HEADERS, TIMEOUT, HOST_RATE_LIMITS, DEFAULT_HOST_RATE, DEFAULT_HOST_BURST
+from state_store import JsonStateStore
+
+HTTP_POOL_CONNECTIONS = int(os.getenv("HTTP_POOL_CONNECTIONS", "32"))
+HTTP_POOL_MAXSIZE = int(os.getenv("HTTP_POOL_MAXSIZE", "16"))
+HTTP_CACHE_FILE = os.getenv("HTTP_CACHE_FILE", "data/http_cache.json")
+HTTP_CACHE_MAX_AGE_DAYS = int(os.getenv("HTTP_CACHE_MAX_AGE_DAYS", "14"))
+
+
+class HostRateLimiter:
+    """Token bucket per host.
+
+    Rates come from HOST_RATE_LIMITS (requests/second), matched on the
+    exact host or any parent domain, so "greenhouse.io" covers every
+    Greenhouse host. Requests to different hosts never wait on each other.
+    """
+
+    def __init__(self, rates=None, default_rate=DEFAULT_HOST_RATE, burst=DEFAULT_HOST_BURST):
+        self.rates = HOST_RATE_LIMITS if rates is None else rates
+        self.default_rate = default_rate
+        self.burst = burst
+        self._buckets = {}  # host -> [tokens, last_refill]
+        self._lock = threading.Lock()
+
+    def rate_for(self, host: str):
+        host = (host or "").lower().split(":")[0]
+        parts = host.split(".")
+        for i in range(len(parts)):
+            rate = self.rates.get(".".join(parts[i:]))
+            if rate is not None:
+                return rate
+        return self.default_rate
+
+    def reserve(self, host: str) -> float:
+        """Take a token for `host`; returns how long the caller must wait."""
+        rate = self.rate_for(host)
+        if not rate or rate <= 0:
+            return 0.0
+        with self._lock:
+            now = time.monotonic()
+            tokens, last = self._buckets.get(host, (self.burst, now))
+            tokens = min(self.burst, tokens + (now - last) * rate)
+            tokens -= 1
+            self._buckets[host] = (tokens, now)
+        # A negative balance is a queue of reservations ahead of us.
+        return max(0.0, -tokens / rate)
+
+    def acquire(self, host: str):
+        delay = self.reserve(host)
+        if delay > 0:
+            time.sleep(delay)
+
+
+class HttpClient:
+    """One keep-alive session with per-host connection pools.
+
+    Every scraper fetch goes through here so repeated hits on the same
+    ATS host (boards-api.greenhouse.io, api.ashbyhq.com, ...) reuse an
+    open TCP+TLS connection instead of paying a new handshake.
+    """
+
+    def __init__(self, headers=None, timeout=TIMEOUT,
+                 pool_connections=HTTP_POOL_CONNECTIONS, pool_maxsize=HTTP_POOL_MAXSIZE,
+                 limiter=None):
+        self.timeout = timeout
+        self.limiter = limiter or HostRateLimiter()
+        self.session = requests.Session()
+        self.session.headers.update(headers or HEADERS)
+
+        # urllib3 keeps one pool per host; pool_connections is how many
+        # host pools are cached, pool_maxsize how many sockets per host.
+        self.adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize)
+        self.session.mount("https://", self.adapter)
+        self.session.mount("http://", self.adapter)
+
+    def request(self, method, url, session=None, **kwargs):
+        kwargs.setdefault("timeout", self.timeout)
+        self.limiter.acquire(urlparse(url).netloc)
+        return (session or self.session).request(method, url, **kwargs)
+
+    def get(self, url, **kwargs):
+        kwargs.setdefault("allow_redirects", True)
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url, **kwargs):
+        return self.request("POST", url, **kwargs)
+
+    def new_session(self):
+        """Session with its own cookie jar that still shares the pooled connections."""
+        session = requests.Session()
+        session.headers.update(self.session.headers)
+        session.mount("https://", self.adapter)
+        session.mount("http://", self.adapter)
+        return session
+
+    def close(self):
+        self.session.close()
+
+
+class ConditionalCache:
+    """ETag / Last-Modified validators plus the job IDs parsed for each board URL.
+
+    Requests carry If-None-Match / If-Modified-Since; on a 304 the caller
+    replays the board from its IDs instead of re-downloading and
+    re-parsing the payload. Only IDs are stored (the jobs themselves are
+    already in data/jobs.json), so the committed file stays small.
+    """
+
+    def __init__(self, path=HTTP_CACHE_FILE, max_age_days=HTTP_CACHE_MAX_AGE_DAYS):
+        self.store = JsonStateStore(path)
+        self.max_age_days = max_age_days
+
+    def validators(self, url: str) -> dict:
+        entry = self.store.get(url)
+        if not entry or entry.get("ids") is None:
+            return {}
+        headers = {}
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def replay(self, url: str):
+        """(ids, raw_count) stored for `url`, or None."""
+        entry = self.store.get(url)
+        if not entry or entry.get("ids") is None:
+            return None
+        today = datetime.utcnow().date().isoformat()
+        if entry.get("used_on") != today:
+            # Day granularity keeps the committed file from churning every run.
+            entry["used_on"] = today
+            self.store.set(url, entry)
+        return list(entry["ids"]), entry.get("raw_count", len(entry["ids"]))
+
+    def remember(self, url: str, headers, ids, raw_count: int):
+        etag = headers.get("ETag")
+        last_modified = headers.get("Last-Modified")
+        if not etag and not last_modified:
+            # No validators: nothing to revalidate with next run.
+            self.store.pop(url)
+            return
+        ids = list(ids)
+        entry = self.store.get(url) or {}
+        if (entry.get("etag"), entry.get("last_modified"), entry.get("ids")) == (etag, last_modified, ids):
+            return
+        self.store.set(url, {
+            "etag": etag,
+            "last_modified": last_modified,
+            "raw_count": raw_count,
+            "ids": ids,
+            "stored_at": datetime.utcnow().isoformat(),
+            "used_on": datetime.utcnow().date().isoformat(),
+        })
+
+    def save(self):
+        cutoff = (datetime.utcnow() - timedelta(days=self.max_age_days)).date().isoformat()
+        self.store.prune(lambda _url, entry: (entry.get("used_on") or "") >= cutoff)
+        self.store.save()
@@ -0,0 +1,71 @@
+# job_ids.py
+# ----------------------------------
+# Stable job IDs (same URL -> same ID on every run)
+# ----------------------------------
+
+import hashlib
+import json
+import re
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+
+JOB_ID_DIGEST_CHARS = 16  # 64 bits of sha1; collisions are negligible per source
+
+# Query parameters that vary per visit but never identify a posting
+TRACKING_PARAMS = {"gh_src", "lever-source", "lever-origin", "ref", "referrer", "source", "src", "fbclid", "gclid"}
+
+# IDs the scraper used to build with the per-process salted hash():
+# "<prefix>_<signed 64-bit int>". Sources with real upstream IDs
+# (remotive_123, greenhouse_...) never have this many digits.
+LEGACY_ID_RE = re.compile(
+    r"^(wellfound|wwr|yc|internshala|rtcamp|wpmudev|navana|e42|deeptek|"
+    r"(?:generic|jsonld|sitemap|lever)_.+)_-?\d{8,}$"
+)
+
+
+def canonical_url(url: str) -> str:
+    """Scheme/host lower-cased, no fragment, no tracking params, sorted query, no trailing slash."""
+    url = (url or "").strip()
+    parts = urlsplit(url)
+    if not parts.netloc:
+        return url.rstrip("/")
+    query = sorted(
+        (k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+        if k.lower() not in TRACKING_PARAMS and not k.lower().startswith("utm_")
+    )
+    path = parts.path.rstrip("/")
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), path, urlencode(query), ""))
+
+
+def stable_job_id(prefix: str, url: str) -> str:
+    """"<prefix>_<sha1 of canonical url>", identical across runs and machines."""
+    digest = hashlib.sha1(canonical_url(url).encode("utf-8")).hexdigest()
+    return f"{prefix}_{digest[:JOB_ID_DIGEST_CHARS]}"
+
+
+def migrate_legacy_id(job: dict):
+    """New ID for a job saved with a hash()-based ID, or None if it needs no migration."""
+    match = LEGACY_ID_RE.match(job.get("id") or "")
+    link = job.get("applyLink")
+    if not match or not link:
+        return None
+    return stable_job_id(match.group(1), link)
+
+
+def build_migration_map(jobs) -> dict:
+    """{legacy id: stable id} for every legacy ID in `jobs`."""
+    mapping = {}
+    for job in jobs:
+        new_id = migrate_legacy_id(job)
+        if new_id:
+            mapping[job["id"]] = new_id
+    return mapping
+
+
+if __name__ == "__main__":
+    # Report only: JobScraper maps legacy IDs itself when it loads data/jobs.json
+    with open("data/jobs.json", "r", encoding="utf-8") as f:
+        jobs = json.load(f)
+    mapping = build_migration_map(jobs)
+    for old_id, new_id in list(mapping.items())[:20]:
+        print(f"  {old_id} → {new_id}")
+    print(f"✓ {len(mapping)} of {len(jobs)} job IDs use the legacy scheme")
@@ -0,0 +1,167 @@
+# jobposting_validator.py
+# ----------------------------------
+# "Does this URL carry a JobPosting?" without downloading whole pages
+# ----------------------------------
+
+import codecs
+import json
+import os
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from urllib.parse import urlparse
+from config import HEADERS
+from state_store import JsonStateStore
+
+JSONLD_VERDICT_FILE = os.getenv("JSONLD_VERDICT_FILE", "data/jobposting_verdicts.json")
+JSONLD_VERDICT_TTL_DAYS = int(os.getenv("JSONLD_VERDICT_TTL_DAYS", "7"))
+JSONLD_NEGATIVE_TTL_DAYS = int(os.getenv("JSONLD_NEGATIVE_TTL_DAYS", "1"))
+JSONLD_MAX_BYTES = int(os.getenv("JSONLD_MAX_BYTES", str(512 * 1024)))
+JSONLD_HEAD_ONLY = os.getenv("JSONLD_HEAD_ONLY", "false").lower() == "true"  # opt-in: misses <body> JobPostings
+JSONLD_WORKERS = int(os.getenv("JSONLD_WORKERS", "8"))
+JSONLD_PER_HOST = int(os.getenv("JSONLD_PER_HOST", "3"))
+
+_LD_SCRIPT_RE = re.compile(
+    r'<script\b[^>]*\btype\s*=\s*["\']?application/ld\+json["\']?[^>]*>(.*?)</script\s*>',
+    re.I | re.S,
+)
+_HEAD_END_RE = re.compile(r"</head\s*>", re.I)
+
+
+def jobpostings_from_ld(text):
+    """(title, url, location) for each JobPosting in one ld+json block."""
+    jobs = []
+    try:
+        data = json.loads(text or "{}")
+    except Exception:
+        return jobs
+
+    payloads = []
+    if isinstance(data, list):
+        payloads = data
+    elif isinstance(data, dict):
+        payloads = [data]
+
+    for item in payloads:
+        if not isinstance(item, dict):
+            continue
+        if item.get("@type") != "JobPosting":
+            continue
+        title = item.get("title", "")
+        url = item.get("url", "")
+        location = ""
+        loc = item.get("jobLocation")
+        if isinstance(loc, dict):
+            location = loc.get("address", {}).get("addressLocality", "")
+        elif isinstance(loc, list) and loc:
+            loc0 = loc[0]
+            if isinstance(loc0, dict):
+                location = loc0.get("address", {}).get("addressLocality", "")
+        if url and title:
+            jobs.append((title, url, location or "Various"))
+    return jobs
+
+
+class JobPostingValidator:
+    """Streams candidate pages and stops at the first JobPosting ld+json block.
+
+    Without a hit, reading continues into <body> and stops after
+    JSONLD_MAX_BYTES (or at </head> when JSONLD_HEAD_ONLY is set).
+    Verdicts are cached per URL in data/ so re-validated sitemap and
+    Playwright candidates cost nothing on the next run; negatives expire
+    sooner than positives, and are only cached when the whole document
+    was read (a JobPosting in <body> or past the byte cap must not be
+    remembered as absent).
+    """
+
+    def __init__(self, http, path=JSONLD_VERDICT_FILE, max_bytes=JSONLD_MAX_BYTES,
+                 head_only=JSONLD_HEAD_ONLY, per_host=JSONLD_PER_HOST, workers=JSONLD_WORKERS):
+        self.http = http
+        self.store = JsonStateStore(path)
+        self.max_bytes = max_bytes
+        self.head_only = head_only
+        self.per_host = per_host
+        self.workers = workers
+        self._host_slots = {}
+        self._slots_lock = threading.Lock()
+
+    def has_jobposting(self, url: str) -> bool:
+        cached = self._cached(url)
+        if cached is not None:
+            return cached
+        host = urlparse(url).netloc
+        with self._slot(host):
+            verdict = self._scan(url)
+        if verdict is not None:
+            self.store.set(url, {"ok": verdict, "checked_at": datetime.utcnow().isoformat()})
+        return bool(verdict)
+
+    def check_many(self, urls, wrap=None):
+        """Verdicts aligned with `urls`, fetched concurrently (per-host capped).
+
+        wrap(fn) -> fn, if given, wraps the per-URL check run on pool
+        threads (the scraper uses it to carry its per-company log over).
+        """
+        urls = list(urls)
+        if len(urls) <= 1 or self.workers <= 1:
+            return [self.has_jobposting(u) for u in urls]
+        check = wrap(self.has_jobposting) if wrap else self.has_jobposting
+        with ThreadPoolExecutor(max_workers=min(self.workers, len(urls))) as pool:
+            return list(pool.map(check, urls))
+
+    def save(self):
+        now = datetime.utcnow()
+        self.store.prune(lambda _url, entry: self._fresh(entry, now))
+        self.store.save()
+
+    def _fresh(self, entry, now):
+        try:
+            age = now - datetime.fromisoformat(entry.get("checked_at", ""))
+        except Exception:
+            return False
+        ttl = JSONLD_VERDICT_TTL_DAYS if entry.get("ok") else JSONLD_NEGATIVE_TTL_DAYS
+        return age < timedelta(days=ttl)
+
+    def _cached(self, url):
+        entry = self.store.get(url)
+        if entry and self._fresh(entry, datetime.utcnow()):
+            return bool(entry.get("ok"))
+        return None
+
+    def _slot(self, host):
+        with self._slots_lock:
+            if host not in self._host_slots:
+                self._host_slots[host] = threading.Semaphore(self.per_host)
+            return self._host_slots[host]
+
+    def _scan(self, url):
+        """True/False, or None when no verdict can be cached: the fetch failed,
+        or reading stopped before the end of the document with nothing found."""
+        try:
+            r = self.http.get(url, headers=HEADERS, timeout=10, stream=True)
+        except Exception:
+            return None
+        try:
+            if r.status_code != 200:
+                return False
+            decoder = codecs.getincrementaldecoder(r.encoding or "utf-8")(errors="replace")
+            text = ""
+            pos = 0  # scripts before this offset were already checked
+            read = 0
+            for chunk in r.iter_content(chunk_size=8192):
+                read += len(chunk)
+                text += decoder.decode(chunk)
+                for match in _LD_SCRIPT_RE.finditer(text, pos):
+                    if jobpostings_from_ld(match.group(1)):
+                        return True
+                    pos = match.end()
+                if self.head_only and _HEAD_END_RE.search(text, pos):
+                    return None  # nothing in <head>; <body> was not read
+                if read >= self.max_bytes:
+                    return None
+            return False
+        except Exception:
+            return None
+        finally:
+            r.close()
@@ -0,0 +1,139 @@
+# link_classifier.py
+# ----------------------------------
+# One-pass job-link candidate matching
+# ----------------------------------
+
+import re
+
+# The CSS subset used by scrape_generic's selector list:
+#   tag.class[attr*='value'] and "ancestor descendant" (one combinator).
+_COMPOUND_RE = re.compile(r"^([a-zA-Z][a-zA-Z0-9-]*)?((?:\.[\w-]+|\[[^\]]+\])*)$")
+_PART_RE = re.compile(r"\.([\w-]+)|\[([\w-]+)(?:([*^$]?=)\s*(['\"])(.*?)\4)?\]")
+
+
+def _attr_value(tag, attr):
+    value = tag.get(attr)
+    if isinstance(value, list):  # multi-valued attributes (class) as soupsieve sees them
+        return " ".join(value)
+    return value
+
+
+class _Compound:
+    """tag + classes + attribute conditions, matched case-sensitively like soupsieve on HTML."""
+
+    __slots__ = ("name", "classes", "attrs")
+
+    def __init__(self, text):
+        m = _COMPOUND_RE.match(text)
+        if not m:
+            raise ValueError(f"unsupported selector: {text!r}")
+        self.name = (m.group(1) or "").lower() or None
+        self.classes = []
+        self.attrs = []
+        for cls, attr, op, _, value in _PART_RE.findall(m.group(2)):
+            if cls:
+                self.classes.append(cls)
+            else:
+                self.attrs.append((attr.lower(), op or None, value))
+
+    def matches(self, tag):
+        if self.name and tag.name != self.name:
+            return False
+        if self.classes:
+            have = tag.get("class") or []
+            if any(c not in have for c in self.classes):
+                return False
+        for attr, op, expected in self.attrs:
+            value = _attr_value(tag, attr)
+            if value is None:
+                return False
+            if op == "*=" and (not expected or expected not in value):
+                return False
+            if op == "^=" and (not expected or not value.startswith(expected)):
+                return False
+            if op == "$=" and (not expected or not value.endswith(expected)):
+                return False
+            if op == "=" and value != expected:
+                return False
+        return True
+
+
+class LinkClassifier:
+    """Evaluates a list of link selectors in a single walk over the <a> tags.
+
+    candidates(soup) returns exactly what this loop produces:
+
+        for sel in selectors:
+            for a in soup.select(sel):
+                if a.get("href") and not seen: keep a
+
+    i.e. anchors ordered by (first matching selector, document position),
+    deduplicated by href. Selectors are compiled once; every rule's last
+    compound must target <a>.
+    """
+
+    def __init__(self, selectors):
+        self.selectors = list(selectors)
+        self.rules = []        # (anchor compound, ancestor bit or 0)
+        ancestors = []
+        for sel in self.selectors:
+            parts = sel.split()
+            if len(parts) > 2:
+                raise ValueError(f"unsupported selector: {sel!r}")
+            anchor = _Compound(parts[-1])
+            if anchor.name != "a":
+                raise ValueError(f"selector must target <a>: {sel!r}")
+            bit = 0
+            if len(parts) == 2:
+                bit = 1 << len(ancestors)
+                ancestors.append(_Compound(parts[0]))
+            self.rules.append((anchor, bit))
+        self.ancestors = ancestors
+
+    def _ancestor_mask(self, tag, memo):
+        """Bits of ancestor compounds matched by any element above `tag`."""
+        chain = []
+        node = tag.parent
+        while node is not None and id(node) not in memo:
+            chain.append(node)
+            node = node.parent
+        mask = memo[id(node)] if node is not None else 0
+        for node in reversed(chain):
+            if node.name and node.name != "[document]":
+                for i, compound in enumerate(self.ancestors):
+                    if compound.matches(node):
+                        mask |= 1 << i
+            memo[id(node)] = mask
+        return mask
+
+    def rank(self, tag, memo):
+        """Index of the first selector matching `tag`, or None."""
+        mask = None
+        for i, (anchor, bit) in enumerate(self.rules):
+            if not anchor.matches(tag):
+                continue
+            if bit:
+                if mask is None:
+                    mask = self._ancestor_mask(tag, memo)
+                if not mask & bit:
+                    continue
+            return i
+        return None
+
+    def candidates(self, soup):
+        memo = {}
+        ranked = []
+        for position, a in enumerate(soup.find_all("a")):
+            rank = self.rank(a, memo)
+            if rank is not None:
+                ranked.append((rank, position, a))
+        ranked.sort(key=lambda item: (item[0], item[1]))
+
+        links = []
+        seen = set()
+        for _, _, a in ranked:
+            href = a.get("href", "")
+            if href and href not in seen:
+                seen.add(href)
+                links.append(a)
+        return links
@@ -1,10 +1,99 @@
 # requirements_extractor.py
 # Extracts key requirements from job descriptions WITHOUT storing full text
 
+import os
 import re
-import requests
-from bs4 import BeautifulSoup
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from functools import partial
+from html_parsing import parse_html
 from typing import Dict, List, Set
+from http_client import HttpClient
+from skill_matcher import RequirementsMatcher
+
+EXTRACT_WORKERS = int(os.getenv("EXTRACT_WORKERS", "0"))  # 0 = one process per core
+EXTRACT_CHUNK_SIZE = int(os.getenv("EXTRACT_CHUNK_SIZE", "16"))  # documents per pool task
+EXTRACT_POOL_MIN_BATCH = int(os.getenv("EXTRACT_POOL_MIN_BATCH", "32"))  # smaller batches stay in-process
+FETCH_WORKERS = int(os.getenv("FETCH_WORKERS", "8"))
+_FETCH_HEADERS = {'User-Agent': 'Mozilla/5.0 (compatible; JobScraper/1.0)'}
+
+_worker_extractors = {}  # per process: extractor class -> instance
+
+
+def _looks_like_html(content: str) -> bool:
+    head = content[:2000].lstrip().lower()
+    return head.startswith("<") or "<html" in head or "<body" in head or "<div" in head
+
+
+def extract_document(extractor_cls, content):
+    """Pool worker (module level so it pickles): requirements for one document."""
+    extractor = _worker_extractors.get(extractor_cls)
+    if extractor is None:
+        extractor = _worker_extractors[extractor_cls] = extractor_cls(http=None)
+    if not content:
+        return extractor._empty_requirements()
+    try:
+        if _looks_like_html(content):
+            content = parse_html(content).get_text()
+        return extractor.extract_from_text(content)
+    except Exception:
+        return extractor._empty_requirements()
+
+
+def extract_batch(extractor_cls, items, workers=None, chunksize=EXTRACT_CHUNK_SIZE):
+    """[(job_id, requirements)] for [(job_id, html or text)], in input order.
+
+    Extraction is CPU-bound (HTML-to-text + matching), so large batches are
+    spread over a process pool in chunks of `chunksize`; small ones, or
+    workers=1, run in-process. extractor_cls must be importable by
+    module path (RequirementsExtractor here or in scraper.py).
+    """
+    items = list(items)
+    job_ids = [job_id for job_id, _ in items]
+    contents = [content for _, content in items]
+    worker = partial(extract_document, extractor_cls)
+    workers = workers or EXTRACT_WORKERS or os.cpu_count() or 1
+
+    if workers <= 1 or len(items) < EXTRACT_POOL_MIN_BATCH:
+        return list(zip(job_ids, map(worker, contents)))
+    try:
+        with ProcessPoolExecutor(max_workers=min(workers, len(items))) as pool:
+            results = list(pool.map(worker, contents, chunksize=max(1, chunksize)))
+    except Exception as e:
+        print(f"  ⚠ Extraction pool failed ({e}), extracting in-process")
+        results = list(map(worker, contents))
+    return list(zip(job_ids, results))
+
+
+def fetch_page(http, url, timeout=10):
+    """Job page HTML, or None when the fetch fails or is not a 200."""
+    if not url:
+        return None
+    try:
+        r = http.get(url, headers=_FETCH_HEADERS, timeout=timeout)
+        return r.text if r.status_code == 200 else None
+    except Exception:
+        return None
+
+
+def fetch_pages(http, urls, workers=FETCH_WORKERS, timeout=10, on_fetched=None):
+    """fetch_page for each url, in input order, on threads.
+
+    on_fetched(done, index, html), if given, runs on the calling thread as
+    each fetch completes (done counts completed fetches so far).
+    """
+    urls = list(urls)
+    if not urls:
+        return []
+    pages = [None] * len(urls)
+    with ThreadPoolExecutor(max_workers=max(1, min(workers, len(urls)))) as pool:
+        futures = {pool.submit(fetch_page, http, url, timeout): i for i, url in enumerate(urls)}
+        for done, future in enumerate(as_completed(futures), start=1):
+            i = futures[future]
+            pages[i] = future.result()
+            if on_fetched:
+                on_fetched(done, i, pages[i])
+    return pages
+
 
 class RequirementsExtractor:
     """Extracts structured requirements from job postings"""
@@ -28,15 +117,42 @@ class RequirementsExtractor:
         r'minimum\s+(\d+)\s+years?',
         r'at\s+least\s+(\d+)\s+years?'
     ]
+    # Literal each EXP_PATTERNS entry needs besides "year"/"yr" (same order)
+    EXP_ANCHORS = ['exp', 'exp', 'minimum', 'least']
+    YEAR_ANCHORS = ['year', 'yr']
+    _EXP_REGEXES = [re.compile(p, re.IGNORECASE) for p in EXP_PATTERNS]
     
+    EDUCATION_LEVELS = {
+        'phd': ['ph\\.?d', 'doctorate', 'doctoral'],
+        'masters': ['master', 'msc', 'mba', 'm\\.s\\.'],
+        'bachelors': ['bachelor', 'bsc', 'b\\.s\\.', 'b\\.a\\.', 'undergraduate']
+    }
+    
+    _matcher = None  # RequirementsMatcher, built once per class
+    
+    def __init__(self, http: HttpClient = None):
+        # Pooled, per-host rate-limited fetches (see http_client.py);
+        # created on first use so pool workers never open one
+        self._http = http
+
+    @property
+    def http(self) -> HttpClient:
+        if self._http is None:
+            self._http = HttpClient()
+        return self._http
+
+    def extract_many(self, items, workers=None, chunksize=EXTRACT_CHUNK_SIZE) -> List:
+        """[(job_id, requirements)] for [(job_id, html or text)], in input order (see extract_batch)"""
+        return extract_batch(type(self), items, workers=workers, chunksize=chunksize)
+
     def extract_from_url(self, url, timeout=10):
         """Fetch job page and extract requirements"""
         try:
             headers = {
                 'User-Agent': 'Mozilla/5.0 (compatible; JobScraper/1.0)'
             }
-            r = requests.get(url, headers=headers, timeout=timeout)
-            soup = BeautifulSoup(r.text, 'html.parser')
+            r = self.http.get(url, headers=headers, timeout=timeout)
+            soup = parse_html(r.text)
             
             # Get text content
             text = soup.get_text()
@@ -61,14 +177,15 @@ class RequirementsExtractor:
         
         text_lower = text.lower()
         
-        # Extract skills
-        skills = self._extract_skills(text_lower)
+        # Skills, education and experience anchors in one pass
+        hits = self._get_matcher().scan(text_lower)
+        skills = hits['skills']
         
         # Extract experience
-        experience = self._extract_experience(text_lower)
+        experience = self._extract_experience(text_lower, hits['anchors'])
         
         # Extract education
-        education = self._extract_education(text_lower)
+        education = hits['education']
         
         # Extract general keywords
         keywords = self._extract_keywords(text)
@@ -80,23 +197,24 @@ class RequirementsExtractor:
             'keywords': keywords[:15]  # Top 15 keywords
         }
     
-    def _extract_skills(self, text: str) -> Set[str]:
-        """Extract technical skills from text"""
-        found_skills = set()
-        
-        for category, skills in self.TECH_SKILLS.items():
-            for skill in skills:
-                # Use word boundaries to avoid false matches
-                pattern = r'\b' + skill + r'\b'
-                if re.search(pattern, text, re.IGNORECASE):
-                    found_skills.add(skill.replace('\\', ''))
-        
-        return found_skills
+    @classmethod
+    def _get_matcher(cls) -> RequirementsMatcher:
+        """Compiled skill/education/anchor automaton (plus data/skill_taxonomy.json)"""
+        if cls._matcher is None:
+            cls._matcher = RequirementsMatcher(
+                cls.TECH_SKILLS, cls.EDUCATION_LEVELS,
+                anchors=set(cls.EXP_ANCHORS) | set(cls.YEAR_ANCHORS)
+            )
+        return cls._matcher
     
-    def _extract_experience(self, text: str) -> int:
+    def _extract_experience(self, text: str, anchors: Set[str]) -> int:
         """Extract years of experience required"""
-        for pattern in self.EXP_PATTERNS:
-            match = re.search(pattern, text, re.IGNORECASE)
+        if not anchors.intersection(self.YEAR_ANCHORS):
+            return 0  # every pattern needs "year"/"yr"
+        for regex, anchor in zip(self._EXP_REGEXES, self.EXP_ANCHORS):
+            if anchor not in anchors:
+                continue
+            match = regex.search(text)
             if match:
                 try:
                     years = int(match.group(1))
@@ -106,21 +224,6 @@ class RequirementsExtractor:
                     continue
         return 0  # Default to 0 if not found
     
-    def _extract_education(self, text: str) -> str:
-        """Extract education level"""
-        education_levels = {
-            'phd': ['ph\\.?d', 'doctorate', 'doctoral'],
-            'masters': ['master', 'msc', 'mba', 'm\\.s\\.'],
-            'bachelors': ['bachelor', 'bsc', 'b\\.s\\.', 'b\\.a\\.', 'undergraduate']
-        }
-        
-        for level, patterns in education_levels.items():
-            for pattern in patterns:
-                if re.search(pattern, text, re.IGNORECASE):
-                    return level
-        
-        return 'not_specified'
-    
     def _extract_keywords(self, text: str) -> List[str]:
         """Extract important keywords from requirements sections"""
         
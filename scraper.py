@@ -6,24 +6,88 @@
 # ----------------------------------
 
 # scraper.py - CLEAN VERSION
+import io
 import os
+import sys
 import json
 import re
 import time
 import hashlib
+import threading
 import requests
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from urllib.parse import urlparse, urljoin, unquote
 from bs4 import BeautifulSoup
 from config import HEADERS, TIMEOUT, TOP_COMPANIES, CAREER_PAGES, ASHBY_COMPANIES
+from html_parsing import parse_html, parse_links
 from roles import infer_role
 from scoring import score_job
 from company_registry import get_companies
+from http_client import HttpClient, ConditionalCache
+from ats_detection_cache import AtsDetectionCache
+from state_store import JsonStateStore
+from link_classifier import LinkClassifier
+from skill_matcher import RequirementsMatcher
+from requirements_extracter import extract_batch, EXTRACT_CHUNK_SIZE
+from sitemap_reader import SitemapReader
+from job_ids import stable_job_id, migrate_legacy_id
+from jobposting_validator import JobPostingValidator, jobpostings_from_ld
+from ats_descriptions import (
+    greenhouse_description, lever_description, ashby_description,
+    smartrecruiters_detail_url, workable_detail_url, description_from_detail,
+)
+from ats_fingerprint import match_url, match_content, match_links, LINK_SCAN_LIMIT
+from ats_async import AsyncATSEngine, ASYNC_ATS_FAMILIES, async_engine_available
+from browser_pool import BrowserPool, browser_available, track_pending_requests, wait_for_signal, payloads_ready
+from browser_async import AsyncRenderer, ASYNC_BROWSER, BROWSER_PAGE_CONCURRENCY, async_browser_available
 
 SCRAPE_MODE = "VOLUME"
 EXTRACT_REQUIREMENTS = True  # Reuse existing requirements
 REQUIREMENTS_REUSE_ONLY = True  # Do not fetch new requirements for new jobs
 DARWINBOX_DEBUG = os.getenv("DARWINBOX_DEBUG", "false").lower() in {"1", "true", "yes"}
+DETAIL_API_WORKERS = int(os.getenv("DETAIL_API_WORKERS", "4"))  # SmartRecruiters/Workable detail fetches per board
+SCRAPE_WORKERS = int(os.getenv("SCRAPE_WORKERS", "1"))  # >1 scrapes registry companies concurrently
+ASYNC_ATS = os.getenv("ASYNC_ATS", "false").lower() in {"1", "true", "yes"}  # JSON ATS boards via asyncio
+WORKDAY_RECIPES_FILE = os.getenv("WORKDAY_RECIPES_FILE", "data/workday_recipes.json")
+DARWINBOX_RECIPES_FILE = os.getenv("DARWINBOX_RECIPES_FILE", "data/darwinbox_recipes.json")
+DARWINBOX_RECIPE_TTL_HOURS = int(os.getenv("DARWINBOX_RECIPE_TTL_HOURS", "72"))
+# Only these request headers are written to the (git-committed) recipe file:
+# never cookies, Authorization or x-* session/CSRF tokens.
+DARWINBOX_RECIPE_HEADERS = {"accept", "user-agent", "referer", "origin", "content-type", "accept-language"}
+GENERIC_STRATEGIES_FILE = os.getenv("GENERIC_STRATEGIES_FILE", "data/generic_strategies.json")
+GENERIC_DEMOTE_AFTER = int(os.getenv("GENERIC_DEMOTE_AFTER", "2"))  # zero-yield runs before a stage moves last
+WORKDAY_PAGE_CONCURRENCY = int(os.getenv("WORKDAY_PAGE_CONCURRENCY", "4"))  # per tenant
+WORKDAY_PROBE_FANOUT = int(os.getenv("WORKDAY_PROBE_FANOUT", "6"))  # 1 = strict sequential discovery
+WORKDAY_PAYLOAD_SHAPES = [
+    {"appliedFacets": {}, "limit": 50, "offset": 0, "searchText": ""},
+    {"appliedFacets": {}, "limit": 50, "offset": 0},
+    {"limit": 50, "offset": 0, "searchText": ""},
+    {"limit": 50, "offset": 0},
+]
+
+# scrape_generic cascade, cheapest first (order is learned per company)
+GENERIC_STAGES = ("selectors", "jsonld", "sitemap", "playwright")
+GENERIC_JOB_SELECTORS = [
+    # Class-based
+    "a.job-title", "a.position-title", "a.posting-title", "a.role-title",
+    "a[class*='job']", "a[class*='position']", "a[class*='posting']",
+    "a[class*='opening']", "a[class*='role']", "a[class*='career']",
+    # Href-based
+    "a[href*='/jobs/']", "a[href*='/job/']", "a[href*='/careers/'][href*='job']",
+    "a[href*='/positions/']", "a[href*='/openings/']", "a[href*='/apply']",
+    "a[href*='/role/']", "a[href*='jobId']", "a[href*='position']",
+    # Container-based
+    "div.job a", "div.position a", "li.job a", "li.posting a",
+    "div[class*='job'] a", "div[class*='career'] a"
+]
+GENERIC_SKIP_PATTERNS = [r'^/$', r'^/careers/?$', r'^/jobs/?$',
+                         r'/departments', r'/locations', r'/teams']
+GENERIC_SKIP_WORDS = ["all jobs", "view all", "see all", "departments",
+                      "locations", "browse", "filter by"]
+# Compiled once: one walk over <a> tags instead of a soup.select() per selector
+GENERIC_LINK_CLASSIFIER = LinkClassifier(GENERIC_JOB_SELECTORS)
+GENERIC_SKIP_RE = re.compile("|".join(f"(?:{p})" for p in GENERIC_SKIP_PATTERNS), re.I)
 
 # scraper.py
 # ----------------------------------
@@ -72,13 +136,37 @@ class RequirementsExtractor:
         r'minimum\s+(\d+)\s+years?',
         r'at\s+least\s+(\d+)\s+years?'
     ]
+    EXP_ANCHORS = ['exp', 'exp', 'minimum', 'least']  # besides "year"/"yr", per pattern
+    YEAR_ANCHORS = ['year', 'yr']
+    _EXP_REGEXES = [re.compile(p, re.IGNORECASE) for p in EXP_PATTERNS]
     
+    EDUCATION_LEVELS = {
+        'phd': ['ph\\.?d', 'doctorate', 'doctoral'],
+        'masters': ['master', 'msc', 'mba', 'm\\.s\\.'],
+        'bachelors': ['bachelor', 'bsc', 'b\\.s\\.', 'b\\.a\\.', 'undergraduate']
+    }
+    
+    _matcher = None
+    
+    def __init__(self, http=None):
+        self._http = http  # HttpClient created on first use (pool workers never need one)
+
+    @property
+    def http(self):
+        if self._http is None:
+            self._http = HttpClient()
+        return self._http
+
+    def extract_many(self, items, workers=None, chunksize=EXTRACT_CHUNK_SIZE):
+        """[(job_id, requirements)] for [(job_id, html or text)], in input order"""
+        return extract_batch(type(self), items, workers=workers, chunksize=chunksize)
+
     def extract_from_url(self, url, timeout=8):
         """Fetch job page and extract requirements"""
         try:
             headers = {'User-Agent': 'Mozilla/5.0 (compatible; JobScraper/1.0)'}
-            r = requests.get(url, headers=headers, timeout=timeout)
-            soup = BeautifulSoup(r.text, 'html.parser')
+            r = self.http.get(url, headers=headers, timeout=timeout)
+            soup = parse_html(r.text)
             text = soup.get_text()
             return self.extract_from_text(text)
         except Exception as e:
@@ -91,14 +179,15 @@ class RequirementsExtractor:
         
         text_lower = text.lower()
         
-        # Extract skills
-        skills = self._extract_skills(text_lower)
+        # Skills, education and experience anchors in one pass
+        hits = self._get_matcher().scan(text_lower)
+        skills = hits['skills']
         
         # Extract experience
-        experience = self._extract_experience(text_lower)
+        experience = self._extract_experience(text_lower, hits['anchors'])
         
         # Extract education
-        education = self._extract_education(text_lower)
+        education = hits['education']
         
         # Extract keywords
         keywords = self._extract_keywords(text)
@@ -110,20 +199,24 @@ class RequirementsExtractor:
             'keywords': keywords[:15]
         }
     
-    def _extract_skills(self, text):
-        """Extract technical skills"""
-        found_skills = set()
-        for category, skills in self.TECH_SKILLS.items():
-            for skill in skills:
-                pattern = r'\b' + skill + r'\b'
-                if re.search(pattern, text, re.IGNORECASE):
-                    found_skills.add(skill.replace('\\', ''))
-        return found_skills
+    @classmethod
+    def _get_matcher(cls):
+        """Compiled skill/education/anchor automaton"""
+        if cls._matcher is None:
+            cls._matcher = RequirementsMatcher(
+                cls.TECH_SKILLS, cls.EDUCATION_LEVELS,
+                anchors=set(cls.EXP_ANCHORS) | set(cls.YEAR_ANCHORS)
+            )
+        return cls._matcher
     
-    def _extract_experience(self, text):
+    def _extract_experience(self, text, anchors):
         """Extract years of experience"""
-        for pattern in self.EXP_PATTERNS:
-            match = re.search(pattern, text, re.IGNORECASE)
+        if not anchors.intersection(self.YEAR_ANCHORS):
+            return 0
+        for regex, anchor in zip(self._EXP_REGEXES, self.EXP_ANCHORS):
+            if anchor not in anchors:
+                continue
+            match = regex.search(text)
             if match:
                 try:
                     years = int(match.group(1))
@@ -133,20 +226,6 @@ class RequirementsExtractor:
                     continue
         return 0
     
-    def _extract_education(self, text):
-        """Extract education level"""
-        education_levels = {
-            'phd': ['ph\\.?d', 'doctorate', 'doctoral'],
-            'masters': ['master', 'msc', 'mba', 'm\\.s\\.'],
-            'bachelors': ['bachelor', 'bsc', 'b\\.s\\.', 'b\\.a\\.', 'undergraduate']
-        }
-        
-        for level, patterns in education_levels.items():
-            for pattern in patterns:
-                if re.search(pattern, text, re.IGNORECASE):
-                    return level
-        return 'not_specified'
-    
     def _extract_keywords(self, text):
         """Extract important keywords"""
         keywords = set()
@@ -182,6 +261,26 @@ class RequirementsExtractor:
         }
 
 
+class _ThreadLogRouter:
+    """sys.stdout stand-in: company worker threads print into their own buffer."""
+
+    def __init__(self, stream, local):
+        self._stream = stream
+        self._local = local
+
+    def _target(self):
+        return getattr(self._local, "log", None) or self._stream
+
+    def write(self, text):
+        return self._target().write(text)
+
+    def flush(self):
+        self._target().flush()
+
+    def __getattr__(self, name):
+        return getattr(self._stream, name)
+
+
 # ===================================================================
 # JOB SCRAPER (your existing code continues below)
 # ===================================================================
@@ -193,11 +292,24 @@ class JobScraper:
         self.seen = set()
         self.stats = {}
         self.company_results = {}
-        self.req_extractor = RequirementsExtractor()
+        self._lock = threading.RLock()  # guards jobs/seen/stats/company_results
+        self._local = threading.local()  # per-worker job buffer + log
+        self.http = HttpClient()
+        self.browser = BrowserPool()  # launched on first JS-rendered source
+        self.http_cache = ConditionalCache()
+        self.ats_cache = AtsDetectionCache()
+        self.workday_recipes = JsonStateStore(WORKDAY_RECIPES_FILE)  # tenant -> winning CXS call
+        self.darwinbox_recipes = JsonStateStore(DARWINBOX_RECIPES_FILE)  # tenant -> API calls (no credentials)
+        self.generic_strategies = JsonStateStore(GENERIC_STRATEGIES_FILE)  # company -> winning stage + misses
+        self.sitemaps = SitemapReader(self.http)
+        self.jobposting = JobPostingValidator(self.http)  # url -> cached JobPosting verdict
+        self.req_extractor = RequirementsExtractor(http=self.http)
         self.existing_jobs = {}  # NEW: Store existing jobs by ID
+        self.saved_jobs = {}  # last run's jobs by ID (304 board replays)
         self.requirements_fetched = 0  # NEW: Counter for tracking
         self.requirements_reused = 0   # NEW: Counter for tracking
         self.requirements_skipped = 0  # NEW: Counter for tracking
+        self.requirements_harvested = 0  # extracted from ATS API descriptions
         self.source_health_path = SOURCE_HEALTH_FILE
         self.source_health = self._load_source_health()
         
@@ -295,12 +407,26 @@ class JobScraper:
                     existing = json.load(f)
                     
                 # Store jobs by ID for quick lookup
+                migrated = 0
+                empty = self.req_extractor._empty_requirements()
                 for job in existing:
                     job_id = job.get("id")
-                    if job_id and job.get("requirements"):
-                        self.existing_jobs[job_id] = job.get("requirements")
+                    if job_id:
+                        self.saved_jobs[job_id] = job
+                    requirements = job.get("requirements")
+                    # Placeholders stamped under REQUIREMENTS_REUSE_ONLY count as missing,
+                    # so an ATS description can still fill them in
+                    if job_id and requirements and requirements != empty:
+                        self.existing_jobs[job_id] = requirements
+                        # IDs saved before stable_job_id: index under the new ID too
+                        new_id = migrate_legacy_id(job)
+                        if new_id:
+                            self.existing_jobs[new_id] = requirements
+                            migrated += 1
                 
-                print(f"\n✓ Loaded {len(self.existing_jobs)} existing jobs with requirements")
+                print(f"\n✓ Loaded {len(self.existing_jobs) - migrated} existing jobs with requirements")
+                if migrated:
+                    print(f"  ({migrated} legacy IDs mapped to stable IDs)")
             except Exception as e:
                 print(f"\n⚠ Could not load existing jobs: {e}")
 
@@ -308,6 +434,16 @@ class JobScraper:
         return datetime.utcnow().isoformat()
 
     def add(self, job):
+        # Inside a company worker, jobs are buffered and committed later in
+        # registry order (see scrape_companies).
+        buffer = getattr(self._local, "buffer", None)
+        if buffer is not None:
+            buffer.append(job)
+            return
+        with self._lock:
+            self._commit(job)
+
+    def _commit(self, job):
         link = job.get("applyLink")
         if not link:
             return
@@ -316,6 +452,9 @@ class JobScraper:
         if normalized_link in self.seen:
             return
     
+        # Transient: description text harvested from an ATS payload (never saved)
+        description = job.pop("_description", None)
+
         job["role"] = infer_role(job.get("title"))
         job["score"] = score_job(job)
         job["fetchedAt"] = self.now()
@@ -329,6 +468,10 @@ class JobScraper:
                 # REUSE existing requirements
                 job["requirements"] = self.existing_jobs[job_id]
                 self.requirements_reused += 1
+            elif description:
+                # EXTRACT from the ATS payload: no page fetch needed
+                job["requirements"] = self.req_extractor.extract_from_text(description)
+                self.requirements_harvested += 1
             else:
                 if REQUIREMENTS_REUSE_ONLY:
                     # Skip fetching new requirements for new jobs
@@ -342,6 +485,7 @@ class JobScraper:
                     self.requirements_fetched += 1
         else:
             job["requirements"] = self.req_extractor._empty_requirements()
+        job.pop("_detail_api", None)
     
         self.seen.add(normalized_link)
         self.jobs.append(job)
@@ -360,7 +504,7 @@ class JobScraper:
                 url += f"?category={cat}"
 
             try:
-                r = requests.get(url, headers=HEADERS, timeout=10)
+                r = self.http.get(url, headers=HEADERS, timeout=10)
                 data = r.json().get("jobs", [])
                 label = "all" if not cat else cat
                 print(f"  Category '{label}': {len(data)} jobs")
@@ -380,97 +524,70 @@ class JobScraper:
         
         # METHOD 2: Use Playwright with stealth
         try:
-            from playwright.sync_api import sync_playwright
+            if not browser_available():
+                raise ImportError("playwright")
             
             print("  Trying Playwright with stealth mode...")
-            
-            with sync_playwright() as p:
-                # Launch with more realistic browser settings
-                browser = p.chromium.launch(
-                    headless=True,
-                    args=[
-                        "--no-sandbox",
-                        "--disable-dev-shm-usage",
-                        "--disable-blink-features=AutomationControlled"
-                    ]
-                )
-                
-                context = browser.new_context(
-                    user_agent="Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-                    viewport={"width": 1920, "height": 1080},
-                    locale="en-US",
-                    timezone_id="America/New_York"
-                )
-                
-                # Add extra headers to avoid detection
-                context.set_extra_http_headers({
-                    "Accept-Language": "en-US,en;q=0.9",
-                    "sec-ch-ua": '"Not_A Brand";v="8", "Chromium";v="120"',
-                    "sec-ch-ua-mobile": "?0",
-                    "sec-ch-ua-platform": '"macOS"'
-                })
-                
-                page = context.new_page()
-                
+
+            def render(page):
                 # Go to jobs page
                 page.goto("https://wellfound.com/jobs", wait_until="domcontentloaded", timeout=30000)
                 
                 # Scroll to load lazy content
                 page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-                page.wait_for_timeout(3000)
-                
-                # Get page content
-                content = page.content()
-                soup = BeautifulSoup(content, "html.parser")
-                
-                # Find all links
-                all_links = soup.find_all("a", href=True)
+                wait_for_signal(page, 5000, selector="a[href*='/jobs/']")
+                return page.content()
+
+            # Shared browser, realistic context (UA, viewport, locale, extra headers)
+            content = self.browser.run(render, profile="stealth")
+            soup = parse_links(content)
+            
+            # Find all links
+            all_links = soup.find_all("a", href=True)
                 
-                valid_jobs = []
-                seen_urls = set()
+            valid_jobs = []
+            seen_urls = set()
                 
-                for link in all_links:
-                    href = link.get("href", "")
-                    title = link.get_text(strip=True)
+            for link in all_links:
+                href = link.get("href", "")
+                title = link.get_text(strip=True)
                     
-                    # Must be a job link
-                    if not any(path in href for path in ['/jobs/', '/companies/', '/role/']):
-                        continue
+                # Must be a job link
+                if not any(path in href for path in ['/jobs/', '/companies/', '/role/']):
+                    continue
                     
-                    # Must have title
-                    if not title or len(title) < 5 or len(title) > 100:
-                        continue
+                # Must have title
+                if not title or len(title) < 5 or len(title) > 100:
+                    continue
                     
-                    # Skip navigation
-                    skip_words = ["sign up", "log in", "see all", "view all", "browse", "filter"]
-                    if any(w in title.lower() for w in skip_words):
-                        continue
+                # Skip navigation
+                skip_words = ["sign up", "log in", "see all", "view all", "browse", "filter"]
+                if any(w in title.lower() for w in skip_words):
+                    continue
                     
-                    # Build full URL
-                    full_url = href if href.startswith("http") else f"https://wellfound.com{href}"
+                # Build full URL
+                full_url = href if href.startswith("http") else f"https://wellfound.com{href}"
                     
-                    if full_url in seen_urls:
-                        continue
+                if full_url in seen_urls:
+                    continue
                     
-                    seen_urls.add(full_url)
-                    valid_jobs.append((full_url, title))
-                
-                browser.close()
+                seen_urls.add(full_url)
+                valid_jobs.append((full_url, title))
                 
-                if valid_jobs:
-                    print(f"  ✓ Wellfound (Playwright): {len(valid_jobs)} jobs")
+            if valid_jobs:
+                print(f"  ✓ Wellfound (Playwright): {len(valid_jobs)} jobs")
                     
-                    for url, title in valid_jobs:
-                        self.add({
-                            "id": f"wellfound_{hash(url)}",
-                            "title": title,
-                            "company": "Startup (Wellfound)",
-                            "location": "Remote / Hybrid",
-                            "source": "Wellfound",
-                            "applyLink": url,
-                            "postedDate": self.now(),
-                        })
-                    return
+                for url, title in valid_jobs:
+                    self.add({
+                        "id": stable_job_id("wellfound", url),
+                        "title": title,
+                        "company": "Startup (Wellfound)",
+                        "location": "Remote / Hybrid",
+                        "source": "Wellfound",
+                        "applyLink": url,
+                        "postedDate": self.now(),
+                    })
+                return
                 
         except ImportError:
             print("  ⚠ Playwright not installed")
@@ -495,7 +612,7 @@ class JobScraper:
             label = "main" if tag is None else tag
     
             try:
-                r = requests.get(url, headers=headers, timeout=6)
+                r = self.http.get(url, headers=headers, timeout=6)
                 if r.status_code != 200:
                     print(f"  ⚠ {label}: HTTP {r.status_code}")
                     continue
@@ -545,7 +662,7 @@ class JobScraper:
                 url = f"{base}/{cat}" + (f"?page={page}" if page > 1 else "")
     
                 try:
-                    r = requests.get(url, headers=headers, timeout=6)
+                    r = self.http.get(url, headers=headers, timeout=6)
                     if r.status_code != 200:
                         print(f"  ⚠ Page {page}: HTTP {r.status_code}")
                         break
@@ -554,7 +671,7 @@ class JobScraper:
                         print("  ⚠ RSS detected, stopping")
                         break
     
-                    soup = BeautifulSoup(r.text, "html.parser")
+                    soup = parse_html(r.text)
                     cards = soup.select("li.feature")
     
                     if not cards:
@@ -571,7 +688,7 @@ class JobScraper:
                             continue
     
                         self.add({
-                            "id": f"wwr_{hash(link['href'])}",
+                            "id": stable_job_id("wwr", "https://weworkremotely.com" + link["href"]),
                             "title": title.get_text(strip=True),
                             "company": company.get_text(strip=True),
                             "location": "Remote",
@@ -594,48 +711,37 @@ class JobScraper:
 
     def scrape_yc(self):
         print("\n[Y Combinator – Playwright]")
-        try:
-            from playwright.sync_api import sync_playwright
-        except ImportError:
+        if not browser_available():
             print("  ⚠ Playwright not installed, skipping YC")
             return
     
         url = "https://www.ycombinator.com/jobs"
+
+        def render(page):
+            page.goto(url, wait_until="domcontentloaded", timeout=30_000)
+            wait_for_signal(page, 5000, selector="a[href^='/jobs/']")
+            return [
+                (a.get_attribute("href"), a.inner_text().strip())
+                for a in page.query_selector_all("a[href^='/jobs/']")
+            ]
     
         try:
-            with sync_playwright() as p:
-                browser = p.chromium.launch(headless=True, 
-                    args=["--no-sandbox", "--disable-dev-shm-usage"])
-                context = browser.new_context(
-                    user_agent="Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
-                             "AppleWebKit/537.36 (KHTML, like Gecko) "
-                             "Chrome/120.0.0.0 Safari/537.36"
-                )
-                page = context.new_page()
-                page.goto(url, timeout=30_000)
-                page.wait_for_timeout(3000)
-    
-                links = page.query_selector_all("a[href^='/jobs/']")
-                print(f"  Job links found: {len(links)}")
-    
-                for a in links:
-                    href = a.get_attribute("href")
-                    title = a.inner_text().strip()
-                    if not href or not title:
-                        continue
+            links = self.browser.run(render, profile="stealth", routes="listing")
+            print(f"  Job links found: {len(links)}")
     
-                    self.add({
-                        "id": f"yc_{hash(href)}",
-                        "title": title,
-                        "company": "YC Startup",
-                        "location": "Various",
-                        "source": "YCombinator",
-                        "applyLink": "https://www.ycombinator.com" + href,
-                        "postedDate": self.now(),
-                    })
+            for href, title in links:
+                if not href or not title:
+                    continue
     
-                context.close()
-                browser.close()
+                self.add({
+                    "id": stable_job_id("yc", "https://www.ycombinator.com" + href),
+                    "title": title,
+                    "company": "YC Startup",
+                    "location": "Various",
+                    "source": "YCombinator",
+                    "applyLink": "https://www.ycombinator.com" + href,
+                    "postedDate": self.now(),
+                })
         except Exception as e:
             print(f"  ❌ YC Playwright failed: {e}")
 
@@ -649,8 +755,8 @@ class JobScraper:
 
         for path in paths:
             url = f"{base}/{path}"
-            r = requests.get(url, headers=HEADERS, timeout=TIMEOUT)
-            soup = BeautifulSoup(r.text, "html.parser")
+            r = self.http.get(url, headers=HEADERS, timeout=TIMEOUT)
+            soup = parse_html(r.text)
             cards = soup.select("div.individual_internship")
             print(f"{path}: {len(cards)} cards")
 
@@ -662,7 +768,7 @@ class JobScraper:
                     continue
 
                 self.add({
-                    "id": f"internshala_{hash(link['href'])}",
+                    "id": stable_job_id("internshala", base + link["href"]),
                     "title": title.get_text(strip=True),
                     "company": company.get_text(strip=True),
                     "location": "India",
@@ -675,79 +781,43 @@ class JobScraper:
     # ENHANCED COMPANY SCRAPING WITH AUTO-DETECTION
     # ===================================================================
 
-    def detect_ats_system(self, url):
+    def detect_ats_system(self, url, use_cache=True):
         """Smart ATS detection - returns (ats_type, slug, final_url)"""
-        headers = {**HEADERS, "Accept": "text/html,application/xhtml+xml"}
-        
+        if use_cache:
+            cached = self.ats_cache.get(url)
+            if cached:
+                return cached
+
         try:
-            r = requests.get(url, headers=headers, timeout=10, allow_redirects=True)
-            final_url = r.url
-            content_lower = r.text.lower()
-            
-            # Direct URL matches
-            url_checks = [
-                (r'boards?\.greenhouse\.io/(?:embed/job_board\?for=)?([^/?&]+)', "greenhouse"),
-                (r'jobs?\.lever\.co/([^/?&]+)', "lever"),
-                (r'(?:jobs\.)?ashbyhq\.com/([^/?&]+)', "ashby"),
-                (r'careers\.smartrecruiters\.com/([^/?&]+)', "smartrecruiters"),
-                (r'jobs\.smartrecruiters\.com/([^/?&]+)', "smartrecruiters"),
-                (r'apply\.workable\.com/([^/?&]+)', "workable"),
-                (r'careers\.kula\.ai/([^/?&]+)', "kula"),
-                (r'([^.]+)\.darwinbox\.in/.*/careers', "darwinbox"),
-                (r'([a-z0-9-]+\.wd\d+\.myworkdayjobs\.com(?:/[^?#]*)?)', "workday"),
-                (r'([a-z0-9-]+\.myworkdayjobs\.com(?:/[^?#]*)?)', "workday"),
-                (r'(wday/cxs/[^/]+/[^/]+(?:/[a-z]{2}(?:-[A-Z]{2})?)?/jobs)', "workday"),
-            ]
-            
-            for pattern, ats_name in url_checks:
-                match = re.search(pattern, final_url, re.I)
-                if match:
-                    if ats_name == "workday":
-                        return ("workday", None, final_url)
-                    return (ats_name, match.group(1), final_url)
-            
-            # Content-based detection (embedded ATS)
-            content_checks = [
-                (r'boards?\.greenhouse\.io/(?:embed/job_board\?for=)?([^"\'&<>]+)', "greenhouse"),
-                (r'jobs?\.lever\.co/([^"\'&/<>]+)', "lever"),
-                (r'jobs\.ashbyhq\.com/([^"\'&/<>]+)', "ashby"),
-                (r'careers\.smartrecruiters\.com/([^"\'&/<>]+)', "smartrecruiters"),
-                (r'jobs\.smartrecruiters\.com/([^"\'&/<>]+)', "smartrecruiters"),
-                (r'apply\.workable\.com/([^"\'&/<>]+)', "workable"),
-                (r'careers\.kula\.ai/([^"\'&/<>]+)', "kula"),
-                (r'([^.]+)\.darwinbox\.in/.*/careers', "darwinbox"),
-                (r'([a-z0-9-]+\.wd\d+\.myworkdayjobs\.com(?:/[^"\'\s<>]*)?)', "workday"),
-                (r'([a-z0-9-]+\.myworkdayjobs\.com(?:/[^"\'\s<>]*)?)', "workday"),
-                (r'(wday/cxs/[^/]+/[^/]+(?:/[a-z]{2}(?:-[A-Z]{2})?)?/jobs)', "workday"),
-            ]
-            
-            for pattern, ats_name in content_checks:
-                match = re.search(pattern, r.text[:15000])
-                if match:
-                    slug = match.group(1).strip()
-                    # Clean slug
-                    slug = re.sub(r'["\'\s].*$', '', slug)
-                    if ats_name == "workday":
-                        return ("workday", None, final_url)
-                    return (ats_name, slug, final_url)
-            
-            # Link-based detection
-            soup = BeautifulSoup(r.text, "html.parser")
-            for link in soup.find_all('a', href=True, limit=100):
-                href = link.get('href', '')
-                for pattern, ats_name in url_checks:
-                    match = re.search(pattern, href, re.I)
-                    if match:
-                        if ats_name == "workday":
-                            return ("workday", None, final_url)
-                        return (ats_name, match.group(1), final_url)
-            
-            return ("generic", None, final_url)
-            
+            result = self._detect_ats_uncached(url)
         except Exception as e:
             print(f"  ⚠ Detection error: {e}")
             return ("generic", None, url)
 
+        self.ats_cache.put(url, *result)
+        return result
+
+    def _detect_ats_uncached(self, url):
+        headers = {**HEADERS, "Accept": "text/html,application/xhtml+xml"}
+
+        r = self.http.get(url, headers=headers, timeout=10, allow_redirects=True)
+        final_url = r.url
+        
+        # Direct URL match, then embedded boards, then the first 100 links
+        hit = match_url(final_url)
+        if not hit:
+            # An error page says nothing about the ATS; raising keeps it out of the cache
+            r.raise_for_status()
+            hit = match_content(r.text)
+        if not hit:
+            soup = parse_links(r.text)
+            hit = match_links(link.get('href', '') for link in soup.find_all('a', href=True, limit=LINK_SCAN_LIMIT))
+        if hit:
+            ats_name, slug = hit
+            return (ats_name, slug, final_url)
+        
+        return ("generic", None, final_url)
+
     def _is_probable_job_url(self, href: str) -> bool:
         if not href:
             return False
@@ -793,45 +863,11 @@ class JobScraper:
     def _extract_jobposting_jsonld(self, soup: BeautifulSoup):
         jobs = []
         for script in soup.find_all("script", type="application/ld+json"):
-            try:
-                data = json.loads(script.string or "{}")
-            except Exception:
-                continue
-
-            payloads = []
-            if isinstance(data, list):
-                payloads = data
-            elif isinstance(data, dict):
-                payloads = [data]
-
-            for item in payloads:
-                if not isinstance(item, dict):
-                    continue
-                if item.get("@type") != "JobPosting":
-                    continue
-                title = item.get("title", "")
-                url = item.get("url", "")
-                location = ""
-                loc = item.get("jobLocation")
-                if isinstance(loc, dict):
-                    location = loc.get("address", {}).get("addressLocality", "")
-                elif isinstance(loc, list) and loc:
-                    loc0 = loc[0]
-                    if isinstance(loc0, dict):
-                        location = loc0.get("address", {}).get("addressLocality", "")
-                if url and title:
-                    jobs.append((title, url, location or "Various"))
+            jobs.extend(jobpostings_from_ld(script.string))
         return jobs
 
     def _url_has_jobposting(self, url: str) -> bool:
-        try:
-            r = requests.get(url, headers=HEADERS, timeout=10)
-            if r.status_code != 200:
-                return False
-            soup = BeautifulSoup(r.text, "html.parser")
-            return len(self._extract_jobposting_jsonld(soup)) > 0
-        except Exception:
-            return False
+        return self.jobposting.has_jobposting(url)
 
     def _extract_darwinbox_jobs(self, payload, career_url):
         results = []
@@ -1043,7 +1079,7 @@ class JobScraper:
             return jobs
 
         try:
-            soup = BeautifulSoup(html_text, "html.parser")
+            soup = parse_html(html_text)  # full tree: find_parent() below
         except Exception:
             return jobs
 
@@ -1099,7 +1135,7 @@ class JobScraper:
 
     def _validate_kula_job_detail(self, full_url: str, slug: str):
         try:
-            r = requests.get(full_url, headers=HEADERS, timeout=12, allow_redirects=True)
+            r = self.http.get(full_url, headers=HEADERS, timeout=12, allow_redirects=True)
             if r.status_code != 200:
                 return None
 
@@ -1110,7 +1146,7 @@ class JobScraper:
             if path == root_path:
                 return None
 
-            soup = BeautifulSoup(r.text, "html.parser")
+            soup = parse_html(r.text)
             title = ""
             h1 = soup.find("h1")
             if h1:
@@ -1139,93 +1175,162 @@ class JobScraper:
             return None
 
     def _find_job_urls_in_sitemap(self, base_url: str, limit: int = 50):
-        sitemap_urls = []
-        parsed = urlparse(base_url)
-        if not parsed.scheme or not parsed.netloc:
-            return sitemap_urls
-
-        candidates = [
-            f"{parsed.scheme}://{parsed.netloc}/sitemap.xml",
-            f"{parsed.scheme}://{parsed.netloc}/sitemap_index.xml",
+        return self.sitemaps.job_urls(base_url, self._is_probable_job_url, limit)
+
+    def _raw_board_count(self, data):
+        if isinstance(data, list):
+            return len(data)
+        if isinstance(data, dict):
+            for key in ("jobs", "content", "results"):
+                if isinstance(data.get(key), list):
+                    return len(data[key])
+        return 0
+
+    def _replay_cached_board(self, url):
+        """Jobs parsed on the last 200 for `url` (after a 304), or None.
+
+        The cache only holds job IDs; the jobs come back from last run's
+        data/jobs.json. IDs missing there were dropped as duplicates when
+        they were first added. If none are found the caller refetches.
+        """
+        cached = self.http_cache.replay(url)
+        if cached is None:
+            return None
+        ids, raw_count = cached
+        jobs = [dict(self.saved_jobs[job_id]) for job_id in ids if job_id in self.saved_jobs]
+        if ids and not jobs:
+            return None
+        now = self.now()
+        for job in jobs:
+            job["postedDate"] = now
+        return jobs, raw_count
+
+    def _remember_board(self, url, response_headers, jobs, data):
+        # Only IDs are cached: the jobs themselves are saved in data/jobs.json
+        ids = [job["id"] for job in jobs if job.get("id")]
+        self.http_cache.remember(url, response_headers, ids, self._raw_board_count(data))
+
+    def _fetch_board(self, url, headers, parse, timeout=10):
+        """Conditional GET of a JSON job board.
+
+        Returns (status, jobs, raw_count). A 304 replays the jobs parsed on
+        the last 200 and reports status 200; any other non-200 gives jobs=None.
+        """
+        r = self.http.get(url, headers={**headers, **self.http_cache.validators(url)}, timeout=timeout)
+        if r.status_code == 304:
+            cached = self._replay_cached_board(url)
+            if cached is not None:
+                print("  ↺ Not modified since last run (cached)")
+                return 200, cached[0], cached[1]
+            r = self.http.get(url, headers=headers, timeout=timeout)
+        if r.status_code != 200:
+            return r.status_code, None, 0
+
+        data = r.json()
+        jobs = parse(data)
+        self._remember_board(url, r.headers, jobs, data)
+        return 200, jobs, self._raw_board_count(data)
+
+    def _fetch_detail_description(self, url):
+        """Description text from a SmartRecruiters/Workable detail API ('' on failure)."""
+        try:
+            r = self.http.get(url, headers={**HEADERS, "Accept": "application/json"}, timeout=10)
+            return description_from_detail(url, r.json()) if r.status_code == 200 else ""
+        except Exception:
+            return ""
+
+    def _harvest_detail_descriptions(self, jobs):
+        """Fill _description from the detail API for postings that still need requirements.
+
+        SmartRecruiters and Workable listings carry no description, so new
+        postings get one detail call each (DETAIL_API_WORKERS at a time);
+        postings whose requirements are already known are not fetched.
+        """
+        if not EXTRACT_REQUIREMENTS:
+            return
+        pending = [
+            job for job in jobs
+            if job.get("_detail_api") and not job.get("_description")
+            and job.get("id") not in self.existing_jobs
+        ]
+        if not pending:
+            return
+        fetch = self._in_company_context(self._fetch_detail_description)
+        with ThreadPoolExecutor(max_workers=max(1, min(DETAIL_API_WORKERS, len(pending)))) as pool:
+            texts = list(pool.map(fetch, [job["_detail_api"] for job in pending]))
+        found = 0
+        for job, text in zip(pending, texts):
+            if text:
+                job["_description"] = text
+                found += 1
+        print(f"  📄 Detail API descriptions: {found}/{len(pending)} new postings")
+
+    def _greenhouse_api_request(self, slug):
+        return (
+            f"https://boards-api.greenhouse.io/v1/boards/{slug}/jobs?content=true",
+            {**HEADERS, "Accept": "application/json"},
+        )
+
+    def _parse_greenhouse_jobs(self, company_name, slug, data):
+        """Greenhouse board payload -> job dicts (SMART validation)"""
+        jobs = data.get("jobs", []) if isinstance(data, dict) else []
+
+        # Filter ONLY standalone career pages (not real job titles)
+        # These are NEVER real jobs:
+        standalone_pages = [
+            "careers home", "career page", "careers page",
+            "home page", "about us page", "culture page",
+            "benefits page", "university page", "teams page",
+            "how we operate", "code of conduct", "our values"
         ]
+        single_word_excludes = ["home", "careers", "about", "culture", "benefits", "teams", "university"]
 
-        for sitemap_url in candidates:
-            try:
-                r = requests.get(sitemap_url, headers=HEADERS, timeout=10)
-                if r.status_code != 200:
-                    continue
-                soup = BeautifulSoup(r.text, "xml")
-                loc_tags = soup.find_all("loc")
-                for loc in loc_tags:
-                    href = (loc.get_text() or "").strip()
-                    if not href:
-                        continue
-                    if self._is_probable_job_url(href):
-                        sitemap_urls.append(href)
-                        if len(sitemap_urls) >= limit:
-                            return sitemap_urls
-            except Exception:
+        results = []
+        for j in jobs:
+            title = j.get("title", "")
+            abs_url = j.get("absolute_url", "")
+            job_id = j.get("id", "")
+
+            # Must have all required fields
+            if not title or not abs_url or not job_id:
+                continue
+
+            title_lower = title.lower().strip()
+
+            # Skip if title is EXACTLY one of these pages
+            if title_lower in standalone_pages:
+                continue
+
+            # Skip if title is just "home", "careers", "about" (single word)
+            if title_lower in single_word_excludes:
                 continue
 
-        return sitemap_urls
+            # Everything else is likely a real job
+            results.append({
+                "id": f"gh_{slug}_{job_id}",
+                "title": title,
+                "company": company_name,
+                "location": (j.get("location") or {}).get("name", "Various"),
+                "source": f"{company_name} (Greenhouse)",
+                "applyLink": abs_url,
+                "postedDate": self.now(),
+                "_description": greenhouse_description(j),
+            })
+        return results
 
     def scrape_greenhouse_api(self, company_name, slug):
         """Try Greenhouse API endpoint with SMART validation"""
-        url = f"https://boards-api.greenhouse.io/v1/boards/{slug}/jobs"
-        headers = {**HEADERS, "Accept": "application/json"}
-        
+        url, headers = self._greenhouse_api_request(slug)
+
         try:
-            r = requests.get(url, headers=headers, timeout=10)
-            if r.status_code == 200:
-                data = r.json()
-                jobs = data.get("jobs", [])
-                
-                # SMART VALIDATION - Only filter obvious non-jobs
-                valid_jobs = []
-                for j in jobs:
-                    title = j.get("title", "")
-                    abs_url = j.get("absolute_url", "")
-                    job_id = j.get("id", "")
-                    
-                    # Must have all required fields
-                    if not title or not abs_url or not job_id:
-                        continue
-                    
-                    # Filter ONLY standalone career pages (not real job titles)
-                    # These are NEVER real jobs:
-                    standalone_pages = [
-                        "careers home", "career page", "careers page",
-                        "home page", "about us page", "culture page",
-                        "benefits page", "university page", "teams page",
-                        "how we operate", "code of conduct", "our values"
-                    ]
-                    
-                    title_lower = title.lower().strip()
-                    
-                    # Skip if title is EXACTLY one of these pages
-                    if title_lower in standalone_pages:
-                        continue
-                    
-                    # Skip if title is just "home", "careers", "about" (single word)
-                    single_word_excludes = ["home", "careers", "about", "culture", "benefits", "teams", "university"]
-                    if title_lower in single_word_excludes:
-                        continue
-                    
-                    # Everything else is likely a real job
-                    valid_jobs.append(j)
-                
-                print(f"  ✓ Greenhouse API: {len(valid_jobs)} jobs (filtered {len(jobs) - len(valid_jobs)} non-jobs)")
-                
-                for j in valid_jobs:
-                    self.add({
-                        "id": f"gh_{slug}_{j.get('id')}",
-                        "title": j.get("title", ""),
-                        "company": company_name,
-                        "location": j.get("location", {}).get("name", "Various"),
-                        "source": f"{company_name} (Greenhouse)",
-                        "applyLink": j.get("absolute_url", ""),
-                        "postedDate": self.now(),
-                    })
+            status, valid_jobs, total = self._fetch_board(
+                url, headers, lambda data: self._parse_greenhouse_jobs(company_name, slug, data)
+            )
+            if status == 200:
+                print(f"  ✓ Greenhouse API: {len(valid_jobs)} jobs (filtered {total - len(valid_jobs)} non-jobs)")
+
+                for job in valid_jobs:
+                    self.add(job)
                 return True
             return False
         except:
@@ -1243,16 +1348,16 @@ class JobScraper:
         headers = {**HEADERS, "Accept": "text/html"}
         
         try:
-            r = requests.get(url, headers=headers, timeout=10)
+            r = self.http.get(url, headers=headers, timeout=10)
             if r.status_code != 200:
                 # Try without embed
                 url = f"https://boards.greenhouse.io/{slug}"
-                r = requests.get(url, headers=headers, timeout=10)
+                r = self.http.get(url, headers=headers, timeout=10)
                 if r.status_code != 200:
                     print(f"  ⚠ HTTP {r.status_code}")
                     return
             
-            soup = BeautifulSoup(r.text, "html.parser")
+            soup = parse_html(r.text)
             
             # Find ALL links that contain /jobs/ followed by numbers
             valid_jobs = []
@@ -1331,38 +1436,50 @@ class JobScraper:
     
 
             
+    def _lever_api_request(self, slug):
+        return (
+            f"https://api.lever.co/v0/postings/{slug}?mode=json",
+            {**HEADERS, "Accept": "application/json"},
+        )
+
+    def _parse_lever_jobs(self, company_name, slug, data):
+        """Lever postings payload -> job dicts"""
+        if not isinstance(data, list):
+            return []
+        return [{
+            "id": f"lever_{slug}_{j['id']}" if j.get("id") else stable_job_id(f"lever_{slug}", j.get("hostedUrl", "")),
+            "title": j.get("text", ""),
+            "company": company_name,
+            "location": j.get("categories", {}).get("location", "Various"),
+            "source": f"{company_name} (Lever)",
+            "applyLink": j.get("hostedUrl", ""),
+            "postedDate": self.now(),
+            "_description": lever_description(j),
+        } for j in data]
+
     def scrape_lever(self, company_name, slug):
         """Enhanced Lever scraper with better detection"""
         
         # Try API first
-        api_url = f"https://api.lever.co/v0/postings/{slug}?mode=json"
-        headers = {**HEADERS, "Accept": "application/json"}
+        api_url, headers = self._lever_api_request(slug)
         
         try:
-            r = requests.get(api_url, headers=headers, timeout=10)
-            if r.status_code == 200:
-                try:
-                    jobs = r.json()
-                    if isinstance(jobs, list) and len(jobs) > 0:
-                        print(f"  ✓ Lever API: {len(jobs)} jobs")
-                        for j in jobs:
-                            self.add({
-                                "id": f"lever_{slug}_{j.get('id', hash(j.get('text', '')))}",
-                                "title": j.get("text", ""),
-                                "company": company_name,
-                                "location": j.get("categories", {}).get("location", "Various"),
-                                "source": f"{company_name} (Lever)",
-                                "applyLink": j.get("hostedUrl", ""),
-                                "postedDate": self.now(),
-                            })
-                        return
-                except:
-                    pass
+            try:
+                status, jobs, _ = self._fetch_board(
+                    api_url, headers, lambda data: self._parse_lever_jobs(company_name, slug, data)
+                )
+                if status == 200 and jobs:
+                    print(f"  ✓ Lever API: {len(jobs)} jobs")
+                    for job in jobs:
+                        self.add(job)
+                    return
+            except:
+                pass
             
             # Fallback to HTML scraping
             html_url = f"https://jobs.lever.co/{slug}"
-            r = requests.get(html_url, headers={**HEADERS, "Accept": "text/html"}, timeout=10)
-            soup = BeautifulSoup(r.text, "html.parser")
+            r = self.http.get(html_url, headers={**HEADERS, "Accept": "text/html"}, timeout=10)
+            soup = parse_html(r.text)
             
             # Multiple strategies for finding jobs
             all_links = []
@@ -1408,7 +1525,7 @@ class JobScraper:
                 full_url = href if href.startswith("http") else f"https://jobs.lever.co{href}"
                 
                 self.add({
-                    "id": f"lever_{slug}_{hash(href)}",
+                    "id": stable_job_id(f"lever_{slug}", full_url),
                     "title": title,
                     "company": company_name,
                     "location": "Various",
@@ -1420,62 +1537,67 @@ class JobScraper:
         except Exception as e:
             print(f"  ❌ Lever: {e}")
             
+    def _ashby_api_request(self, slug):
+        return (
+            f"https://api.ashbyhq.com/posting-api/job-board/{slug}",
+            {
+                **HEADERS,
+                "Accept": "application/json",
+                "Origin": "https://jobs.ashbyhq.com",
+                "Referer": f"https://jobs.ashbyhq.com/{slug}"
+            },
+        )
+
+    def _parse_ashby_jobs(self, company_name, slug, data):
+        """Ashby job-board payload -> job dicts (SMART validation)"""
+        jobs = data.get("jobs", []) if isinstance(data, dict) else []
+        standalone_pages = [
+            "all positions", "view all positions", "careers home",
+            "about us", "privacy policy", "terms of service"
+        ]
+
+        results = []
+        for j in jobs:
+            job_id = j.get("id", "")
+            title = j.get("title", "")
+
+            if not job_id or not title:
+                continue
+
+            # Filter ONLY obvious non-jobs
+            if title.lower().strip() in standalone_pages:
+                continue
+
+            loc = j.get("location", {})
+            location = loc.get("name", "Various") if isinstance(loc, dict) else "Various"
+
+            results.append({
+                "id": f"ashby_{slug}_{job_id}",
+                "title": title,
+                "company": company_name,
+                "location": location,
+                "source": f"{company_name} (Ashby)",
+                "applyLink": f"https://jobs.ashbyhq.com/{slug}/{job_id}",
+                "postedDate": self.now(),
+                "_description": ashby_description(j),
+            })
+        return results
+
     def scrape_ashby(self, company_name, slug):
         """Ashby scraper with SMART validation"""
         print(f"  Attempting Ashby scrape for: {slug}")
         
-        api_url = f"https://api.ashbyhq.com/posting-api/job-board/{slug}"
-        headers = {
-            **HEADERS,
-            "Accept": "application/json",
-            "Origin": "https://jobs.ashbyhq.com",
-            "Referer": f"https://jobs.ashbyhq.com/{slug}"
-        }
+        api_url, headers = self._ashby_api_request(slug)
         
         try:
-            r = requests.get(api_url, headers=headers, timeout=15)
-            if r.status_code == 200:
-                data = r.json()
-                jobs = data.get("jobs", [])
-                
-                # SMART VALIDATION
-                valid_jobs = []
-                for j in jobs:
-                    job_id = j.get("id", "")
-                    title = j.get("title", "")
-                    
-                    if not job_id or not title:
-                        continue
-                    
-                    # Filter ONLY obvious non-jobs
-                    title_lower = title.lower().strip()
-                    
-                    standalone_pages = [
-                        "all positions", "view all positions", "careers home",
-                        "about us", "privacy policy", "terms of service"
-                    ]
-                    
-                    if title_lower in standalone_pages:
-                        continue
-                    
-                    # Everything else is valid
-                    valid_jobs.append(j)
-                
-                print(f"  ✓ Ashby API: {len(valid_jobs)} jobs (filtered {len(jobs) - len(valid_jobs)} non-jobs)")
+            status, valid_jobs, total = self._fetch_board(
+                api_url, headers, lambda data: self._parse_ashby_jobs(company_name, slug, data), timeout=15
+            )
+            if status == 200:
+                print(f"  ✓ Ashby API: {len(valid_jobs)} jobs (filtered {total - len(valid_jobs)} non-jobs)")
                 
-                for j in valid_jobs:
-                    loc = j.get("location", {})
-                    location = loc.get("name", "Various") if isinstance(loc, dict) else "Various"
-                    
-                    self.add({
-                        "id": f"ashby_{slug}_{j.get('id')}",
-                        "title": j.get("title"),
-                        "company": company_name,
-                        "location": location,
-                        "source": f"{company_name} (Ashby)",
-                        "applyLink": f"https://jobs.ashbyhq.com/{slug}/{j.get('id')}",
-                        "postedDate": self.now(),
-                    })
+                for job in valid_jobs:
+                    self.add(job)
                 return
         except Exception as e:
             print(f"  ⚠ Ashby API failed: {e}")
@@ -1499,7 +1621,6 @@ class JobScraper:
             
             try:
                 self.scrape_ashby(name, slug)
-                time.sleep(0.5)
             except Exception as e:
                 print(f"  ❌ Error: {e}")
 
@@ -1507,82 +1628,112 @@ class JobScraper:
     # CUSTOM & ADDITIONAL ATS SCRAPERS
     # ===================================================================
 
+    def _smartrecruiters_api_request(self, slug):
+        return (
+            f"https://api.smartrecruiters.com/v1/companies/{slug}/postings",
+            {**HEADERS, "Accept": "application/json"},
+        )
+
+    def _parse_smartrecruiters_jobs(self, company_name, slug, data):
+        """SmartRecruiters postings payload -> job dicts"""
+        jobs = data.get("content", []) if isinstance(data, dict) else []
+        results = []
+        for j in jobs:
+            job_id = j.get("id")
+            title = j.get("name") or j.get("title", "")
+            location = j.get("location", {}).get("city", "Various")
+            apply_url = j.get("applyUrl") or j.get("companyJobUrl") or ""
+            if not apply_url:
+                # Build public posting URL
+                if job_id:
+                    apply_url = f"https://jobs.smartrecruiters.com/{slug}/{job_id}"
+            # Avoid API URLs as apply links
+            if apply_url and "api.smartrecruiters.com" in apply_url:
+                apply_url = ""
+
+            if not job_id or not title:
+                continue
+
+            results.append({
+                "id": f"sr_{slug}_{job_id}",
+                "title": title,
+                "company": company_name,
+                "location": location or "Various",
+                "source": f"{company_name} (SmartRecruiters)",
+                "applyLink": apply_url,
+                "postedDate": self.now(),
+                "_detail_api": smartrecruiters_detail_url(slug, job_id),
+            })
+        return results
+
     def scrape_smartrecruiters(self, company_name, slug):
         """SmartRecruiters scraper using public API"""
-        api_url = f"https://api.smartrecruiters.com/v1/companies/{slug}/postings"
-        headers = {**HEADERS, "Accept": "application/json"}
+        api_url, headers = self._smartrecruiters_api_request(slug)
 
         try:
-            r = requests.get(api_url, headers=headers, timeout=10)
-            if r.status_code != 200:
-                print(f"  ⚠ SmartRecruiters HTTP {r.status_code}")
+            status, jobs, total = self._fetch_board(
+                api_url, headers, lambda data: self._parse_smartrecruiters_jobs(company_name, slug, data)
+            )
+            if status != 200:
+                print(f"  ⚠ SmartRecruiters HTTP {status}")
                 return
 
-            data = r.json()
-            jobs = data.get("content", []) if isinstance(data, dict) else []
-            print(f"  ✓ SmartRecruiters: {len(jobs)} jobs")
-
-            for j in jobs:
-                job_id = j.get("id")
-                title = j.get("name") or j.get("title", "")
-                location = j.get("location", {}).get("city", "Various")
-                apply_url = j.get("applyUrl") or j.get("companyJobUrl") or ""
-                if not apply_url:
-                    # Build public posting URL
-                    if job_id:
-                        apply_url = f"https://jobs.smartrecruiters.com/{slug}/{job_id}"
-                # Avoid API URLs as apply links
-                if apply_url and "api.smartrecruiters.com" in apply_url:
-                    apply_url = ""
-
-                if not job_id or not title:
-                    continue
+            print(f"  ✓ SmartRecruiters: {total} jobs")
+            self._harvest_detail_descriptions(jobs)
 
-                self.add({
-                    "id": f"sr_{slug}_{job_id}",
-                    "title": title,
-                    "company": company_name,
-                    "location": location or "Various",
-                    "source": f"{company_name} (SmartRecruiters)",
-                    "applyLink": apply_url,
-                    "postedDate": self.now(),
-                })
+            for job in jobs:
+                self.add(job)
         except Exception as e:
             print(f"  ❌ SmartRecruiters: {e}")
 
+    def _workable_api_request(self, slug):
+        return (
+            f"https://apply.workable.com/{slug}/api/v1/jobs",
+            {**HEADERS, "Accept": "application/json"},
+        )
+
+    def _parse_workable_jobs(self, company_name, slug, data):
+        """Workable job board payload -> job dicts"""
+        jobs = data.get("results", []) if isinstance(data, dict) else []
+        results = []
+        for j in jobs:
+            job_id = j.get("shortcode") or j.get("id")
+            title = j.get("title", "")
+            location = (j.get("location") or {}).get("city") or j.get("location", "")
+            apply_url = j.get("application_url") or j.get("url")
+
+            if not job_id or not title:
+                continue
+
+            results.append({
+                "id": f"workable_{slug}_{job_id}",
+                "title": title,
+                "company": company_name,
+                "location": location or "Various",
+                "source": f"{company_name} (Workable)",
+                "applyLink": apply_url,
+                "postedDate": self.now(),
+                "_detail_api": workable_detail_url(slug, j["shortcode"]) if j.get("shortcode") else None,
+            })
+        return results
+
     def scrape_workable(self, company_name, slug):
         """Workable scraper using public job board JSON"""
-        api_url = f"https://apply.workable.com/{slug}/api/v1/jobs"
-        headers = {**HEADERS, "Accept": "application/json"}
+        api_url, headers = self._workable_api_request(slug)
 
         try:
-            r = requests.get(api_url, headers=headers, timeout=10)
-            if r.status_code != 200:
-                print(f"  ⚠ Workable HTTP {r.status_code}")
+            status, jobs, total = self._fetch_board(
+                api_url, headers, lambda data: self._parse_workable_jobs(company_name, slug, data)
+            )
+            if status != 200:
+                print(f"  ⚠ Workable HTTP {status}")
                 return
 
-            data = r.json()
-            jobs = data.get("results", []) if isinstance(data, dict) else []
-            print(f"  ✓ Workable: {len(jobs)} jobs")
-
-            for j in jobs:
-                job_id = j.get("shortcode") or j.get("id")
-                title = j.get("title", "")
-                location = (j.get("location") or {}).get("city") or j.get("location", "")
-                apply_url = j.get("application_url") or j.get("url")
-
-                if not job_id or not title:
-                    continue
+            print(f"  ✓ Workable: {total} jobs")
+            self._harvest_detail_descriptions(jobs)
 
-                self.add({
-                    "id": f"workable_{slug}_{job_id}",
-                    "title": title,
-                    "company": company_name,
-                    "location": location or "Various",
-                    "source": f"{company_name} (Workable)",
-                    "applyLink": apply_url,
-                    "postedDate": self.now(),
-                })
+            for job in jobs:
+                self.add(job)
         except Exception as e:
             print(f"  ❌ Workable: {e}")
 
@@ -1607,7 +1758,7 @@ class JobScraper:
 
             for candidate in slug_candidates:
                 candidate_url = f"https://careers.kula.ai/{candidate}"
-                r = requests.get(candidate_url, headers=headers, timeout=10)
+                r = self.http.get(candidate_url, headers=headers, timeout=10)
                 last_status = r.status_code
                 if r.status_code == 200:
                     active_slug = candidate
@@ -1620,7 +1771,7 @@ class JobScraper:
             if active_slug != slug:
                 print(f"  ↪ Kula slug fallback: {slug} -> {active_slug}")
 
-            soup = BeautifulSoup(r.text, "html.parser")
+            soup = parse_links(r.text)
             candidates = []
             seen = set()
             slug_markers = {
@@ -1677,12 +1828,12 @@ class JobScraper:
         base = "https://brainstormforce.com"
 
         try:
-            r = requests.get(url, headers=headers, timeout=10)
+            r = self.http.get(url, headers=headers, timeout=10)
             if r.status_code != 200:
                 print(f"  ⚠ Brainstorm Force HTTP {r.status_code}")
                 return
 
-            soup = BeautifulSoup(r.text, "html.parser")
+            soup = parse_html(r.text)
             valid = []
             seen = set()
 
@@ -1734,24 +1885,22 @@ class JobScraper:
         headers = {**HEADERS, "Accept": "text/html"}
 
         try:
-            r = requests.get(url, headers=headers, timeout=10)
+            r = self.http.get(url, headers=headers, timeout=10)
             if r.status_code != 200:
                 print(f"  ⚠ rtCamp HTTP {r.status_code}, trying Playwright...")
                 try:
-                    from playwright.sync_api import sync_playwright
-                    with sync_playwright() as p:
-                        browser = p.chromium.launch(headless=True, args=["--no-sandbox"])
-                        page = browser.new_page()
+                    def render(page):
                         page.goto(url, wait_until="domcontentloaded", timeout=30000)
-                        page.wait_for_timeout(2000)
-                        content = page.content()
-                        browser.close()
-                    soup = BeautifulSoup(content, "html.parser")
+                        wait_for_signal(page, 5000, selector="a[href*='/job/']")
+                        return page.content()
+
+                    content = self.browser.run(render, routes="listing")
+                    soup = parse_html(content)
                 except Exception as e:
                     print(f"  ⚠ rtCamp Playwright failed: {e}")
                     return
             else:
-                soup = BeautifulSoup(r.text, "html.parser")
+                soup = parse_html(r.text)
 
             valid = []
             seen = set()
@@ -1780,7 +1929,7 @@ class JobScraper:
             print(f"  ✓ rtCamp: {len(valid)} jobs")
             for title, full_url in valid:
                 self.add({
-                    "id": f"rtcamp_{hash(full_url)}",
+                    "id": stable_job_id("rtcamp", full_url),
                     "title": title,
                     "company": company_name,
                     "location": "Remote",
@@ -1791,29 +1940,150 @@ class JobScraper:
         except Exception as e:
             print(f"  ❌ rtCamp: {e}")
 
-    def scrape_workday(self, company_name, career_url):
-        """Workday scraper with endpoint discovery + multi-pattern API calls"""
-        try:
-            landing = requests.get(career_url, headers=HEADERS, timeout=12, allow_redirects=True)
-            final_url = landing.url
-            host = urlparse(final_url).netloc
+    def _workday_request_page(self, recipe, offset, headers, limit=50):
+        """One CXS page for a recipe (endpoint, method, payload_shape).
 
-            all_jobs = []
-            seen_urls = set()
-            attempt_logs = []
-            payload_shapes = [
-                {"appliedFacets": {}, "limit": 50, "offset": 0, "searchText": ""},
-                {"appliedFacets": {}, "limit": 50, "offset": 0},
-                {"limit": 50, "offset": 0, "searchText": ""},
-                {"limit": 50, "offset": 0},
-            ]
+        Returns (data, None) on a JSON 200, else (None, log line).
+        """
+        api_url = recipe["endpoint"]
+        method = recipe["method"]
+        try:
+            if method == "POST":
+                payload = dict(recipe.get("payload_shape") or {})
+                payload["offset"] = offset
+                payload["limit"] = limit
+                resp = self.http.post(
+                    api_url, headers={**headers, "Content-Type": "application/json"}, json=payload, timeout=15
+                )
+            else:
+                resp = self.http.get(api_url, headers=headers, params={"limit": limit, "offset": offset}, timeout=15)
+        except Exception as e:
+            return None, f"{method} {api_url} error: {e}"
+        if resp.status_code != 200:
+            return None, f"{method} {api_url} -> {resp.status_code}"
+        try:
+            return resp.json(), None
+        except Exception:
+            return None, f"{method} {api_url} -> non-json"
+
+    def _workday_probe_recipes(self, endpoints):
+        for api_url in endpoints:
+            for shape in WORKDAY_PAYLOAD_SHAPES:
+                yield {"endpoint": api_url, "method": "POST", "payload_shape": shape}
+            yield {"endpoint": api_url, "method": "GET", "payload_shape": None}
+
+    def _probe_workday_recipe(self, recipe, headers):
+        """First page for a candidate recipe: (data, None) if it has postings, else (None, log)."""
+        data, log = self._workday_request_page(recipe, 0, headers)
+        if data is None:
+            return None, log
+        if not self._extract_workday_postings(data):
+            return None, f"{recipe['method']} {recipe['endpoint']} -> 200 empty offset=0"
+        return data, None
+
+    def _discover_workday_recipe(self, endpoints, headers, attempt_logs):
+        """First (recipe, first_page) whose first page has postings, else (None, None)."""
+        probes = list(self._workday_probe_recipes(endpoints))
+        if WORKDAY_PROBE_FANOUT > 1:
+            return self._race_workday_recipes(probes, headers, attempt_logs)
+
+        for recipe in probes:
+            data, log = self._probe_workday_recipe(recipe, headers)
+            if data is not None:
+                return recipe, data
+            attempt_logs.append(log)
+        return None, None
+
+    def _race_workday_recipes(self, probes, headers, attempt_logs):
+        """Fire probes with bounded fan-out; the first non-empty first page wins."""
+        pool = ThreadPoolExecutor(max_workers=WORKDAY_PROBE_FANOUT)
+        probe = self._in_company_context(self._probe_workday_recipe)
+        futures = {pool.submit(probe, recipe, headers): recipe for recipe in probes}
+        try:
+            for future in as_completed(futures):
+                data, log = future.result()
+                if data is not None:
+                    return futures[future], data
+                attempt_logs.append(log)
+        finally:
+            # Drop probes that have not started; in-flight ones finish in the background.
+            pool.shutdown(wait=False, cancel_futures=True)
+        return None, None
+
+    def _paginate_workday(self, recipe, first_page, headers, attempt_logs, add_posting, limit=50, max_pages=25):
+        total = first_page.get("total") if isinstance(first_page, dict) else None
+        if isinstance(total, int) and total > 0:
+            self._paginate_workday_concurrent(
+                recipe, first_page, total, headers, attempt_logs, add_posting, limit, max_pages
+            )
+            return
 
-            def add_workday_posting(title, ext_path, location, job_id=""):
-                if not ext_path or not title:
-                    return
-                apply_url = ext_path if ext_path.startswith("http") else urljoin(f"https://{host}", ext_path)
+        data, offset, pages = first_page, 0, 0
+        while data is not None and pages < max_pages:
+            pages += 1
+            postings = self._extract_workday_postings(data)
+            if not postings:
+                break
+            added = 0
+            for posting in postings:
+                added += add_posting(
+                    posting.get("title", ""),
+                    posting.get("externalPath", ""),
+                    posting.get("location", "Various"),
+                    posting.get("job_id", ""),
+                )
+            if not added:
+                break
+            offset += limit
+            data, log = self._workday_request_page(recipe, offset, headers, limit)
+            if log:
+                attempt_logs.append(log)
+
+    def _paginate_workday_concurrent(self, recipe, first_page, total, headers, attempt_logs, add_posting,
+                                     limit=50, max_pages=25):
+        """The first CXS page reports `total`; fetch the remaining offsets in parallel."""
+        offsets = list(range(limit, min(total, max_pages * limit), limit))
+        pages = [first_page]
+        if offsets:
+            with ThreadPoolExecutor(max_workers=max(1, WORKDAY_PAGE_CONCURRENCY)) as pool:
+                fetch_page = self._in_company_context(
+                    lambda off: self._workday_request_page(recipe, off, headers, limit)
+                )
+                results = pool.map(fetch_page, offsets)
+                for data, log in results:
+                    if log:
+                        attempt_logs.append(log)
+                    pages.append(data)
+
+        # Merge in offset order so job order matches a sequential walk.
+        for data in pages:
+            if data is None:
+                continue
+            for posting in self._extract_workday_postings(data):
+                add_posting(
+                    posting.get("title", ""),
+                    posting.get("externalPath", ""),
+                    posting.get("location", "Various"),
+                    posting.get("job_id", ""),
+                )
+
+    def scrape_workday(self, company_name, career_url):
+        """Workday scraper with endpoint discovery + multi-pattern API calls"""
+        try:
+            landing = self.http.get(career_url, headers=HEADERS, timeout=12, allow_redirects=True)
+            final_url = landing.url
+            host = urlparse(final_url).netloc
+
+            all_jobs = []
+            seen_urls = set()
+            attempt_logs = []
+
+            def add_workday_posting(title, ext_path, location, job_id=""):
+                if not ext_path or not title:
+                    return False
+                apply_url = ext_path if ext_path.startswith("http") else urljoin(f"https://{host}", ext_path)
                 if apply_url in seen_urls:
-                    return
+                    return False
                 seen_urls.add(apply_url)
                 resolved_job_id = job_id or hashlib.md5(apply_url.encode("utf-8")).hexdigest()[:16]
                 all_jobs.append({
@@ -1825,6 +2095,7 @@ class JobScraper:
                     "applyLink": apply_url,
                     "postedDate": self.now(),
                 })
+                return True
 
             # 1) HTML fallback (some Workday boards render jobs server-side)
             for posting in self._extract_workday_jobs_from_html(landing.text, final_url):
@@ -1835,108 +2106,45 @@ class JobScraper:
                     posting.get("job_id", ""),
                 )
 
-            # 2) API discovery + multi-pattern payloads
-            endpoints = self._discover_workday_api_urls(career_url, final_url, landing.text)
-            if endpoints:
-                for api_url in endpoints[:16]:
-                    got_any = False
-                    for method in ("POST", "GET"):
-                        offset = 0
-                        limit = 50
-                        pages = 0
-                        while pages < 25:
-                            pages += 1
-                            headers = {
-                                **HEADERS,
-                                "Accept": "application/json",
-                                "Referer": final_url,
-                                "Origin": f"https://{host}",
-                            }
-
-                            resp = None
-                            if method == "POST":
-                                headers["Content-Type"] = "application/json"
-                                for shape in payload_shapes:
-                                    payload = dict(shape)
-                                    payload["offset"] = offset
-                                    payload["limit"] = limit
-                                    try:
-                                        resp = requests.post(api_url, headers=headers, json=payload, timeout=15)
-                                    except Exception as e:
-                                        attempt_logs.append(f"POST {api_url} error: {e}")
-                                        resp = None
-                                        continue
-                                    if resp.status_code == 200:
-                                        break
-                                    attempt_logs.append(f"POST {api_url} -> {resp.status_code}")
-                                    resp = None
-                                if resp is None:
-                                    break
-                            else:
-                                try:
-                                    resp = requests.get(api_url, headers=headers, params={"limit": limit, "offset": offset}, timeout=15)
-                                except Exception as e:
-                                    attempt_logs.append(f"GET {api_url} error: {e}")
-                                    break
-                                if resp.status_code != 200:
-                                    attempt_logs.append(f"GET {api_url} -> {resp.status_code}")
-                                    break
-
-                            try:
-                                data = resp.json()
-                            except Exception:
-                                attempt_logs.append(f"{method} {api_url} -> non-json")
-                                break
-
-                            postings = self._extract_workday_postings(data)
-                            if not postings:
-                                attempt_logs.append(f"{method} {api_url} -> 200 empty offset={offset}")
-                                break
-
-                            got_any = True
-                            before = len(all_jobs)
-                            for posting in postings:
-                                add_workday_posting(
-                                    posting.get("title", ""),
-                                    posting.get("externalPath", ""),
-                                    posting.get("location", "Various"),
-                                    posting.get("job_id", ""),
-                                )
-                            if len(all_jobs) == before:
-                                break
-                            offset += limit
-
-                    if got_any:
-                        break
-
-            # 3) Playwright network fallback for boards that only expose jobs client-side
-            if not all_jobs:
+            # 2) CXS API: cached recipe first, full discovery only if it fails
+            api_headers = {
+                **HEADERS,
+                "Accept": "application/json",
+                "Referer": final_url,
+                "Origin": f"https://{host}",
+            }
+            recipe, first_page = None, None
+            cached = self.workday_recipes.get(career_url)
+            if cached:
+                first_page, log = self._workday_request_page(cached, 0, api_headers)
+                if first_page is not None and self._extract_workday_postings(first_page):
+                    recipe = cached
+                else:
+                    attempt_logs.append(f"cached recipe failed: {log or 'empty'}")
+                    self.workday_recipes.pop(career_url)
+
+            if recipe is None:
+                endpoints = self._discover_workday_api_urls(career_url, final_url, landing.text)
+                recipe, first_page = self._discover_workday_recipe(endpoints[:16], api_headers, attempt_logs)
+                if recipe:
+                    self.workday_recipes.set(career_url, {**recipe, "saved_at": self.now()})
+
+            if recipe:
+                self._paginate_workday(recipe, first_page, api_headers, attempt_logs, add_workday_posting)
+
+            def finish():
+                print(f"  ✓ Workday: {len(all_jobs)} jobs")
+                if not all_jobs and attempt_logs:
+                    for line in attempt_logs[:6]:
+                        print(f"  ⚠ {line}")
+                for job in all_jobs:
+                    self.add(job)
+
+            def on_render(result):
                 try:
-                    from playwright.sync_api import sync_playwright
-                    with sync_playwright() as p:
-                        browser = p.chromium.launch(headless=True, args=["--no-sandbox"])
-                        pw_page = browser.new_page(user_agent=HEADERS.get("User-Agent", "Mozilla/5.0"))
-                        payloads = []
-
-                        def handle_response(resp):
-                            try:
-                                if "wday/cxs" not in (resp.url or ""):
-                                    return
-                                ctype = (resp.headers.get("content-type") or "").lower()
-                                if "application/json" not in ctype:
-                                    return
-                                if resp.status != 200:
-                                    return
-                                payloads.append(resp.json())
-                            except Exception:
-                                return
-
-                        pw_page.on("response", handle_response)
-                        pw_page.goto(final_url, wait_until="domcontentloaded", timeout=60000)
-                        pw_page.wait_for_timeout(4000)
-                        html_after_js = pw_page.content()
-                        browser.close()
-
+                    if isinstance(result, Exception):
+                        raise result
+                    html_after_js, payloads = result
                     for posting in self._extract_workday_jobs_from_html(html_after_js, final_url):
                         add_workday_posting(
                             posting.get("title", ""),
@@ -1954,38 +2162,80 @@ class JobScraper:
                             )
                 except Exception as e:
                     attempt_logs.append(f"playwright fallback error: {e}")
+                finish()
 
-            print(f"  ✓ Workday: {len(all_jobs)} jobs")
-            if not all_jobs and attempt_logs:
-                for line in attempt_logs[:6]:
-                    print(f"  ⚠ {line}")
-            for job in all_jobs:
-                self.add(job)
+            # 3) Playwright network fallback for boards that only expose jobs client-side
+            if all_jobs:
+                finish()
+                return
+
+            request = {"kind": "workday", "url": final_url, "profile": "desktop", "routes": "workday", "cap_ms": 8000,
+                       "has_jobs": self._extract_workday_postings}
+            if self._defer_render(request, on_render):
+                return
+
+            def render(pw_page):
+                payloads = []
+
+                def handle_response(resp):
+                    try:
+                        if "wday/cxs" not in (resp.url or ""):
+                            return
+                        ctype = (resp.headers.get("content-type") or "").lower()
+                        if "application/json" not in ctype:
+                            return
+                        if resp.status != 200:
+                            return
+                        payloads.append(resp.json())
+                    except Exception:
+                        return
+
+                pw_page.on("response", handle_response)
+                pending = track_pending_requests(pw_page)
+                pw_page.goto(final_url, wait_until="domcontentloaded", timeout=60000)
+                ready = payloads_ready(payloads, self._extract_workday_postings)
+                wait_for_signal(pw_page, 8000, ready=ready, pending=pending)
+                return pw_page.content(), payloads
+
+            try:
+                result = self.browser.run(render, profile="desktop", routes="workday")
+            except Exception as e:
+                result = e
+            on_render(result)
         except Exception as e:
             print(f"  ❌ Workday: {e}")
 
     def scrape_darwinbox(self, company_name, career_url):
         """Darwinbox scraper with API interception + cookie/header replay"""
         headers = {**HEADERS, "Accept": "text/html"}
+        tenant = urlparse(career_url).netloc.lower()
 
         try:
-            r = requests.get(career_url, headers=headers, timeout=10)
+            # Replay last run's captured API calls; the browser only runs when they stop working.
+            recipe = self._fresh_darwinbox_recipe(tenant)
+            if recipe:
+                cached_jobs, _ = self._replay_darwinbox_calls(
+                    career_url, recipe.get("calls", []), [], strict=True
+                )
+                if cached_jobs:
+                    print("  Darwinbox: replayed cached API recipe (no browser)")
+                    self._add_darwinbox_jobs(company_name, cached_jobs, [])
+                    return
+                print("  ⚠ Darwinbox cached recipe failed, re-capturing with Playwright...")
+                self.darwinbox_recipes.pop(tenant)
+
+            r = self.http.get(career_url, headers=headers, timeout=10)
             if r.status_code != 200:
                 print(f"  ⚠ Darwinbox HTTP {r.status_code}, trying Playwright...")
             else:
                 if "login" in r.text.lower() and "candidate" in r.text.lower():
                     print("  ⚠ Darwinbox login detected, trying Playwright...")
 
-            try:
-                from playwright.sync_api import sync_playwright
-            except Exception:
+            if not browser_available():
                 print("  ⚠ Playwright not installed")
                 return
 
-            with sync_playwright() as p:
-                browser = p.chromium.launch(headless=True, args=["--no-sandbox"])
-                context = browser.new_context(user_agent=HEADERS.get("User-Agent", "Mozilla/5.0"))
-                page = context.new_page()
+            def render(page):
                 job_payloads = []
                 api_hits = []
                 api_calls = []
@@ -2022,6 +2272,7 @@ class JobScraper:
                         return
 
                 page.on("response", handle_response)
+                pending = track_pending_requests(page)
                 nav_error = None
                 for wait_mode, nav_timeout in [("domcontentloaded", 35000), ("load", 50000)]:
                     try:
@@ -2032,108 +2283,71 @@ class JobScraper:
                         nav_error = e
                         continue
                 if nav_error is not None:
-                    context.close()
-                    browser.close()
-                    print(f"  ⚠ Darwinbox navigation failed: {nav_error}")
-                    return
-                page.wait_for_timeout(3000)
-
-                # Try to extract job links from DOM as fallback
-                links = page.query_selector_all("a[href]")
-                valid = []
-                seen = set()
-
-                for link in links:
-                    href = link.get_attribute("href") or ""
-                    title = link.inner_text().strip()
-                    if not href:
-                        continue
-
-                    if "darwinbox.in" not in href and not href.startswith("/"):
-                        continue
+                    return nav_error, [], job_payloads, api_hits, api_calls, []
+                # Only stop once a job list arrived (not the first config/i18n JSON)
+                ready = payloads_ready(job_payloads, lambda p: self._extract_darwinbox_jobs(p, career_url))
+                wait_for_signal(page, 6000, ready=ready, pending=pending)
+
+                links = [
+                    (link.get_attribute("href") or "", link.inner_text().strip())
+                    for link in page.query_selector_all("a[href]")
+                ]
+                return None, links, job_payloads, api_hits, api_calls, page.context.cookies()
+
+            nav_error, links, job_payloads, api_hits, api_calls, cookies = self.browser.run(render, profile="desktop", routes="darwinbox")
+            if nav_error is not None:
+                print(f"  ⚠ Darwinbox navigation failed: {nav_error}")
+                return
 
-                    href_lower = href.lower()
-                    if "login" in href_lower or "signin" in href_lower:
-                        continue
-                    if href_lower.rstrip("/").endswith("/careers"):
-                        continue
+            # Job links from the rendered DOM, as a fallback
+            valid = []
+            seen = set()
 
-                    if not any(x in href_lower for x in ["candidate", "career", "job", "opening", "position"]):
-                        continue
+            for href, title in links:
+                if not href:
+                    continue
 
-                    full_url = href if href.startswith("http") else urljoin(career_url, href)
-                    if full_url in seen:
-                        continue
-                    seen.add(full_url)
+                if "darwinbox.in" not in href and not href.startswith("/"):
+                    continue
 
-                    if not title or len(title) < 3:
-                        title = self._title_from_url(full_url) or "Job Opening"
+                href_lower = href.lower()
+                if "login" in href_lower or "signin" in href_lower:
+                    continue
+                if href_lower.rstrip("/").endswith("/careers"):
+                    continue
 
-                    valid.append((title, full_url))
+                if not any(x in href_lower for x in ["candidate", "career", "job", "opening", "position"]):
+                    continue
 
-                # Parse JSON payloads for job data
-                json_jobs = []
-                for payload in job_payloads:
-                    json_jobs.extend(self._extract_darwinbox_jobs(payload, career_url))
+                full_url = href if href.startswith("http") else urljoin(career_url, href)
+                if full_url in seen:
+                    continue
+                seen.add(full_url)
 
-                # Replay intercepted API calls with browser session cookies/headers.
-                try:
-                    session = requests.Session()
-                    for c in context.cookies():
-                        session.cookies.set(
-                            c.get("name", ""),
-                            c.get("value", ""),
-                            domain=c.get("domain"),
-                            path=c.get("path", "/"),
-                        )
+                if not title or len(title) < 3:
+                    title = self._title_from_url(full_url) or "Job Opening"
 
-                    replay_count = 0
-                    for hit in api_calls:
-                        if len(hit) != 4:
-                            continue
-                        method, api_url, req_headers, req_body = hit
-                        if replay_count >= 30:
-                            break
-                        replay_count += 1
-
-                        replay_headers = {
-                            "Accept": "application/json, text/plain, */*",
-                            "User-Agent": HEADERS.get("User-Agent", "Mozilla/5.0"),
-                            "Referer": career_url,
-                            "Origin": f"https://{urlparse(career_url).netloc}",
-                        }
-                        for key, value in req_headers.items():
-                            lower_key = (key or "").lower()
-                            if lower_key in {"host", "connection", "content-length", "accept-encoding"}:
-                                continue
-                            if lower_key.startswith("x-") or lower_key in {
-                                "authorization", "content-type", "accept-language", "referer", "origin"
-                            }:
-                                replay_headers[key] = value
-
-                        if method == "POST":
-                            resp = session.post(api_url, headers=replay_headers, data=req_body or None, timeout=15)
-                        else:
-                            resp = session.get(api_url, headers=replay_headers, timeout=15)
-
-                        if resp.status_code != 200:
-                            continue
-                        try:
-                            payload = resp.json()
-                        except Exception:
-                            body = (resp.text or "").strip()
-                            if not body.startswith("{") and not body.startswith("["):
-                                continue
-                            try:
-                                payload = json.loads(body)
-                            except Exception:
-                                continue
-                        json_jobs.extend(self._extract_darwinbox_jobs(payload, career_url))
-                except Exception:
-                    pass
+                valid.append((title, full_url))
 
-                context.close()
-                browser.close()
+            # Parse JSON payloads for job data
+            json_jobs = []
+            for payload in job_payloads:
+                json_jobs.extend(self._extract_darwinbox_jobs(payload, career_url))
+
+            # Replay intercepted API calls with browser session cookies/headers.
+            replay_jobs, replayed = self._replay_darwinbox_calls(career_url, api_calls, cookies)
+            json_jobs.extend(replay_jobs)
+            if replay_jobs:
+                # data/ is committed by the cron job: keep session credentials out.
+                # A replay that needs them fails and the next run re-renders.
+                self.darwinbox_recipes.set(tenant, {
+                    "calls": [
+                        {**call, "headers": {k: v for k, v in call["headers"].items()
+                                             if k.lower() in DARWINBOX_RECIPE_HEADERS}}
+                        for call in replayed
+                    ],
+                    "saved_at": self.now(),
+                })
 
             if DARWINBOX_DEBUG:
                 print(f"  [Darwinbox Debug] API hits: {len(api_hits)}")
@@ -2147,22 +2361,7 @@ class JobScraper:
                 else:
                     print("  [Darwinbox Debug] No payloads captured")
 
-            combined = []
-            seen_urls = set()
-
-            for title, full_url, location in json_jobs:
-                title = self._clean_job_title(title) or self._title_from_url(full_url) or "Job Opening"
-                if full_url in seen_urls:
-                    continue
-                seen_urls.add(full_url)
-                combined.append((title, full_url, location))
-
-            for title, full_url in valid:
-                title = self._clean_job_title(title) or self._title_from_url(full_url) or "Job Opening"
-                if full_url in seen_urls:
-                    continue
-                seen_urls.add(full_url)
-                combined.append((title, full_url, "Various"))
+            combined = self._add_darwinbox_jobs(company_name, json_jobs, valid)
 
             if DARWINBOX_DEBUG and not combined and job_payloads:
                 print("  [Darwinbox Debug] No jobs extracted. Payload top-level keys:")
@@ -2171,33 +2370,138 @@ class JobScraper:
                         print(f"   - {list(payload.keys())[:12]}")
                     else:
                         print(f"   - {type(payload).__name__}")
-
-            print(f"  ✓ Darwinbox: {len(combined)} jobs")
-            for title, full_url, location in combined:
-                stable_id = hashlib.md5(full_url.encode("utf-8")).hexdigest()[:16]
-                self.add({
-                    "id": f"darwinbox_{stable_id}",
-                    "title": title,
-                    "company": company_name,
-                    "location": location or "Various",
-                    "source": f"{company_name} (Darwinbox)",
-                    "applyLink": full_url,
-                    "postedDate": self.now(),
-                })
         except Exception as e:
             print(f"  ❌ Darwinbox: {e}")
 
+    def _fresh_darwinbox_recipe(self, tenant):
+        recipe = self.darwinbox_recipes.get(tenant)
+        if not recipe or not recipe.get("calls"):
+            return None
+        try:
+            age = datetime.utcnow() - datetime.fromisoformat(recipe.get("saved_at", ""))
+        except Exception:
+            return None
+        if age.total_seconds() > DARWINBOX_RECIPE_TTL_HOURS * 3600:
+            return None
+        return recipe
+
+    def _replay_darwinbox_calls(self, career_url, api_calls, cookies, strict=False):
+        """Replay captured Darwinbox API calls over HTTP with the browser's cookies.
+
+        Returns (json_jobs, replayed): replayed holds the calls that answered
+        200 with JSON, with headers already filtered, ready to be cached as a
+        recipe. With strict=True any non-200 aborts the replay with no jobs.
+        """
+        json_jobs = []
+        replayed = []
+        try:
+            session = self.http.new_session()
+            now_ts = time.time()
+            for c in cookies:
+                expires = c.get("expires") or -1
+                if 0 < expires < now_ts:
+                    continue
+                session.cookies.set(
+                    c.get("name", ""),
+                    c.get("value", ""),
+                    domain=c.get("domain"),
+                    path=c.get("path", "/"),
+                )
+
+            for call in api_calls[:30]:
+                if isinstance(call, dict):
+                    method, api_url = call.get("method", "GET"), call.get("url", "")
+                    req_headers, req_body = call.get("headers") or {}, call.get("body") or ""
+                else:
+                    if len(call) != 4:
+                        continue
+                    method, api_url, req_headers, req_body = call
+
+                replay_headers = {
+                    "Accept": "application/json, text/plain, */*",
+                    "User-Agent": HEADERS.get("User-Agent", "Mozilla/5.0"),
+                    "Referer": career_url,
+                    "Origin": f"https://{urlparse(career_url).netloc}",
+                }
+                for key, value in req_headers.items():
+                    lower_key = (key or "").lower()
+                    if lower_key in {"host", "connection", "content-length", "accept-encoding"}:
+                        continue
+                    if lower_key.startswith("x-") or lower_key in {
+                        "authorization", "content-type", "accept-language", "referer", "origin"
+                    }:
+                        replay_headers[key] = value
+
+                if method == "POST":
+                    resp = self.http.post(api_url, session=session, headers=replay_headers, data=req_body or None, timeout=15)
+                else:
+                    resp = self.http.get(api_url, session=session, headers=replay_headers, timeout=15)
+
+                if resp.status_code != 200:
+                    if strict:
+                        return [], []
+                    continue
+                try:
+                    payload = resp.json()
+                except Exception:
+                    body = (resp.text or "").strip()
+                    if not body.startswith("{") and not body.startswith("["):
+                        continue
+                    try:
+                        payload = json.loads(body)
+                    except Exception:
+                        continue
+                replayed.append({"method": method, "url": api_url, "headers": replay_headers, "body": req_body})
+                json_jobs.extend(self._extract_darwinbox_jobs(payload, career_url))
+        except Exception:
+            if strict:
+                return [], []
+        return json_jobs, replayed
+
+    def _add_darwinbox_jobs(self, company_name, json_jobs, valid):
+        """Merge API jobs with DOM links (API first, deduped by URL) and add them."""
+        combined = []
+        seen_urls = set()
+
+        for title, full_url, location in json_jobs:
+            title = self._clean_job_title(title) or self._title_from_url(full_url) or "Job Opening"
+            if full_url in seen_urls:
+                continue
+            seen_urls.add(full_url)
+            combined.append((title, full_url, location))
+
+        for title, full_url in valid:
+            title = self._clean_job_title(title) or self._title_from_url(full_url) or "Job Opening"
+            if full_url in seen_urls:
+                continue
+            seen_urls.add(full_url)
+            combined.append((title, full_url, "Various"))
+
+        print(f"  ✓ Darwinbox: {len(combined)} jobs")
+        for title, full_url, location in combined:
+            stable_id = hashlib.md5(full_url.encode("utf-8")).hexdigest()[:16]
+            self.add({
+                "id": f"darwinbox_{stable_id}",
+                "title": title,
+                "company": company_name,
+                "location": location or "Various",
+                "source": f"{company_name} (Darwinbox)",
+                "applyLink": full_url,
+                "postedDate": self.now(),
+            })
+        return combined
+
     def scrape_wpmudev(self, company_name, url):
         """WPMU DEV custom scraper"""
         headers = {**HEADERS, "Accept": "text/html"}
 
         try:
-            r = requests.get(url, headers=headers, timeout=10)
+            r = self.http.get(url, headers=headers, timeout=10)
             if r.status_code != 200:
                 print(f"  ⚠ WPMU DEV HTTP {r.status_code}")
                 return
 
-            soup = BeautifulSoup(r.text, "html.parser")
+            soup = parse_html(r.text)
             valid = []
             seen = set()
 
@@ -2228,7 +2532,7 @@ class JobScraper:
             print(f"  ✓ WPMU DEV: {len(valid)} jobs")
             for title, full_url in valid:
                 self.add({
-                    "id": f"wpmudev_{hash(full_url)}",
+                    "id": stable_job_id("wpmudev", full_url),
                     "title": title,
                     "company": company_name,
                     "location": "Remote",
@@ -2246,12 +2550,12 @@ class JobScraper:
                        "tally.so", "typeform.com")
 
         try:
-            r = requests.get(url, headers=headers, timeout=10)
+            r = self.http.get(url, headers=headers, timeout=10)
             if r.status_code != 200:
                 print(f"  ⚠ Navana HTTP {r.status_code}")
                 return
 
-            soup = BeautifulSoup(r.text, "html.parser")
+            soup = parse_links(r.text)
             valid = []
             seen = set()
 
@@ -2276,7 +2580,7 @@ class JobScraper:
             print(f"  ✓ Navana: {len(valid)} apply links")
             for title, full_url in valid:
                 self.add({
-                    "id": f"navana_{hash(full_url)}",
+                    "id": stable_job_id("navana", full_url),
                     "title": title,
                     "company": company_name,
                     "location": "Remote",
@@ -2293,12 +2597,12 @@ class JobScraper:
         base = "https://e42.ai"
 
         try:
-            r = requests.get(url, headers=headers, timeout=10)
+            r = self.http.get(url, headers=headers, timeout=10)
             if r.status_code != 200:
                 print(f"  ⚠ E42 HTTP {r.status_code}")
                 return
 
-            soup = BeautifulSoup(r.text, "html.parser")
+            soup = parse_links(r.text)
             links = []
             for a in soup.find_all("a", href=True):
                 href = a.get("href", "")
@@ -2314,10 +2618,10 @@ class JobScraper:
                     continue
                 seen.add(link)
                 try:
-                    jr = requests.get(link, headers=headers, timeout=10)
+                    jr = self.http.get(link, headers=headers, timeout=10)
                     if jr.status_code != 200:
                         continue
-                    jsoup = BeautifulSoup(jr.text, "html.parser")
+                    jsoup = parse_html(jr.text)
                     title = None
                     h1 = jsoup.find(["h1", "h2"])
                     if h1:
@@ -2338,7 +2642,7 @@ class JobScraper:
             print(f"  ✓ E42: {len(valid)} jobs")
             for title, full_url, location in valid:
                 self.add({
-                    "id": f"e42_{hash(full_url)}",
+                    "id": stable_job_id("e42", full_url),
                     "title": title,
                     "company": company_name,
                     "location": location or "Various",
@@ -2355,12 +2659,12 @@ class JobScraper:
         base = "https://www.deeptek.ai"
 
         try:
-            r = requests.get(url, headers=headers, timeout=10)
+            r = self.http.get(url, headers=headers, timeout=10)
             if r.status_code != 200:
                 print(f"  ⚠ DeepTek HTTP {r.status_code}")
                 return
 
-            soup = BeautifulSoup(r.text, "html.parser")
+            soup = parse_links(r.text)
             links = []
             for a in soup.find_all("a", href=True):
                 href = a.get("href", "")
@@ -2376,10 +2680,10 @@ class JobScraper:
                     continue
                 seen.add(link)
                 try:
-                    jr = requests.get(link, headers=headers, timeout=10)
+                    jr = self.http.get(link, headers=headers, timeout=10)
                     if jr.status_code != 200:
                         continue
-                    jsoup = BeautifulSoup(jr.text, "html.parser")
+                    jsoup = parse_html(jr.text)
                     title = None
                     h = jsoup.find(["h1", "h2", "h3"])
                     if h:
@@ -2402,7 +2706,7 @@ class JobScraper:
             print(f"  ✓ DeepTek: {len(valid)} jobs")
             for title, full_url, location, apply_link in valid:
                 self.add({
-                    "id": f"deeptek_{hash(full_url)}",
+                    "id": stable_job_id("deeptek", full_url),
                     "title": title,
                     "company": company_name,
                     "location": location or "Various",
@@ -2438,8 +2742,6 @@ class JobScraper:
                     self.scrape_ashby(name, slug)  # ADD THIS LINE
                 else:
                     print(f"  ⚠ Unknown ATS or missing slug")
-                
-                time.sleep(0.5)
             except Exception as e:
                 print(f"  ❌ Error: {e}")
 
@@ -2460,59 +2762,131 @@ class JobScraper:
             print(f"  URL: {url}")
             
             try:
-                # Auto-detect
-                ats_type, slug, final_url = self.detect_ats_system(url)
-                print(f"  Detected: {ats_type}" + (f" | Slug: {slug}" if slug else ""))
-                
-                # Scrape based on detection
-                if ats_type == "greenhouse" and slug:
-                    self.scrape_greenhouse(name, slug)
-                elif ats_type == "lever" and slug:
-                    self.scrape_lever(name, slug)
-                elif ats_type == "ashby" and slug:
-                    self.scrape_ashby(name, slug)
-                elif ats_type == "smartrecruiters" and slug:
-                    self.scrape_smartrecruiters(name, slug)
-                elif ats_type == "workable" and slug:
-                    self.scrape_workable(name, slug)
-                elif ats_type == "kula" and slug:
-                    self.scrape_kula(name, slug)
-                elif ats_type == "workday":
-                    print("  ⚠ Workday requires JS - skipped")
-                else:
-                    # Generic fallback
-                    self.scrape_generic(name, final_url)
-                
-                time.sleep(0.4)
-                
+                self.scrape_autodetected(name, url, js_boards=False)
             except Exception as e:
                 print(f"  ❌ Failed: {e}")
+
+    def _in_company_context(self, fn):
+        """Wrap fn for a nested pool so its prints land in the current company's log.
+
+        Worker threads do not inherit self._local, so without this their
+        output would bypass the per-company grouping.
+        """
+        log = getattr(self._local, "log", None)
+        if log is None:
+            return fn
+
+        def run(*args, **kwargs):
+            self._local.log = log
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                self._local.log = None
+
+        return run
+
+    def _added_count(self):
+        """Jobs added so far by the current company (buffer) or the whole run."""
+        buffer = getattr(self._local, "buffer", None)
+        return len(buffer) if buffer is not None else len(self.jobs)
+
+    def scrape_detected(self, name, ats_type, slug, final_url, js_boards=True):
+        """Route a company to the scraper for its detected ATS.
+
+        With js_boards=False (the plain career-page list) Workday is skipped
+        and Darwinbox goes to the generic scraper; returns False if skipped.
+        """
+        if ats_type == "workday" and not js_boards:
+            print("  ⚠ Workday requires JS - skipped")
+            return False
+        if ats_type == "greenhouse" and slug:
+            self.scrape_greenhouse(name, slug)
+        elif ats_type == "lever" and slug:
+            self.scrape_lever(name, slug)
+        elif ats_type == "ashby" and slug:
+            self.scrape_ashby(name, slug)
+        elif ats_type == "smartrecruiters" and slug:
+            self.scrape_smartrecruiters(name, slug)
+        elif ats_type == "workable" and slug:
+            self.scrape_workable(name, slug)
+        elif ats_type == "kula" and slug:
+            self.scrape_kula(name, slug)
+        elif ats_type == "darwinbox" and js_boards:
+            self.scrape_darwinbox(name, final_url)
+        elif ats_type == "workday":
+            self.scrape_workday(name, final_url)
+        else:
+            # Generic fallback
+            self.scrape_generic(name, final_url)
+        return True
+
+    def scrape_autodetected(self, name, url, js_boards=True):
+        """Detect the ATS behind `url` (cached across runs) and scrape it.
+
+        If a cached detection yields zero jobs, the entry is dropped and the
+        page is detected again; a different answer gets one more attempt.
+        """
+        from_cache = self.ats_cache.get(url) is not None
+        detected = self.detect_ats_system(url)
+        ats_type, slug, final_url = detected
+        print(f"  Detected: {ats_type}" + (f" | Slug: {slug}" if slug else "") + (" (cached)" if from_cache else ""))
+
+        start_count = self._added_count()
+        deferred = getattr(self._local, "deferred", None)
+        start_deferred = len(deferred) if deferred is not None else 0
+        scraped = self.scrape_detected(name, ats_type, slug, final_url, js_boards)
+        if not from_cache or not scraped:
+            return
+        if deferred is not None and len(deferred) > start_deferred:
+            # A browser render is still pending: judge the cached detection
+            # once its continuation has added (or not added) jobs.
+            request, on_result = deferred[-1]
+
+            def judge(result):
+                on_result(result)
+                if self._added_count() == start_count:
+                    self._revalidate_detection(name, url, detected, js_boards)
+
+            deferred[-1] = (request, judge)
+            return
+        if self._added_count() == start_count:
+            self._revalidate_detection(name, url, detected, js_boards)
+
+    def _revalidate_detection(self, name, url, detected, js_boards=True):
+        """A cached detection yielded nothing: drop it and scrape a different answer once."""
+        self.ats_cache.invalidate(url)
+        fresh = self.detect_ats_system(url, use_cache=False)
+        if fresh == detected:
+            return
+        ats_type, slug, final_url = fresh
+        print(f"  ↻ Re-detected: {ats_type}" + (f" | Slug: {slug}" if slug else ""))
+        self.scrape_detected(name, ats_type, slug, final_url, js_boards)
+
     # ===================================================================
     # COMPANY REGISTRY (CONFIG-DRIVEN)
     # ===================================================================
 
-    def scrape_companies(self, companies):
-        """Scrape companies from registry with ATS routing + auto-detection."""
+    def scrape_companies(self, companies, workers=None):
+        """Scrape companies from registry with ATS routing + auto-detection.
+
+        With more than one worker, companies are scraped in a thread pool.
+        Each worker buffers its jobs and log lines; results are committed in
+        registry order so output never depends on which worker finishes first.
+        """
         if not companies:
             return
 
+        workers = max(1, int(workers or SCRAPE_WORKERS))
         print("\n[Company Registry - ATS Routing + Auto-Detection]")
-        print(f"Companies: {len(companies)}")
+        print(f"Companies: {len(companies)}" + (f" | Workers: {workers}" if workers > 1 else ""))
 
+        pending = []
         for company in companies:
             name = company.get("name", "Unknown")
-            url = company.get("career_url", "")
             ats = (company.get("ats") or "").lower()
-            slug = company.get("slug", "")
-            auto_disable_eligible = self._source_auto_disable_eligible(ats)
-            start_count = len(self.jobs)
-            error = None
-
-            print(f"\n[{name}]")
-            if url:
-                print(f"  URL: {url}")
-            if auto_disable_eligible and self._source_is_disabled(name):
+            if self._source_auto_disable_eligible(ats) and self._source_is_disabled(name):
                 remaining = int(self.source_health.get(name, {}).get("disabled_runs_remaining", 0))
+                print(f"\n[{name}]")
                 print(f"  ⚠ Auto-disabled for stability (remaining skips: {remaining})")
                 self._consume_source_skip(name)
                 self.company_results[name] = {
@@ -2520,285 +2894,450 @@ class JobScraper:
                     "error": "auto-disabled",
                 }
                 continue
+            pending.append(company)
 
-            try:
-                if ats == "greenhouse" and slug:
-                    self.scrape_greenhouse(name, slug)
-                elif ats == "lever" and slug:
-                    self.scrape_lever(name, slug)
-                elif ats == "ashby" and slug:
-                    self.scrape_ashby(name, slug)
-                elif ats == "smartrecruiters" and slug:
-                    self.scrape_smartrecruiters(name, slug)
-                elif ats == "workable" and slug:
-                    self.scrape_workable(name, slug)
-                elif ats == "kula" and slug:
-                    self.scrape_kula(name, slug)
-                elif ats == "workday" and url:
-                    self.scrape_workday(name, url)
-                elif ats == "darwinbox" and url:
-                    self.scrape_darwinbox(name, url)
-                elif ats == "brainstormforce" and url:
-                    self.scrape_brainstormforce(name, url)
-                elif ats == "rtcamp" and url:
-                    self.scrape_rtcamp(name, url)
-                elif ats == "wpmudev" and url:
-                    self.scrape_wpmudev(name, url)
-                elif ats == "navana" and url:
-                    self.scrape_navana(name, url)
-                elif ats == "e42" and url:
-                    self.scrape_e42(name, url)
-                elif ats == "deeptek" and url:
-                    self.scrape_deeptek(name, url)
-                elif ats:
-                    print(f"  ⚠ ATS '{ats}' not supported or missing slug; using auto-detect")
-                    if url:
-                        ats_type, detected_slug, final_url = self.detect_ats_system(url)
-                        if ats_type == "greenhouse" and detected_slug:
-                            self.scrape_greenhouse(name, detected_slug)
-                        elif ats_type == "lever" and detected_slug:
-                            self.scrape_lever(name, detected_slug)
-                        elif ats_type == "ashby" and detected_slug:
-                            self.scrape_ashby(name, detected_slug)
-                        elif ats_type == "smartrecruiters" and detected_slug:
-                            self.scrape_smartrecruiters(name, detected_slug)
-                        elif ats_type == "workable" and detected_slug:
-                            self.scrape_workable(name, detected_slug)
-                        elif ats_type == "kula" and detected_slug:
-                            self.scrape_kula(name, detected_slug)
-                        elif ats_type == "darwinbox":
-                            self.scrape_darwinbox(name, final_url)
-                        elif ats_type == "workday":
-                            self.scrape_workday(name, final_url)
-                        else:
-                            self.scrape_generic(name, final_url)
-                    else:
-                        print("  ⚠ Missing career_url; skipped")
-                else:
-                    if url:
-                        ats_type, detected_slug, final_url = self.detect_ats_system(url)
-                        print(f"  Detected: {ats_type}" + (f" | Slug: {detected_slug}" if detected_slug else ""))
-                        if ats_type == "greenhouse" and detected_slug:
-                            self.scrape_greenhouse(name, detected_slug)
-                        elif ats_type == "lever" and detected_slug:
-                            self.scrape_lever(name, detected_slug)
-                        elif ats_type == "ashby" and detected_slug:
-                            self.scrape_ashby(name, detected_slug)
-                        elif ats_type == "smartrecruiters" and detected_slug:
-                            self.scrape_smartrecruiters(name, detected_slug)
-                        elif ats_type == "workable" and detected_slug:
-                            self.scrape_workable(name, detected_slug)
-                        elif ats_type == "kula" and detected_slug:
-                            self.scrape_kula(name, detected_slug)
-                        elif ats_type == "darwinbox":
-                            self.scrape_darwinbox(name, final_url)
-                        elif ats_type == "workday":
-                            self.scrape_workday(name, final_url)
-                        else:
-                            self.scrape_generic(name, final_url)
-                    else:
-                        print("  ⚠ Missing career_url; skipped")
+        prefetched = self._prefetch_api_companies(pending) if ASYNC_ATS else [None] * len(pending)
+        defer = ASYNC_BROWSER and async_browser_available()
+
+        if workers == 1 and not defer:
+            for company, jobs in zip(pending, prefetched):
+                jobs, error, log, _ = self._scrape_company(company, prefetched=jobs)
+                self._finish_company(company, jobs, error, log)
+            return
+
+        original_stdout = sys.stdout
+        sys.stdout = _ThreadLogRouter(original_stdout, self._local)
+        try:
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                outcomes = pool.map(
+                    lambda c, jobs: self._scrape_company(c, capture_log=True, prefetched=jobs, defer_renders=defer),
+                    pending, prefetched,
+                )
+                if defer:
+                    # Browser fallbacks were queued; render them as one concurrent batch
+                    outcomes = self._run_deferred_renders(pool, list(outcomes))
+                for company, (jobs, error, log, _) in zip(pending, outcomes):
+                    self._finish_company(company, jobs, error, log)
+        finally:
+            sys.stdout = original_stdout
+
+    def _defer_render(self, request, on_result):
+        """Queue a browser render for the async batch; False when rendering must happen now.
+
+        on_result(result) runs later with the current company's job buffer and
+        log, receiving what the matching sync render returns (or an Exception).
+        """
+        deferred = getattr(self._local, "deferred", None)
+        if deferred is None:
+            return False
+        deferred.append((request, on_result))
+        print("  ⏳ Browser render queued for async batch")
+        return True
+
+    def _run_deferred_renders(self, pool, outcomes):
+        """Render every queued page concurrently, then resume each company with its results."""
+        batch = [
+            (i, request, on_result)
+            for i, (_, _, _, deferred) in enumerate(outcomes)
+            for request, on_result in deferred
+        ]
+        if not batch:
+            return outcomes
 
-                time.sleep(0.4)
+        print(f"\n[Async browser] {len(batch)} pages | concurrency {BROWSER_PAGE_CONCURRENCY}")
+        # Every company has paused, so the shared browser is idle: close it so the
+        # batch's Chromium is the only one running (the pool relaunches on demand)
+        self.browser.close()
+        try:
+            results = AsyncRenderer().render_all([request for _, request, _ in batch])
+        except Exception as e:
+            print(f"  ⚠ Async browser failed: {e}")
+            results = [e] * len(batch)
+
+        resumes = {}
+        for (i, _, on_result), result in zip(batch, results):
+            resumes.setdefault(i, []).append((on_result, result))
+        indexes = list(resumes)
+        resumed = pool.map(lambda i: self._resume_company(outcomes[i], resumes[i]), indexes)
+        for i, outcome in zip(indexes, resumed):
+            outcomes[i] = outcome
+        return outcomes
+
+    def _resume_company(self, outcome, continuations):
+        """Feed render results to a company's queued continuations; returns its updated outcome."""
+        jobs, error, log, _ = outcome
+        self._local.buffer = jobs
+        self._local.log = io.StringIO()
+        self._local.deferred = None  # the async batch is over: any further render runs inline
+        for on_result, result in continuations:
+            try:
+                on_result(result)
             except Exception as e:
-                error = str(e)
+                error = error or str(e)
                 print(f"  ❌ Failed: {e}")
+        log += self._local.log.getvalue()
+        self._local.buffer = None
+        self._local.log = None
+        return jobs, error, log, []
+
+    def _prefetch_api_companies(self, companies):
+        """Fetch JSON ATS boards on the asyncio engine; list aligned with `companies`."""
+        results = [None] * len(companies)
+        indexes = [
+            i for i, c in enumerate(companies)
+            if (c.get("ats") or "").lower() in ASYNC_ATS_FAMILIES and c.get("slug")
+        ]
+        if not indexes:
+            return results
+        if not async_engine_available():
+            print("  ⚠ aiohttp not installed; async ATS engine disabled")
+            return results
+
+        print(f"Async ATS engine: {len(indexes)} API boards")
+        try:
+            fetched = AsyncATSEngine(self).run([companies[i] for i in indexes])
+        except Exception as e:
+            print(f"  ⚠ Async ATS engine failed: {e}")
+            return results
+        for i, jobs in zip(indexes, fetched):
+            results[i] = jobs
+        return results
+
+    def _scrape_company(self, company, capture_log=False, prefetched=None, defer_renders=False):
+        """Route one registry company to its scraper; returns (jobs, error, log, deferred).
+
+        With defer_renders, browser fallbacks are queued in `deferred` as
+        (render request, continuation) pairs instead of rendering inline.
+        """
+        name = company.get("name", "Unknown")
+        url = company.get("career_url", "")
+        ats = (company.get("ats") or "").lower()
+        slug = company.get("slug", "")
+        error = None
+
+        self._local.buffer = []
+        self._local.log = io.StringIO() if capture_log else None
+        self._local.deferred = [] if defer_renders else None
+        print(f"\n[{name}]")
+        if url:
+            print(f"  URL: {url}")
 
-            end_count = len(self.jobs)
-            found = max(0, end_count - start_count)
-            self._record_source_result(name, found, auto_disable_eligible)
+        try:
+            if prefetched is not None:
+                print(f"  ✓ {ats.title()} (async): {len(prefetched)} jobs")
+                self._harvest_detail_descriptions(prefetched)
+                for job in prefetched:
+                    self.add(job)
+            elif ats == "greenhouse" and slug:
+                self.scrape_greenhouse(name, slug)
+            elif ats == "lever" and slug:
+                self.scrape_lever(name, slug)
+            elif ats == "ashby" and slug:
+                self.scrape_ashby(name, slug)
+            elif ats == "smartrecruiters" and slug:
+                self.scrape_smartrecruiters(name, slug)
+            elif ats == "workable" and slug:
+                self.scrape_workable(name, slug)
+            elif ats == "kula" and slug:
+                self.scrape_kula(name, slug)
+            elif ats == "workday" and url:
+                self.scrape_workday(name, url)
+            elif ats == "darwinbox" and url:
+                self.scrape_darwinbox(name, url)
+            elif ats == "brainstormforce" and url:
+                self.scrape_brainstormforce(name, url)
+            elif ats == "rtcamp" and url:
+                self.scrape_rtcamp(name, url)
+            elif ats == "wpmudev" and url:
+                self.scrape_wpmudev(name, url)
+            elif ats == "navana" and url:
+                self.scrape_navana(name, url)
+            elif ats == "e42" and url:
+                self.scrape_e42(name, url)
+            elif ats == "deeptek" and url:
+                self.scrape_deeptek(name, url)
+            else:
+                if ats:
+                    print(f"  ⚠ ATS '{ats}' not supported or missing slug; using auto-detect")
+                if url:
+                    self.scrape_autodetected(name, url)
+                else:
+                    print("  ⚠ Missing career_url; skipped")
+        except Exception as e:
+            error = str(e)
+            print(f"  ❌ Failed: {e}")
+
+        jobs = self._local.buffer
+        log = self._local.log.getvalue() if capture_log else ""
+        deferred = self._local.deferred or []
+        self._local.buffer = None
+        self._local.log = None
+        self._local.deferred = None
+        return jobs, error, log, deferred
+
+    def _finish_company(self, company, jobs, error, log=""):
+        """Commit a company's buffered jobs and feed its source-health record."""
+        name = company.get("name", "Unknown")
+        ats = (company.get("ats") or "").lower()
+        if log:
+            sys.stdout.write(log)
+
+        with self._lock:
+            start_count = len(self.jobs)
+            for job in jobs:
+                self._commit(job)
+            found = max(0, len(self.jobs) - start_count)
+            self._record_source_result(name, found, self._source_auto_disable_eligible(ats))
             self.company_results[name] = {
                 "found": found,
                 "error": error,
             }
-            print(f"  ✅ Summary: {found} jobs" + (f" | Error: {error}" if error else ""))
+        print(f"  ✅ Summary: {found} jobs" + (f" | Error: {error}" if error else ""))
     # ===================================================================
     # MAIN COMPANY SCRAPERS
     # ===================================================================
 
     def scrape_generic(self, company_name, url):
-        """Comprehensive generic scraper with Playwright fallback"""
-        headers = {**HEADERS, "Accept": "text/html"}
+        """Comprehensive generic scraper with Playwright fallback.
+
+        Stages (selectors, JSON-LD, sitemap, Playwright) run cheapest first by
+        default; data/generic_strategies.json remembers which one last worked
+        for the company so it is tried first next run, and stages that keep
+        finding nothing are pushed to the back.
+        """
         if self._is_aggregator_domain(url):
             print("  ⚠ Generic skipped: aggregator domain")
             return
-    
-        try:
-            r = requests.get(url, headers=headers, timeout=10)
-            soup = BeautifulSoup(r.text, "html.parser")
-    
-            # 20+ selectors for maximum coverage
-            selectors = [
-                # Class-based
-                "a.job-title", "a.position-title", "a.posting-title", "a.role-title",
-                "a[class*='job']", "a[class*='position']", "a[class*='posting']",
-                "a[class*='opening']", "a[class*='role']", "a[class*='career']",
-                # Href-based
-                "a[href*='/jobs/']", "a[href*='/job/']", "a[href*='/careers/'][href*='job']",
-                "a[href*='/positions/']", "a[href*='/openings/']", "a[href*='/apply']",
-                "a[href*='/role/']", "a[href*='jobId']", "a[href*='position']",
-                # Container-based
-                "div.job a", "div.position a", "li.job a", "li.posting a",
-                "div[class*='job'] a", "div[class*='career'] a"
-            ]
-    
-            all_links = []
-            seen = set()
-            for sel in selectors:
-                for a in soup.select(sel):
-                    href = a.get("href", "")
-                    if href and href not in seen:
-                        seen.add(href)
-                        all_links.append(a)
-    
-            # Filter
-            skip_patterns = [r'^/$', r'^/careers/?$', r'^/jobs/?$',
-                           r'/departments', r'/locations', r'/teams']
-            skip_words = ["all jobs", "view all", "see all", "departments",
-                         "locations", "browse", "filter by"]
-    
-            valid_jobs = []
-            for a in all_links:
-                href = a.get("href", "")
-                title = a.get_text(strip=True)
-    
-                if not href or not title or len(title) < 3:
-                    continue
-                if any(re.search(p, href, re.I) for p in skip_patterns):
-                    continue
-                if any(w in title.lower() for w in skip_words):
-                    continue
-                if not self._is_probable_job_url(href):
-                    continue
 
-                valid_jobs.append((href, title))
-    
-            # If found jobs, process them
-            if valid_jobs:
-                print(f"  ✓ Generic: {len(valid_jobs)} jobs")
-    
-                for href, title in valid_jobs:
-                    if href.startswith("http"):
-                        full_url = href
-                    elif href.startswith("/"):
-                        base = re.sub(r'/(careers|jobs|openings).*$', '', url)
-                        full_url = base + href
-                    else:
-                        full_url = url.rstrip("/") + "/" + href
-    
-                    self.add({
-                        "id": f"generic_{company_name}_{hash(href)}",
-                        "title": title,
-                        "company": company_name,
-                        "location": "Various",
-                        "source": f"{company_name}",
-                        "applyLink": full_url,
-                        "postedDate": self.now(),
-                    })
-                return  # Successfully found jobs
+        landing = {}  # career page soup, fetched once and only if a stage needs it
+        try:
+            self._run_generic_stages(company_name, url, self._generic_stage_order(company_name), landing)
+        except Exception as e:
+            print(f"  ❌ Generic: {e}")
 
-            # Try JSON-LD JobPosting
-            jsonld_jobs = self._extract_jobposting_jsonld(soup)
-            if jsonld_jobs:
-                print(f"  ✓ JSON-LD: {len(jsonld_jobs)} jobs")
-                for title, full_url, location in jsonld_jobs:
-                    self.add({
-                        "id": f"jsonld_{company_name}_{hash(full_url)}",
-                        "title": title,
-                        "company": company_name,
-                        "location": location or "Various",
-                        "source": f"{company_name}",
-                        "applyLink": full_url,
-                        "postedDate": self.now(),
-                    })
+    def _generic_stage_order(self, company_name):
+        entry = self.generic_strategies.get(company_name) or {}
+        last = entry.get("last")
+        misses = entry.get("misses", {})
+        order = list(GENERIC_STAGES)
+        if last in order:
+            order.remove(last)
+            order.insert(0, last)
+        demoted = [s for s in order if s != last and misses.get(s, 0) >= GENERIC_DEMOTE_AFTER]
+        return [s for s in order if s not in demoted] + demoted
+
+    def _record_generic_stage(self, company_name, stage, found):
+        entry = self.generic_strategies.get(company_name) or {}
+        misses = dict(entry.get("misses", {}))
+        if found:
+            misses.pop(stage, None)
+            updated = {"last": stage, "misses": misses}
+        else:
+            misses[stage] = misses.get(stage, 0) + 1
+            updated = {"last": entry.get("last"), "misses": misses}
+        if updated != entry:
+            self.generic_strategies.set(company_name, updated)
+
+    def _run_generic_stages(self, company_name, url, stages, landing):
+        """Try stages in order until one adds jobs; a deferred browser stage resumes the rest later."""
+        for i, stage in enumerate(stages):
+            if stage == "playwright":
+                remaining = stages[i + 1:]
+
+                def resume(found, remaining=remaining):
+                    self._record_generic_stage(company_name, "playwright", found)
+                    if not found:
+                        self._run_generic_stages(company_name, url, remaining, landing)
+
+                found = self._generic_stage_playwright(company_name, url, resume, first=(i == 0))
+                if found is None:
+                    return  # queued for the async browser batch; resume() continues the cascade
+            else:
+                found = getattr(self, f"_generic_stage_{stage}")(company_name, url, landing)
+                self._record_generic_stage(company_name, stage, found)
+            if found:
                 return
 
-            # Try sitemap lookup
-            sitemap_urls = self._find_job_urls_in_sitemap(url)
-            if sitemap_urls:
-                print(f"  ✓ Sitemap: {len(sitemap_urls)} urls (validating JobPosting...)")
-                for href in sitemap_urls:
-                    if not self._url_has_jobposting(href):
-                        continue
-                    title = self._title_from_url(href) or "Job Opening"
-                    self.add({
-                        "id": f"sitemap_{company_name}_{hash(href)}",
-                        "title": title,
-                        "company": company_name,
-                        "location": "Various",
-                        "source": f"{company_name}",
-                        "applyLink": href,
-                        "postedDate": self.now(),
-                    })
-                if self.stats.get(company_name, 0) > 0:
-                    return
-    
-            # If no jobs found, try Playwright for JS-rendered content
+        # Last resort - at least we tried
+        print(f"  ✓ Generic: 0 jobs")
+
+    def _generic_landing_soup(self, url, landing):
+        if "soup" not in landing:
+            r = self.http.get(url, headers={**HEADERS, "Accept": "text/html"}, timeout=10)
+            landing["soup"] = parse_html(r.text)
+        return landing["soup"]
+
+    def _generic_stage_selectors(self, company_name, url, landing):
+        soup = self._generic_landing_soup(url, landing)
+
+        # 20+ selectors for maximum coverage (selector order, deduped by href)
+        all_links = GENERIC_LINK_CLASSIFIER.candidates(soup)
+
+        # Filter
+        valid_jobs = []
+        for a in all_links:
+            href = a.get("href", "")
+            title = a.get_text(strip=True)
+
+            if not href or not title or len(title) < 3:
+                continue
+            if GENERIC_SKIP_RE.search(href):
+                continue
+            if any(w in title.lower() for w in GENERIC_SKIP_WORDS):
+                continue
+            if not self._is_probable_job_url(href):
+                continue
+
+            valid_jobs.append((href, title))
+
+        if not valid_jobs:
+            return 0
+
+        print(f"  ✓ Generic: {len(valid_jobs)} jobs")
+        for href, title in valid_jobs:
+            if href.startswith("http"):
+                full_url = href
+            elif href.startswith("/"):
+                base = re.sub(r'/(careers|jobs|openings).*$', '', url)
+                full_url = base + href
+            else:
+                full_url = url.rstrip("/") + "/" + href
+
+            self.add({
+                "id": stable_job_id(f"generic_{company_name}", full_url),
+                "title": title,
+                "company": company_name,
+                "location": "Various",
+                "source": f"{company_name}",
+                "applyLink": full_url,
+                "postedDate": self.now(),
+            })
+        return len(valid_jobs)
+
+    def _generic_stage_jsonld(self, company_name, url, landing):
+        jsonld_jobs = self._extract_jobposting_jsonld(self._generic_landing_soup(url, landing))
+        if not jsonld_jobs:
+            return 0
+
+        print(f"  ✓ JSON-LD: {len(jsonld_jobs)} jobs")
+        for title, full_url, location in jsonld_jobs:
+            self.add({
+                "id": stable_job_id(f"jsonld_{company_name}", full_url),
+                "title": title,
+                "company": company_name,
+                "location": location or "Various",
+                "source": f"{company_name}",
+                "applyLink": full_url,
+                "postedDate": self.now(),
+            })
+        return len(jsonld_jobs)
+
+    def _generic_stage_sitemap(self, company_name, url, landing):
+        sitemap_urls = self._find_job_urls_in_sitemap(url)
+        if not sitemap_urls:
+            return 0
+
+        print(f"  ✓ Sitemap: {len(sitemap_urls)} urls (validating JobPosting...)")
+        sitemap_found = 0
+        verdicts = self.jobposting.check_many(sitemap_urls, wrap=self._in_company_context)
+        for href, has_posting in zip(sitemap_urls, verdicts):
+            if not has_posting:
+                continue
+            sitemap_found += 1
+            title = self._title_from_url(href) or "Job Opening"
+            self.add({
+                "id": stable_job_id(f"sitemap_{company_name}", href),
+                "title": title,
+                "company": company_name,
+                "location": "Various",
+                "source": f"{company_name}",
+                "applyLink": href,
+                "postedDate": self.now(),
+            })
+        return sitemap_found
+
+    def _generic_stage_playwright(self, company_name, url, resume, first=False):
+        """Render the page for JS-only boards; returns jobs added, or None when deferred."""
+        if first:
+            print("  Trying Playwright first (last successful strategy)...")
+        else:
             print(f"  ⚠ No jobs via requests, trying Playwright...")
-            
-            try:
-                from playwright.sync_api import sync_playwright
-                
-                with sync_playwright() as p:
-                    browser = p.chromium.launch(headless=True, args=["--no-sandbox"])
-                    page = browser.new_page()
-                    page.goto(url, wait_until="networkidle", timeout=30000)
-                    page.wait_for_timeout(2000)
-                    
-                    # Get all links after JS renders
-                    links = page.query_selector_all("a[href]")
-                    
-                    valid_jobs_pw = []
-                    seen_hrefs = set()
-                    
-                    for link in links:
-                        href = link.get_attribute("href") or ""
-                        title = link.inner_text().strip()
-                        
-                        if not href or href in seen_hrefs or len(title) < 3:
-                            continue
-                        
-                        # Must have job indicator (avoid generic careers pages)
-                        if not self._is_probable_job_url(href):
-                            continue
-                        
-                        # Skip navigation
-                        if any(w in title.lower() for w in skip_words):
-                            continue
-                        
-                        seen_hrefs.add(href)
-                        valid_jobs_pw.append((href, title))
-                    
-                    browser.close()
-                    
-                    print(f"  ✓ Generic (Playwright): {len(valid_jobs_pw)} urls (validating JobPosting...)")
-                    
-                    for href, title in valid_jobs_pw:
-                        full_url = href if href.startswith("http") else url.rstrip("/") + href
-                        if not self._url_has_jobposting(full_url):
-                            continue
+        if not browser_available():
+            print(f"  ⚠ Playwright not installed")
+            return 0
+
+        def on_links(links):
+            found = 0
+            if isinstance(links, Exception):
+                print(f"  ⚠ Playwright failed: {links}")
+            else:
+                found = self._add_generic_rendered_links(company_name, url, links, GENERIC_SKIP_WORDS)
+            return found
 
-                        self.add({
-                            "id": f"generic_{company_name}_{hash(href)}",
-                            "title": title,
-                            "company": company_name,
-                            "location": "Various",
-                            "source": f"{company_name}",
-                            "applyLink": full_url,
-                            "postedDate": self.now(),
-                        })
-                    return
-                    
-            except ImportError:
-                print(f"  ⚠ Playwright not installed")
-            except Exception as e:
-                print(f"  ⚠ Playwright failed: {e}")
-            
-            # Last resort - at least we tried
-            print(f"  ✓ Generic: 0 jobs")
-    
+        request = {"kind": "links", "url": url, "profile": "default", "routes": "listing", "cap_ms": 8000}
+        if self._defer_render(request, lambda links: resume(on_links(links))):
+            return None
+
+        def render(page):
+            pending = track_pending_requests(page)
+            page.goto(url, wait_until="domcontentloaded", timeout=30000)
+            wait_for_signal(page, 8000, pending=pending)
+            return [
+                (link.get_attribute("href") or "", link.inner_text().strip())
+                for link in page.query_selector_all("a[href]")
+            ]
+
+        # Get all links after JS renders
+        try:
+            links = self.browser.run(render, routes="listing")
+        except ImportError:
+            print(f"  ⚠ Playwright not installed")
+            return 0
         except Exception as e:
-            print(f"  ❌ Generic: {e}")
+            links = e
+        return on_links(links)
+
+    def _add_generic_rendered_links(self, company_name, url, links, skip_words):
+        """Filter (href, text) pairs from a rendered career page and add JobPosting-backed ones."""
+        valid_jobs_pw = []
+        seen_hrefs = set()
+
+        for href, title in links:
+            if not href or href in seen_hrefs or len(title) < 3:
+                continue
+
+            # Must have job indicator (avoid generic careers pages)
+            if not self._is_probable_job_url(href):
+                continue
+
+            # Skip navigation
+            if any(w in title.lower() for w in skip_words):
+                continue
+
+            seen_hrefs.add(href)
+            valid_jobs_pw.append((href, title))
+
+        print(f"  ✓ Generic (Playwright): {len(valid_jobs_pw)} urls (validating JobPosting...)")
+
+        full_urls = [href if href.startswith("http") else url.rstrip("/") + href for href, _ in valid_jobs_pw]
+        verdicts = self.jobposting.check_many(full_urls, wrap=self._in_company_context)
+
+        found = 0
+        for (href, title), full_url, has_posting in zip(valid_jobs_pw, full_urls, verdicts):
+            if not has_posting:
+                continue
+            found += 1
+
+            self.add({
+                "id": stable_job_id(f"generic_{company_name}", full_url),
+                "title": title,
+                "company": company_name,
+                "location": "Various",
+                "source": f"{company_name}",
+                "applyLink": full_url,
+                "postedDate": self.now(),
+            })
+        return found
 
     def fetch_requirements(self, job):
         """Fetch and extract requirements for a job"""
@@ -2807,10 +3346,15 @@ class JobScraper:
             if not link:
                 return self.req_extractor._empty_requirements()
             
+            # SmartRecruiters / Workable: the detail API instead of the HTML page
+            detail_api = job.get("_detail_api")
+            if detail_api:
+                text = self._fetch_detail_description(detail_api)
+                if text:
+                    return self.req_extractor.extract_from_text(text)
+
             print(f"    Fetching requirements for: {job['title'][:50]}...")
-            requirements = self.req_extractor.extract_from_url(link)
-            time.sleep(0.3)  # Be nice to servers
-            return requirements
+            return self.req_extractor.extract_from_url(link)
         except Exception as e:
             print(f"    ⚠ Error: {e}")
             return self.req_extractor._empty_requirements()
@@ -2818,8 +3362,8 @@ class JobScraper:
     def debug_page(self, url):
         """Debug helper to see what's on a page"""
         try:
-            r = requests.get(url, headers=HEADERS, timeout=10)
-            soup = BeautifulSoup(r.text, "html.parser")
+            r = self.http.get(url, headers=HEADERS, timeout=10)
+            soup = parse_html(r.text)
             
             print(f"\n=== DEBUG: {url} ===")
             print(f"Status: {r.status_code}")
@@ -2865,6 +3409,7 @@ class JobScraper:
         if EXTRACT_REQUIREMENTS:
             print(f"\n[REQUIREMENTS SUMMARY]")
             print(f"  ✓ Reused existing: {self.requirements_reused}")
+            print(f"  📄 From ATS descriptions: {self.requirements_harvested}")
             print(f"  🔍 Fetched new: {self.requirements_fetched}")
             if REQUIREMENTS_REUSE_ONLY:
                 print(f"  ⏭ Skipped new: {self.requirements_skipped}")
@@ -2898,9 +3443,23 @@ class JobScraper:
             )
         print(f"\n✓ Saved → data/jobs.json ({len(self.jobs)} jobs)")
         self._save_source_health()
+        self.http_cache.save()
+        self.ats_cache.save()
+        self.workday_recipes.save()
+        self.darwinbox_recipes.save()
+        self.generic_strategies.save()
+        self.sitemaps.save()
+        self.jobposting.save()
+
+    def close(self):
+        self.browser.close()
+        self.http.close()
 
 
 if __name__ == "__main__":
     scraper = JobScraper()
-    scraper.run()
-    scraper.save()
+    try:
+        scraper.run()
+        scraper.save()
+    finally:
+        scraper.close()
@@ -0,0 +1,164 @@
+# sitemap_reader.py
+# ----------------------------------
+# Streaming sitemap crawler (indexes, .xml.gz, lastmod replay)
+# ----------------------------------
+
+import os
+import re
+import zlib
+import xml.etree.ElementTree as ET
+from collections import deque
+from datetime import datetime, timedelta
+from urllib.parse import urlparse
+from config import HEADERS
+from state_store import JsonStateStore
+
+SITEMAP_CACHE_FILE = os.getenv("SITEMAP_CACHE_FILE", "data/sitemap_cache.json")
+SITEMAP_MAX_FILES = int(os.getenv("SITEMAP_MAX_FILES", "25"))  # per site, across index recursion
+SITEMAP_CACHE_MAX_AGE_DAYS = int(os.getenv("SITEMAP_CACHE_MAX_AGE_DAYS", "30"))
+SITEMAP_CHUNK_BYTES = 16 * 1024
+
+# Child sitemaps worth reading first (sitemap-jobs.xml, careers-sitemap.xml.gz, ...)
+JOBBY_SITEMAP_RE = re.compile(r"job|career|position|opening|vacanc|posting|requisition", re.I)
+
+
+def _local(tag: str) -> str:
+    return tag.rsplit("}", 1)[-1]
+
+
+class SitemapReader:
+    """Finds job URLs in a site's sitemaps without loading whole files.
+
+    Each sitemap is parsed incrementally (ElementTree.XMLPullParser) straight
+    off the streamed response, gzip included, and the download is dropped
+    as soon as `limit` job URLs are collected. Sitemap indexes are followed
+    breadth-first with job-looking children first. A child whose <lastmod>
+    matches the previous run replays the job URLs recorded then instead of
+    being downloaded again.
+    """
+
+    def __init__(self, http, path=SITEMAP_CACHE_FILE, max_files=SITEMAP_MAX_FILES):
+        self.http = http
+        self.store = JsonStateStore(path)
+        self.max_files = max_files
+
+    def job_urls(self, base_url: str, is_job_url, limit: int = 50):
+        parsed = urlparse(base_url)
+        if not parsed.scheme or not parsed.netloc:
+            return []
+
+        root = f"{parsed.scheme}://{parsed.netloc}"
+        queue = deque([(f"{root}/sitemap.xml", None), (f"{root}/sitemap_index.xml", None)])
+        visited = set()
+        found = []
+        seen = set()
+        files = 0
+
+        def collect(href):
+            if href not in seen and is_job_url(href):
+                seen.add(href)
+                found.append(href)
+            return len(found) >= limit
+
+        while queue and files < self.max_files:
+            sitemap_url, lastmod = queue.popleft()
+            if sitemap_url in visited:
+                continue
+            visited.add(sitemap_url)
+
+            cached = self._replay(sitemap_url, lastmod)
+            if cached is not None:
+                for href in cached:
+                    if collect(href):
+                        return found
+                continue
+
+            files += 1
+            children = []
+            job_hrefs = []
+            try:
+                complete = self._stream(sitemap_url, children, job_hrefs, is_job_url, collect)
+            except Exception:
+                continue
+            if complete and lastmod:
+                self._remember(sitemap_url, lastmod, job_hrefs)
+            if len(found) >= limit:
+                return found
+
+            children.sort(key=lambda child: not JOBBY_SITEMAP_RE.search(child[0]))
+            queue.extend(children)
+
+        return found
+
+    def _stream(self, sitemap_url, children, job_hrefs, is_job_url, collect):
+        """Parse one sitemap; returns True if it was read to the end."""
+        r = self.http.get(sitemap_url, headers=HEADERS, timeout=10, stream=True)
+        try:
+            if r.status_code != 200:
+                return False
+            parser = ET.XMLPullParser(events=("end",))
+            gunzip = None
+            # iter_content already undoes Content-Encoding; a .xml.gz file
+            # served as-is still starts with the gzip magic bytes.
+            for i, chunk in enumerate(r.iter_content(chunk_size=SITEMAP_CHUNK_BYTES)):
+                if i == 0 and chunk[:2] == b"\x1f\x8b":
+                    gunzip = zlib.decompressobj(16 + zlib.MAX_WBITS)
+                parser.feed(gunzip.decompress(chunk) if gunzip else chunk)
+                for _, elem in parser.read_events():
+                    if self._handle(elem, children, job_hrefs, is_job_url, collect):
+                        return False
+            parser.close()
+            for _, elem in parser.read_events():
+                if self._handle(elem, children, job_hrefs, is_job_url, collect):
+                    return False
+            return True
+        finally:
+            r.close()
+
+    def _handle(self, elem, children, job_hrefs, is_job_url, collect):
+        """Process one parsed element; True once the caller has enough URLs."""
+        tag = _local(elem.tag)
+        if tag not in ("url", "sitemap"):
+            return False
+        loc, lastmod = None, None
+        for child in elem:
+            name = _local(child.tag)
+            if name == "loc":
+                loc = (child.text or "").strip()
+            elif name == "lastmod":
+                lastmod = (child.text or "").strip() or None
+        elem.clear()
+        if not loc:
+            return False
+        if tag == "sitemap":
+            children.append((loc, lastmod))
+            return False
+        if is_job_url(loc):
+            job_hrefs.append(loc)
+        return collect(loc)
+
+    def _replay(self, sitemap_url, lastmod):
+        if not lastmod:
+            return None
+        entry = self.store.get(sitemap_url)
+        if not entry or entry.get("lastmod") != lastmod:
+            return None
+        today = datetime.utcnow().date().isoformat()
+        if entry.get("used_on") != today:
+            self.store.set(sitemap_url, {**entry, "used_on": today})
+        return entry.get("urls", [])
+
+    def _remember(self, sitemap_url, lastmod, job_hrefs):
+        entry = self.store.get(sitemap_url) or {}
+        if entry.get("lastmod") == lastmod and entry.get("urls") == job_hrefs:
+            return
+        self.store.set(sitemap_url, {
+            "lastmod": lastmod,
+            "urls": job_hrefs,
+            "used_on": datetime.utcnow().date().isoformat(),
+        })
+
+    def save(self):
+        cutoff = (datetime.utcnow() - timedelta(days=SITEMAP_CACHE_MAX_AGE_DAYS)).date().isoformat()
+        self.store.prune(lambda _url, entry: (entry.get("used_on") or "") >= cutoff)
+        self.store.save()
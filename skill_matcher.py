@@ -0,0 +1,168 @@
+# skill_matcher.py
+# ----------------------------------
+# One-pass skill / education / experience-anchor matching (Aho-Corasick)
+# ----------------------------------
+
+import json
+import os
+from collections import deque
+
+SKILL_TAXONOMY_FILE = os.getenv("SKILL_TAXONOMY_FILE", "data/skill_taxonomy.json")
+
+# re.IGNORECASE treats these as the ASCII letter; the extractors only
+# lower() the text, so fold them too to keep results identical.
+_IGNORECASE_FOLD = str.maketrans({"ı": "i", "ſ": "s"})
+
+
+def _is_word(ch: str) -> bool:
+    """Same notion of a word character as re's \\w on str patterns."""
+    return ch.isalnum() or ch == "_"
+
+
+def expand_term(pattern: str):
+    """Literal strings matched by a TECH_SKILLS-style pattern.
+
+    Supports the regex subset those lists use: escaped characters
+    (c\\+\\+) and single-character optionals (node\\.?js). Anything
+    else is rejected rather than matched differently.
+    """
+    variants = [""]
+    i = 0
+    while i < len(pattern):
+        ch = pattern[i]
+        if ch == "\\":
+            if i + 1 >= len(pattern):
+                raise ValueError(f"unsupported pattern: {pattern!r}")
+            ch = pattern[i + 1]
+            i += 2
+        elif ch in ".^$*+?{}[]()|":
+            raise ValueError(f"unsupported pattern: {pattern!r}")
+        else:
+            i += 1
+        if i < len(pattern) and pattern[i] == "?":
+            variants = [v + ch for v in variants] + variants
+            i += 1
+        else:
+            variants = [v + ch for v in variants]
+    return [v for v in dict.fromkeys(variants) if v]
+
+
+class AhoCorasick:
+    """Multi-literal matcher: one linear pass over the text for any number of terms.
+
+    add(literal, label, bounded) registers a term; with bounded=True a hit
+    only counts where re's r'\\b' + literal + r'\\b' would match. labels(text)
+    returns every label with at least one accepted hit.
+    """
+
+    def __init__(self):
+        self.goto = [{}]
+        self.fail = [0]
+        self.out = [[]]   # (length, label, bounded) ending at each state
+        self._built = False
+
+    def add(self, literal: str, label, bounded: bool = True):
+        state = 0
+        for ch in literal:
+            nxt = self.goto[state].get(ch)
+            if nxt is None:
+                nxt = len(self.goto)
+                self.goto[state][ch] = nxt
+                self.goto.append({})
+                self.fail.append(0)
+                self.out.append([])
+            state = nxt
+        self.out[state].append((len(literal), label, bounded))
+        self._built = False
+
+    def build(self):
+        queue = deque(self.goto[0].values())
+        for state in queue:
+            self.fail[state] = 0
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in self.goto[state].items():
+                queue.append(nxt)
+                f = self.fail[state]
+                while f and ch not in self.goto[f]:
+                    f = self.fail[f]
+                self.fail[nxt] = self.goto[f].get(ch, 0)
+                self.out[nxt] = self.out[nxt] + self.out[self.fail[nxt]]
+        self._built = True
+
+    def labels(self, text: str) -> set:
+        if not self._built:
+            self.build()
+        goto, fail, out = self.goto, self.fail, self.out
+        found = set()
+        state = 0
+        size = len(text)
+        for end, ch in enumerate(text, 1):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            if not out[state]:
+                continue
+            for length, label, bounded in out[state]:
+                if label in found:
+                    continue
+                if bounded:
+                    start = end - length
+                    before = start > 0 and _is_word(text[start - 1])
+                    after = end < size and _is_word(text[end])
+                    if before == _is_word(text[start]) or after == _is_word(text[end - 1]):
+                        continue
+                found.add(label)
+        return found
+
+
+def load_taxonomy(path: str = SKILL_TAXONOMY_FILE) -> dict:
+    """{category: [literal term, ...]} from an optional JSON file; {} if absent."""
+    try:
+        if not path or not os.path.exists(path):
+            return {}
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        if not isinstance(data, dict):
+            return {}
+        return {str(k): [str(t) for t in v if t] for k, v in data.items() if isinstance(v, list)}
+    except Exception as e:
+        print(f"  ⚠ Could not load skill taxonomy {path}: {e}")
+        return {}
+
+
+class RequirementsMatcher:
+    """Skills, education level and experience anchors from one scan of the text.
+
+    tech_skills and education_levels use the extractors' pattern lists;
+    anchors are plain substrings (no word boundaries) whose presence gates
+    the experience regexes. Taxonomy terms are literals matched like skills.
+    """
+
+    def __init__(self, tech_skills: dict, education_levels: dict, anchors=(), taxonomy=None):
+        self.education_order = list(education_levels)
+        self.automaton = AhoCorasick()
+        for skills in tech_skills.values():
+            for skill in skills:
+                label = ("skill", skill.replace("\\", ""))
+                for literal in expand_term(skill):
+                    self.automaton.add(literal, label, bounded=True)
+        for terms in (taxonomy if taxonomy is not None else load_taxonomy()).values():
+            for term in terms:
+                self.automaton.add(term.lower(), ("skill", term.lower()), bounded=True)
+        for level, patterns in education_levels.items():
+            for pattern in patterns:
+                for literal in expand_term(pattern):
+                    self.automaton.add(literal, ("education", level), bounded=False)
+        for anchor in anchors:
+            self.automaton.add(anchor, ("anchor", anchor), bounded=False)
+        self.automaton.build()
+
+    def scan(self, text_lower: str) -> dict:
+        """{'skills': set, 'education': str, 'anchors': set} for already lower-cased text."""
+        hits = self.automaton.labels(text_lower.translate(_IGNORECASE_FOLD))
+        skills = {value for kind, value in hits if kind == "skill"}
+        levels = {value for kind, value in hits if kind == "education"}
+        education = next((level for level in self.education_order if level in levels), "not_specified")
+        anchors = {value for kind, value in hits if kind == "anchor"}
+        return {"skills": skills, "education": education, "anchors": anchors}
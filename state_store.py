@@ -0,0 +1,82 @@
+# state_store.py
+# ----------------------------------
+# Cross-run state persisted as JSON under data/
+# ----------------------------------
+
+import json
+import os
+import threading
+
+
+class JsonStateStore:
+    """A dict kept in one JSON file (same idea as data/source_health.json).
+
+    The cron workflow commits data/, so anything stored here survives
+    between runs. Reads and writes are lock-protected for worker threads;
+    save() only touches disk when something changed.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.RLock()
+        self._dirty = False
+        self.data = self._load()
+
+    def _load(self):
+        try:
+            if not os.path.exists(self.path):
+                return {}
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            return data if isinstance(data, dict) else {}
+        except Exception:
+            return {}
+
+    def get(self, key, default=None):
+        with self._lock:
+            return self.data.get(key, default)
+
+    def set(self, key, value):
+        with self._lock:
+            self.data[key] = value
+            self._dirty = True
+
+    def pop(self, key, default=None):
+        with self._lock:
+            if key not in self.data:
+                return default
+            self._dirty = True
+            return self.data.pop(key)
+
+    def prune(self, keep):
+        """Drop every entry for which keep(key, value) is false."""
+        with self._lock:
+            stale = [k for k, v in self.data.items() if not keep(k, v)]
+            for k in stale:
+                del self.data[k]
+            if stale:
+                self._dirty = True
+
+    def __contains__(self, key):
+        with self._lock:
+            return key in self.data
+
+    def __len__(self):
+        with self._lock:
+            return len(self.data)
+
+    def save(self):
+        with self._lock:
+            if not self._dirty:
+                return
+            try:
+                parent = os.path.dirname(self.path)
+                if parent:
+                    os.makedirs(parent, exist_ok=True)
+                tmp_path = f"{self.path}.tmp"
+                with open(tmp_path, "w", encoding="utf-8") as f:
+                    json.dump(self.data, f, indent=2, ensure_ascii=False)
+                os.replace(tmp_path, self.path)
+                self._dirty = False
+            except Exception as e:
+                print(f"  ⚠ Could not save {self.path}: {e}")